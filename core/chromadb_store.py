@@ -297,6 +297,88 @@ def query_memo_chunks(
         raise
 
 
+def query_memo_chunks_batch(
+    collection: chromadb.Collection,
+    memo_id: str,
+    query_embeddings: List[List[float]],
+    top_k: int = 10,
+    section: Optional[str] = None,
+    version: Optional[int] = None
+) -> List[List[Dict[str, Any]]]:
+    """
+    Busca chunks similares para várias queries em uma única chamada ao ChromaDB.
+    
+    Mesmo filtro e formato de query_memo_chunks, mas com uma lista de
+    embeddings: um round-trip em vez de um por query.
+    
+    Args:
+        collection: Collection do ChromaDB
+        memo_id: ID do memorando (filtro)
+        query_embeddings: Lista de vetores de embedding (um por query)
+        top_k: Número de resultados por query
+        section: Filtro opcional por seção
+        version: Filtro opcional por versão
+        
+    Returns:
+        Lista (uma entrada por query, na mesma ordem) de listas de dicts
+        no formato de query_memo_chunks
+        
+    Raises:
+        Exception: Se houver erro na busca
+    """
+    logger.info(
+        f"🔍 Buscando {top_k} chunks para {len(query_embeddings)} queries no memo '{memo_id}' "
+        f"(section: {section}, version: {version})"
+    )
+    
+    if not query_embeddings:
+        return []
+    
+    try:
+        # Construir filtro
+        where_clause = {"memo_id": {"$eq": memo_id}}
+        
+        if section:
+            where_clause["section"] = {"$eq": section}
+        
+        if version is not None:
+            where_clause["version"] = {"$eq": version}
+        
+        # Query única no ChromaDB com todos os embeddings
+        results = collection.query(
+            query_embeddings=query_embeddings,
+            n_results=top_k,
+            where=where_clause,
+            include=["documents", "metadatas", "distances"]
+        )
+        
+        # Formatar resultados por query
+        all_results = []
+        
+        for q in range(len(query_embeddings)):
+            ids = results["ids"][q] if results["ids"] else []
+            all_results.append([
+                {
+                    "id": ids[i],
+                    "score": 1.0 - results["distances"][q][i],  # Converter distância para score (cosine similarity)
+                    "metadata": results["metadatas"][q][i],
+                    "document": results["documents"][q][i]
+                }
+                for i in range(len(ids))
+            ])
+        
+        logger.info(
+            f"✅ Encontrados {sum(len(r) for r in all_results)} chunks "
+            f"para {len(query_embeddings)} queries"
+        )
+        
+        return all_results
+        
+    except Exception as e:
+        logger.error(f"❌ Erro ao buscar chunks no ChromaDB: {e}")
+        raise
+
+
 def reset_memo(collection: chromadb.Collection, memo_id: str) -> None:
     """
     Apaga TODOS os chunks de um memorando específico.
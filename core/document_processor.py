@@ -2,7 +2,7 @@ import os
 import asyncio
 import time
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 import numpy as np
 from dotenv import load_dotenv
@@ -20,6 +20,10 @@ load_dotenv()
 logger = get_logger(__name__)
 
 class DocumentProcessor:
+    # Cache de embeddings de queries estáticas (ex: queries fixas por seção),
+    # compartilhado entre instâncias: {(modelo de embedding, query): embedding}
+    _query_embedding_cache: Dict[Tuple[str, str], List[float]] = {}
+    
     def __init__(self):
         # LangChain LLM e Embeddings
         self.llm = ChatOpenAI(
@@ -566,7 +570,8 @@ class DocumentProcessor:
         memo_id: str,
         query: str,
         top_k: int = 10,
-        section: Optional[str] = None
+        section: Optional[str] = None,
+        cache_embedding: bool = False
     ) -> List[Dict]:
         """
         Busca chunks relevantes no ChromaDB.
@@ -576,6 +581,8 @@ class DocumentProcessor:
             query: Texto da busca
             top_k: Número de chunks a retornar
             section: Filtro opcional por seção
+            cache_embedding: Reutiliza o embedding já calculado para a mesma
+                query (usar apenas com queries estáticas)
             
         Returns:
             Lista de chunks com score e metadata
@@ -583,7 +590,10 @@ class DocumentProcessor:
         from core.chromadb_store import get_or_create_collection, query_memo_chunks
         
         # Gerar embedding da query
-        query_embedding = self.embeddings.embed_query(query)
+        if cache_embedding:
+            query_embedding = self.embed_queries_cached([query])[0]
+        else:
+            query_embedding = self.embeddings.embed_query(query)
         
         # Buscar no ChromaDB
         collection = get_or_create_collection()
@@ -607,6 +617,89 @@ class DocumentProcessor:
         
         return formatted_results
     
+    def embed_queries_cached(self, queries: List[str]) -> List[List[float]]:
+        """
+        Gera embeddings de queries reutilizando os já calculados no processo.
+        
+        Apenas queries ainda não vistas (para o modelo de embedding atual) são
+        enviadas à API, em uma única chamada.
+        
+        Args:
+            queries: Textos de busca
+            
+        Returns:
+            Lista de embeddings, na mesma ordem das queries
+        """
+        cache = self._query_embedding_cache
+        model = self.embeddings.model
+        
+        missing = [q for q in dict.fromkeys(queries) if (model, q) not in cache]
+        if missing:
+            for query, embedding in zip(missing, self.embeddings.embed_documents(missing)):
+                cache[(model, query)] = embedding
+        
+        return [cache[(model, q)] for q in queries]
+    
+    def search_chromadb_chunks_batch(
+        self,
+        memo_id: str,
+        queries: List[str],
+        top_k: int = 10,
+        section: Optional[str] = None,
+        cache_embeddings: bool = False
+    ) -> List[List[Dict]]:
+        """
+        Busca chunks relevantes no ChromaDB para várias queries de uma vez.
+        
+        Os embeddings de todas as queries são gerados em uma única chamada
+        e a busca no ChromaDB é feita em um único round-trip.
+        
+        Args:
+            memo_id: ID do memorando
+            queries: Textos de busca
+            top_k: Número de chunks a retornar por query
+            section: Filtro opcional por seção
+            cache_embeddings: Reutiliza embeddings já calculados para as mesmas
+                queries (usar apenas com queries estáticas)
+            
+        Returns:
+            Lista (uma entrada por query, na mesma ordem) de listas de chunks
+            no formato de search_chromadb_chunks
+        """
+        from core.chromadb_store import get_or_create_collection, query_memo_chunks_batch
+        
+        if not queries:
+            return []
+        
+        # Gerar embeddings de todas as queries em uma chamada
+        if cache_embeddings:
+            query_embeddings = self.embed_queries_cached(queries)
+        else:
+            query_embeddings = self.embeddings.embed_documents(queries)
+        
+        # Buscar no ChromaDB
+        collection = get_or_create_collection()
+        
+        batch_results = query_memo_chunks_batch(
+            collection=collection,
+            memo_id=memo_id,
+            query_embeddings=query_embeddings,
+            top_k=top_k,
+            section=section
+        )
+        
+        return [
+            [
+                {
+                    "chunk": r.get("document", ""),  # ChromaDB retorna "document"
+                    "score": r["score"],
+                    "metadata": r["metadata"]
+                }
+                for r in results
+            ]
+            for results in batch_results
+        ]
+    
     async def extract_facts_parallel(
         self, 
         parsed_docs: List[Dict], 
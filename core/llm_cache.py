@@ -0,0 +1,158 @@
+"""
+Cache de respostas do LLM em disco.
+
+Regerar uma seção sem mudar facts nem contexto (comum durante a edição do
+memo) produz exatamente as mesmas mensagens; com o cache ligado, a resposta
+anterior é reaproveitada sem chamar a API.
+
+A chave é um hash de (modelo, temperatura, mensagens). Segue o formato dos
+demais caches do app: um arquivo JSON por chave em .cache/.
+
+Desligado por padrão: habilite com a variável de ambiente LLM_RESPONSE_CACHE=true.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+LLM_CACHE_DIR = Path(".cache/llm_responses")
+
+
+def llm_cache_enabled() -> bool:
+    """Retorna True se o cache de respostas estiver habilitado (LLM_RESPONSE_CACHE=true)."""
+    return os.getenv("LLM_RESPONSE_CACHE", "false").lower() == "true"
+
+
+def llm_cache_key(model: str, temperature: float, messages: List[Any]) -> str:
+    """
+    Calcula a chave de cache de uma chamada ao LLM.
+
+    Cada campo é prefixado pelo seu tamanho, então conteúdos diferentes nunca
+    produzem a mesma sequência de bytes.
+
+    Args:
+        model: Modelo do LLM
+        temperature: Temperatura do LLM
+        messages: Mensagens LangChain (SystemMessage, HumanMessage, ...)
+
+    Returns:
+        Hash blake2b (128 bits) em hexadecimal
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for field in (model, f"{temperature}", *(f"{m.type}:{m.content}" for m in messages)):
+        data = field.encode("utf-8")
+        h.update(len(data).to_bytes(8, "little"))
+        h.update(data)
+    return h.hexdigest()
+
+
+def _load_cached_response(cache_key: str) -> Optional[str]:
+    """Carrega a resposta em cache para a chave, se existir."""
+    cache_path = LLM_CACHE_DIR / f"{cache_key}.json"
+    if not cache_path.exists():
+        return None
+
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            content = json.load(f)["content"]
+        logger.info("Cache de LLM: resposta reaproveitada (%s...)", cache_key[:8])
+        return content
+    except (json.JSONDecodeError, KeyError, OSError) as e:
+        logger.warning("Erro ao carregar cache de LLM %s...: %s", cache_key[:8], e)
+        cache_path.unlink(missing_ok=True)  # Remover cache corrompido
+        return None
+
+
+def _save_cached_response(cache_key: str, model: str, content: str) -> None:
+    """Salva a resposta no cache."""
+    try:
+        LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(LLM_CACHE_DIR / f"{cache_key}.json", 'w', encoding='utf-8') as f:
+            json.dump({
+                'content': content,
+                'model': model,
+                'cached_at': datetime.now().isoformat(),
+            }, f, ensure_ascii=False)
+    except Exception as e:
+        logger.warning("Erro ao salvar cache de LLM %s...: %s", cache_key[:8], e)
+
+
+def _llm_params(llm: Any, model: Optional[str], temperature: Optional[float]) -> Tuple[str, float]:
+    """
+    Modelo e temperatura que compõem a chave: os informados ou, se omitidos,
+    os do próprio cliente (ChatOpenAI expõe model_name; ChatAnthropic, model).
+    """
+    if model is None:
+        model = getattr(llm, "model_name", None) or getattr(llm, "model", None) or ""
+    if temperature is None:
+        temperature = getattr(llm, "temperature", None)
+    return model, temperature
+
+
+def invoke_cached(
+    llm: Any,
+    messages: List[Any],
+    model: Optional[str] = None,
+    temperature: Optional[float] = None,
+) -> str:
+    """
+    Chama llm.invoke(messages) reaproveitando a resposta em cache, se houver.
+
+    Com o cache desligado, equivale a llm.invoke(messages).content.
+
+    Args:
+        llm: Cliente LangChain (ChatOpenAI, ChatAnthropic, ...)
+        messages: Mensagens a enviar
+        model: Modelo do LLM (parte da chave; padrão: o do cliente)
+        temperature: Temperatura do LLM (parte da chave; padrão: a do cliente)
+
+    Returns:
+        Conteúdo da resposta
+    """
+    if not llm_cache_enabled():
+        return llm.invoke(messages).content
+
+    model, temperature = _llm_params(llm, model, temperature)
+    cache_key = llm_cache_key(model, temperature, messages)
+    content = _load_cached_response(cache_key)
+    if content is None:
+        content = llm.invoke(messages).content
+        _save_cached_response(cache_key, model, content)
+    return content
+
+
+async def ainvoke_cached(
+    llm: Any,
+    messages: List[Any],
+    model: Optional[str] = None,
+    temperature: Optional[float] = None,
+) -> str:
+    """
+    Versão assíncrona de invoke_cached.
+
+    A resposta é recebida via llm.astream e concatenada: a tarefa pode ser
+    cancelada no meio da geração (ex: validação já reprovou a seção).
+
+    Returns:
+        Conteúdo da resposta
+    """
+    cache_key = None
+    if llm_cache_enabled():
+        model, temperature = _llm_params(llm, model, temperature)
+        cache_key = llm_cache_key(model, temperature, messages)
+    if cache_key:
+        content = _load_cached_response(cache_key)
+        if content is not None:
+            return content
+
+    content = "".join([chunk.content async for chunk in llm.astream(messages)])
+    if cache_key:
+        _save_cached_response(cache_key, model, content)
+    return content
@@ -11,11 +11,15 @@ Arquitetura de Agentes Especializados:
 """
 
 import asyncio
+import importlib
 from typing import Dict, List, Optional, Any
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
+from dotenv import load_dotenv
 import json
 
+load_dotenv()
+
 
 # Mapeamento de sections de facts para seções de memo
 SECTION_MAPPING = {
@@ -45,6 +49,39 @@ SECTION_MAPPING = {
     }
 }
 
+# Roteamento de generate_section para orchestrators com agentes especializados.
+# Chave: trecho de memo_type (em minúsculas), verificado na ordem do dict.
+# "sections" mapeia section_title → seção do FIXED_STRUCTURE do orchestrator.
+_SPECIALIZED_ROUTES = {
+    "search fund": {
+        "label": "Search Fund",
+        "module": "tipo_memorando.short_searchfund.orchestrator",
+        "generator": "shortmemo.searchfund",
+        "sections": {
+            "1. Introdução": "1. Introdução",
+            "2. Mercado": "2. Mercado",
+            "2. A Empresa": "3. Empresa",
+            "3. Empresa": "3. Empresa",
+            "4. Financials": "4. Financials",
+            "5. Transação": "5. Transação/Oportunidade",
+            "5. Transação/Oportunidade": "5. Transação/Oportunidade",
+            "6. Pontos a Aprofundar": "6. Pontos a Aprofundar",
+        },
+    },
+    "gestora": {
+        "label": "Gestora",
+        "module": "tipo_memorando.short_gestora.orchestrator",
+        "generator": "shortmemo.gestora",
+        "sections": {
+            "1. Introdução": "1. Introdução",
+            "2. Estratégia e Portfólio": "2. Estratégia e Portfólio",
+            "3. Track Record": "3. Track Record",
+            "4. Oportunidade": "4. Oportunidade",
+            "5. Riscos e Considerações": "5. Riscos e Considerações",
+        },
+    },
+}
+
 
 def build_pe_system_prompt(section_title: str) -> str:
     """
@@ -168,91 +205,39 @@ async def generate_section_async(
     Returns:
         Dict com paragraphs gerados e metadata
     """
-    from dotenv import load_dotenv
-    load_dotenv()
-    
     # ========== ROTEAMENTO CONDICIONAL ==========
-    # Se for Search Fund → usar orchestrator com agentes especializados
-    if "Search Fund" in memo_type or "search fund" in memo_type.lower():
-        try:
-            from tipo_memorando.short_searchfund.orchestrator import FIXED_STRUCTURE
-            
-            # Mapear section_title para agente
-            section_agent_map = {
-                "1. Introdução": "1. Introdução",
-                "2. Mercado": "2. Mercado",
-                "2. A Empresa": "3. Empresa",
-                "3. Empresa": "3. Empresa",
-                "4. Financials": "4. Financials",
-                "5. Transação": "5. Transação/Oportunidade",
-                "5. Transação/Oportunidade": "5. Transação/Oportunidade",
-                "6. Pontos a Aprofundar": "6. Pontos a Aprofundar",
-            }
-            
-            orchestrator_section = section_agent_map.get(section_title)
-            
-            if orchestrator_section and orchestrator_section in FIXED_STRUCTURE:
-                agent = FIXED_STRUCTURE[orchestrator_section]
-                
-                print(f"   📝 [Search Fund] Gerando '{section_title}' com {agent.__class__.__name__}...")
-                
-                generated_text = agent.generate(
-                    facts=facts,
-                    rag_context=rag_context
-                )
-                
-                # Dividir em parágrafos
-                paragraphs = [p.strip() for p in generated_text.split('\n\n') if p.strip()]
-                
-                print(f"   ✅ '{section_title}': {len(paragraphs)} parágrafo(s) | Agent: {agent.__class__.__name__}")
-                
-                return {
-                    "paragraphs": paragraphs,
-                    "metadata": {
-                        "section": section_title,
-                        "generator": f"shortmemo.searchfund.{agent.__class__.__name__}",
-                        "model": "gpt-4o",
-                        "temperature": temperature,
-                        "has_rag": rag_context is not None
-                    }
-                }
-            else:
-                print(f"   ⚠️  Seção '{section_title}' não mapeada para Search Fund orchestrator")
-                # Fallback para prompts genéricos
-        
-        except ImportError as e:
-            print(f"   ⚠️  Erro ao importar orchestrator Search Fund: {e}")
-            print(f"   ⤷  Usando prompts genéricos como fallback")
-            # Fallback para prompts genéricos
-        except Exception as e:
-            print(f"   ⚠️  Erro no orchestrator Search Fund: {e}")
-            print(f"   ⤷  Usando prompts genéricos como fallback")
-    
-    # Se for Gestora → usar orchestrator com agentes especializados
-    elif "Gestora" in memo_type or "gestora" in memo_type.lower():
+    # Search Fund / Gestora → orchestrator com agentes especializados
+    memo_type_lower = memo_type.lower()
+    route = next(
+        (route for keyword, route in _SPECIALIZED_ROUTES.items() if keyword in memo_type_lower),
+        None
+    )
+    if route:
+        label = route["label"]
         try:
-            from tipo_memorando.short_gestora.orchestrator import FIXED_STRUCTURE
+            # Import sob demanda: só o orchestrator do tipo usado é carregado
+            fixed_structure = importlib.import_module(route["module"]).FIXED_STRUCTURE
             
-            # Mapear section_title para agente
-            section_agent_map = {
-                "1. Introdução": "1. Introdução",
-                "2. Estratégia e Portfólio": "2. Estratégia e Portfólio",
-                "3. Track Record": "3. Track Record",
-                "4. Oportunidade": "4. Oportunidade",
-                "5. Riscos e Considerações": "5. Riscos e Considerações",
-            }
+            orchestrator_section = route["sections"].get(section_title)
             
-            orchestrator_section = section_agent_map.get(section_title)
-            
-            if orchestrator_section and orchestrator_section in FIXED_STRUCTURE:
-                agent = FIXED_STRUCTURE[orchestrator_section]
+            if orchestrator_section and orchestrator_section in fixed_structure:
+                agent = fixed_structure[orchestrator_section]
                 
-                print(f"   📝 [Gestora] Gerando '{section_title}' com {agent.__class__.__name__}...")
+                print(f"   📝 [{label}] Gerando '{section_title}' com {agent.__class__.__name__}...")
                 
-                generated_text = agent.generate(
-                    facts=facts,
-                    rag_context=rag_context
-                )
+                # Agentes com agenerate (Short Memo Gestora: intro, mercado, empresa,
+                # financials, transação, pontos a aprofundar) são aguardados
+                # diretamente; todos aceitam agenerate(facts=..., rag_context=...).
+                # Os síncronos rodam em thread para não bloquear o event loop
+                # (generate_all_sections_async gera as seções em paralelo)
+                if hasattr(agent, "agenerate"):
+                    generated_text = await agent.agenerate(facts=facts, rag_context=rag_context)
+                else:
+                    generated_text = await asyncio.to_thread(
+                        agent.generate,
+                        facts=facts,
+                        rag_context=rag_context
+                    )
                 
                 # Dividir em parágrafos
                 paragraphs = [p.strip() for p in generated_text.split('\n\n') if p.strip()]
@@ -263,22 +248,22 @@ async def generate_section_async(
                     "paragraphs": paragraphs,
                     "metadata": {
                         "section": section_title,
-                        "generator": f"shortmemo.gestora.{agent.__class__.__name__}",
+                        "generator": f"{route['generator']}.{agent.__class__.__name__}",
                         "model": "gpt-4o",
                         "temperature": temperature,
                         "has_rag": rag_context is not None
                     }
                 }
             else:
-                print(f"   ⚠️  Seção '{section_title}' não mapeada para Gestora orchestrator")
+                print(f"   ⚠️  Seção '{section_title}' não mapeada para {label} orchestrator")
                 # Fallback para prompts genéricos
         
         except ImportError as e:
-            print(f"   ⚠️  Erro ao importar orchestrator Gestora: {e}")
+            print(f"   ⚠️  Erro ao importar orchestrator {label}: {e}")
             print(f"   ⤷  Usando prompts genéricos como fallback")
             # Fallback para prompts genéricos
         except Exception as e:
-            print(f"   ⚠️  Erro no orchestrator Gestora: {e}")
+            print(f"   ⚠️  Erro no orchestrator {label}: {e}")
             print(f"   ⤷  Usando prompts genéricos como fallback")
     
     # ========== PROMPTS GENÉRICOS (outros tipos de memo) ==========
@@ -397,9 +382,6 @@ async def regenerate_paragraph_async(
     Returns:
         Novo parágrafo regenerado
     """
-    from dotenv import load_dotenv
-    load_dotenv()
-    
     llm = ChatOpenAI(model="gpt-4o", temperature=temperature)
     
     # Montar contexto com parágrafos vizinhos
@@ -12,6 +12,7 @@ from facts.utils import (
     get_name_safe,
     get_numeric_safe,
     get_text_safe,
+    get_section_values_safe,
     get_fact_value,
 )
 
@@ -31,6 +32,7 @@ __all__ = [
     'get_name_safe',
     'get_numeric_safe',
     'get_text_safe',
+    'get_section_values_safe',
     'get_fact_value',
     # Builders
     'build_facts_section',
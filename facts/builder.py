@@ -8,6 +8,24 @@ Consolida funcionalidades duplicadas dos builders específicos de cada tipo de m
 from typing import Dict, Any, Optional, Union
 
 
+# Títulos padrão para seções comuns (montado uma única vez no import)
+_DEFAULT_SECTION_TITLES: Dict[str, str] = {
+    "identification": "IDENTIFICAÇÃO",
+    "transaction_structure": "TRANSAÇÃO",
+    "financials_history": "FINANCIALS HISTÓRICO",
+    "projections": "PROJEÇÕES (SAÍDA)",
+    "saida": "SAÍDA",
+    "returns": "RETORNOS",
+    "qualitative": "ASPECTOS QUALITATIVOS",
+    "opinioes": "OPINIÕES",
+    "gestora": "GESTORA",
+    "fundo": "FUNDO",
+    "estrategia": "ESTRATÉGIA",
+    "estrategia_fundo": "ESTRATÉGIA",
+    "spectra_context": "CONTEXTO SPECTRA",
+}
+
+
 def build_facts_section(
     facts: Dict[str, Any],
     section_name: str,
@@ -104,29 +122,8 @@ def format_facts_for_prompt(
         >>> format_facts_for_prompt(facts, configs)
         'IDENTIFICAÇÃO:\\n- Empresa: TSE\\n\\nTRANSAÇÃO:\\n- EV (R$ MM): 138'
     """
-    # Títulos padrão para seções comuns
-    default_titles = {
-        "identification": "IDENTIFICAÇÃO",
-        "transaction_structure": "TRANSAÇÃO",
-        "financials_history": "FINANCIALS HISTÓRICO",
-        "projections": "PROJEÇÕES (SAÍDA)",
-        "saida": "SAÍDA",
-        "returns": "RETORNOS",
-        "qualitative": "ASPECTOS QUALITATIVOS",
-        "opinioes": "OPINIÕES",
-        "gestora": "GESTORA",
-        "fundo": "FUNDO",
-        "estrategia": "ESTRATÉGIA",
-        "estrategia_fundo": "ESTRATÉGIA",
-        "spectra_context": "CONTEXTO SPECTRA",
-    }
-    
-    # Usar títulos fornecidos ou padrão
-    if section_titles is None:
-        section_titles = {}
-    
-    # Combinar títulos padrão com customizados
-    titles = {**default_titles, **section_titles}
+    # Combinar títulos padrão com customizados (só copia se houver customização)
+    titles = {**_DEFAULT_SECTION_TITLES, **section_titles} if section_titles else _DEFAULT_SECTION_TITLES
     
     sections = []
     for section_name, field_labels in section_configs.items():
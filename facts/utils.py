@@ -7,7 +7,7 @@ Fornece funções helper para acessar e manipular facts com tratamento adequado:
 - Detecção automática de tipos
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 
 
 def get_fact_safe(
@@ -264,6 +264,38 @@ def get_text_safe(facts: Dict[str, Any], section: str, field: str) -> Optional[s
     return get_fact_safe(facts, section, field, fact_type="text")
 
 
+def get_section_values_safe(
+    facts: Dict[str, Any],
+    section: str,
+    fields: Iterable[str]
+) -> Dict[str, Optional[Any]]:
+    """
+    Obtém vários campos numéricos/texto de uma seção de uma só vez.
+    
+    Equivale a chamar get_numeric_safe/get_text_safe para cada campo (vazio ou
+    ausente → None), mas a seção é buscada em facts uma única vez.
+    
+    Args:
+        facts: Dict de facts
+        section: Seção
+        fields: Campos a obter
+    
+    Returns:
+        Dict {campo: valor ou None}
+    
+    Examples:
+        >>> facts = {"projections": {"exit_year": 2030, "growth_drivers": ""}}
+        >>> get_section_values_safe(facts, "projections", ["exit_year", "growth_drivers"])
+        {'exit_year': 2030, 'growth_drivers': None}
+    """
+    section_data = facts.get(section, {})
+    values = {}
+    for field in fields:
+        value = section_data.get(field)
+        values[field] = None if value is None or value == "" else value
+    return values
+
+
 def get_fact_value(
     facts: Dict[str, Any],
     section: str,
@@ -9,24 +9,12 @@ Todos os agentes que produzem texto devem usar get_llm_for_agents() para
 garantir provedor (OpenAI/Anthropic) e parâmetros consistentes.
 """
 
+import os
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Any
-
-# Imports condicionais para múltiplos providers (usados em get_llm_for_agents)
-try:
-    from langchain_openai import ChatOpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    ChatOpenAI = None
-
-try:
-    from langchain_anthropic import ChatAnthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
-    ChatAnthropic = None
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 try:
     from core.logger import get_logger
@@ -37,6 +25,11 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+# Seed fixa usada pelo Short Memo Gestora (passada explicitamente via `seed=`):
+# com temperature=0, mesmas mensagens tendem a produzir a mesma resposta
+# (melhor aproveitamento do cache de respostas). Os demais clientes não usam seed.
+OPENAI_SEED = 42
+
 
 class TipoModelo(str, Enum):
     """Provedor do modelo de IA."""
@@ -72,7 +65,8 @@ class ModeloConfig:
 class GerenciadorModelos:
     """Gerencia modelos de IA disponíveis para geração e edição de memorandos."""
 
-    MODELOS_DISPONIVEIS: Dict[str, ModeloConfig] = {
+    # Somente leitura: o registro é fixo após o import (get_model_display_name é memoizado)
+    MODELOS_DISPONIVEIS: Mapping[str, ModeloConfig] = MappingProxyType({
         # OpenAI - Modelos Premium 2026
         "gpt-5.2": ModeloConfig(
             id="gpt-5.2",
@@ -111,13 +105,14 @@ class GerenciadorModelos:
             descricao="Entrada $3 / Saída $15 por 1M tokens.",
             max_tokens=400000,
         ),
-    }
+    })
 
 
 # Compatibilidade retroativa: expor mesmo dicionário usado em "Gerar Memorando" e "Modelo de IA"
-AVAILABLE_MODELS: Dict[str, ModeloConfig] = GerenciadorModelos.MODELOS_DISPONIVEIS
+AVAILABLE_MODELS: Mapping[str, ModeloConfig] = GerenciadorModelos.MODELOS_DISPONIVEIS
 
 
+@lru_cache(maxsize=64)
 def get_model_display_name(model_id: str) -> str:
     """
     Retorna nome formatado para exibição no seletor.
@@ -139,23 +134,92 @@ def get_default_model() -> str:
     return "claude-opus-4.5"
 
 
-def get_llm_for_agents(model_id: str, temperature: float = 0.3) -> Any:
+def _import_chat_openai() -> Any:
     """
-    Retorna instância LangChain do LLM (ChatOpenAI ou ChatAnthropic) para uso
-    pelos agentes que produzem textos (orchestrators, RAG chat, etc.).
+    Importa ChatOpenAI sob demanda.
 
-    Usa ModeloConfig.provedor para escolher o provider; modelos não cadastrados
-    usam o modelo padrão com fallback para OpenAI.
+    Os SDKs dos providers só são carregados quando um LLM é de fato criado:
+    quem usa apenas AVAILABLE_MODELS / get_model_display_name (UI) não paga
+    o import de langchain-openai e langchain-anthropic.
 
-    Args:
-        model_id: ID do modelo (ex: gpt-5.2, claude-sonnet-4.5).
-        temperature: Criatividade (0-1).
+    Raises:
+        ImportError: Se langchain-openai não estiver instalado.
+    """
+    try:
+        from langchain_openai import ChatOpenAI
+    except ImportError:
+        raise ImportError("langchain-openai não está instalado. Execute: pip install langchain-openai") from None
+    return ChatOpenAI
 
-    Returns:
-        Instância de ChatOpenAI ou ChatAnthropic.
+
+# Variável de ambiente com a API key de cada provedor
+_API_KEY_ENV = {
+    TipoModelo.OPENAI: "OPENAI_API_KEY",
+    TipoModelo.ANTHROPIC: "ANTHROPIC_API_KEY",
+}
+
+
+def _require_api_key(provedor: TipoModelo) -> None:
+    """
+    Falha cedo se a API key do provedor não estiver configurada.
+
+    Chamado ao obter o cliente (ex: no __init__ dos orchestrators), antes de
+    montar prompts ou buscar contexto RAG de qualquer seção.
 
     Raises:
-        ImportError: Se o provider necessário não estiver instalado e não houver fallback.
+        ValueError: Se a variável de ambiente da API key estiver vazia.
+    """
+    env_var = _API_KEY_ENV[provedor]
+    if not os.getenv(env_var):
+        raise ValueError(f"{env_var} não encontrada no ambiente")
+
+
+@lru_cache(maxsize=32)
+def _build_llm(provedor: TipoModelo, model_id: str, temperature: float, seed: Optional[int] = None) -> Any:
+    """
+    Cria o cliente LangChain uma única vez por (provedor, modelo, temperatura, seed).
+
+    Os agentes de todas as seções (e memos seguintes) reaproveitam o mesmo
+    cliente e seu pool de conexões HTTP em vez de construir um novo por chamada.
+
+    A seed só é enviada quando informada e apenas para OpenAI (a API da
+    Anthropic não tem esse parâmetro).
+
+    Raises:
+        ImportError: Se o SDK do provedor não estiver instalado.
+    """
+    if provedor == TipoModelo.ANTHROPIC:
+        from langchain_anthropic import ChatAnthropic
+        return ChatAnthropic(model=model_id, temperature=temperature)
+    if seed is not None:
+        return _import_chat_openai()(model=model_id, temperature=temperature, seed=seed)
+    return _import_chat_openai()(model=model_id, temperature=temperature)
+
+
+def get_openai_llm(model_id: str, temperature: float = 0.3, seed: Optional[int] = None) -> Any:
+    """
+    Retorna o ChatOpenAI compartilhado para um id de modelo OpenAI (ex: gpt-4o),
+    inclusive modelos fora de MODELOS_DISPONIVEIS.
+
+    Usado pelos agentes que recebem o nome do modelo diretamente; `seed`
+    (ex: OPENAI_SEED) é opcional e só é enviada quando informada.
+
+    Raises:
+        ValueError: Se OPENAI_API_KEY não estiver configurada.
+        ImportError: Se langchain-openai não estiver instalado.
+    """
+    _require_api_key(TipoModelo.OPENAI)
+    return _build_llm(TipoModelo.OPENAI, model_id, temperature, seed)
+
+
+@lru_cache(maxsize=32)
+def _resolve_model(model_id: str) -> tuple[TipoModelo, str]:
+    """
+    Resolve o id da UI para (provedor, id técnico) uma única vez por model_id.
+
+    Aplica o fallback para o modelo padrão (modelo não cadastrado) e para
+    OpenAI (langchain-anthropic não instalado): a tentativa de import que
+    falha não é repetida a cada agente.
     """
     config = GerenciadorModelos.MODELOS_DISPONIVEIS.get(model_id)
     if not config:
@@ -167,21 +231,43 @@ def get_llm_for_agents(model_id: str, temperature: float = 0.3) -> Any:
             config = GerenciadorModelos.MODELOS_DISPONIVEIS[model_id]
 
     if config.provedor == TipoModelo.OPENAI:
-        if not OPENAI_AVAILABLE or ChatOpenAI is None:
-            raise ImportError("langchain-openai não está instalado. Execute: pip install langchain-openai")
-        return ChatOpenAI(model=config.id, temperature=temperature)
+        return TipoModelo.OPENAI, config.id
 
     if config.provedor == TipoModelo.ANTHROPIC:
-        if not ANTHROPIC_AVAILABLE or ChatAnthropic is None:
+        try:
+            import langchain_anthropic  # noqa: F401
+        except ImportError:
             logger.warning(
                 "Modelo Anthropic '%s' solicitado mas langchain-anthropic não está instalado. "
                 "Usando modelo padrão OpenAI como fallback.",
                 config.id,
             )
-            if not OPENAI_AVAILABLE or ChatOpenAI is None:
-                raise ImportError("langchain-openai não está instalado. Execute: pip install langchain-openai")
-            default_id = GerenciadorModelos.MODELOS_DISPONIVEIS[get_default_model()].id
-            return ChatOpenAI(model=default_id, temperature=temperature)
-        return ChatAnthropic(model=config.id, temperature=temperature)
+            return TipoModelo.OPENAI, GerenciadorModelos.MODELOS_DISPONIVEIS[get_default_model()].id
+        return TipoModelo.ANTHROPIC, config.id
 
     raise ValueError(f"Provedor não suportado: {config.provedor}")
+
+
+def get_llm_for_agents(model_id: str, temperature: float = 0.3, seed: Optional[int] = None) -> Any:
+    """
+    Retorna instância LangChain do LLM (ChatOpenAI ou ChatAnthropic) para uso
+    pelos agentes que produzem textos (orchestrators, RAG chat, etc.).
+
+    Usa ModeloConfig.provedor para escolher o provider; modelos não cadastrados
+    usam o modelo padrão com fallback para OpenAI.
+
+    Args:
+        model_id: ID do modelo (ex: gpt-5.2, claude-sonnet-4.5).
+        temperature: Criatividade (0-1).
+        seed: Seed das chamadas OpenAI (opcional; ignorada para Anthropic).
+
+    Returns:
+        Instância de ChatOpenAI ou ChatAnthropic (compartilhada por modelo, temperatura e seed).
+
+    Raises:
+        ValueError: Se a API key do provedor não estiver configurada.
+        ImportError: Se o provider necessário não estiver instalado e não houver fallback.
+    """
+    provedor, resolved_id = _resolve_model(model_id)
+    _require_api_key(provedor)
+    return _build_llm(provedor, resolved_id, temperature, seed)
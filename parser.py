@@ -1,16 +1,16 @@
+import asyncio
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 from llama_parse import LlamaParse
 from dotenv import load_dotenv
+from core.logger import get_logger
 
 load_dotenv()
+logger = get_logger(__name__)
 
-def parse(
-    pdf_path: str | Path,
-    output_dir: str | Path = None,
-) -> Dict[str, Any]:
 
+def _check_input(pdf_path: str | Path) -> tuple[Path, str]:
     pdf_path = Path(pdf_path)
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF não encontrado: {pdf_path}")
@@ -19,10 +19,15 @@ def parse(
     if not api_key:
         raise ValueError("LLAMA_CLOUD_API_KEY não encontrada no .env")
 
-    parser = LlamaParse(
+    return pdf_path, api_key
+
+
+def _build_parser(api_key: str) -> LlamaParse:
+    return LlamaParse(
         api_key=api_key,
         result_type="markdown",
-        verbose=True,
+        # Log de progresso do SDK só sob demanda (LLAMA_PARSE_VERBOSE=true)
+        verbose=os.getenv("LLAMA_PARSE_VERBOSE", "false").lower() == "true",
         language="pt",
         system_prompt="""Você é um especialista em extração de documentos financeiros.
         Extraia todo o conteúdo mantendo a estrutura original de:
@@ -35,15 +40,16 @@ def parse(
         num_workers=4,
     )
 
-    print(f"Processando...: {pdf_path.name}")
-
-    documents = parser.load_data(str(pdf_path))
 
-    chunks = []
-    for i, doc in enumerate(documents, start=1):
-        chunks.append(f"=== PAGE {i} ===")
-        chunks.append(doc.text)
-    full_text = "\n\n".join(chunks)
+def _build_result(
+    pdf_path: Path,
+    documents: list,
+    output_dir: str | Path = None,
+) -> Dict[str, Any]:
+    # Cabeçalho + texto de cada página montados em uma única passada
+    full_text = "\n\n".join(
+        f"=== PAGE {i} ===\n\n{doc.text}" for i, doc in enumerate(documents, start=1)
+    )
 
     result = {
         "filename": pdf_path.name,
@@ -59,7 +65,56 @@ def parse(
         output_file = output_dir / f"{pdf_path.stem}_parsed.txt"
         output_file.write_text(full_text, encoding="utf-8")
         result["output_file"] = str(output_file)
-        print(f"   ✓ Salvo: {output_file}")
+        logger.debug("Salvo: %s", output_file)
+
+    logger.debug("%s: %d páginas | %d caracteres", pdf_path.name, len(documents), len(full_text))
+    return result
+
+
+def parse(
+    pdf_path: str | Path,
+    output_dir: str | Path = None,
+) -> Dict[str, Any]:
+
+    pdf_path, api_key = _check_input(pdf_path)
+    parser = _build_parser(api_key)
+
+    logger.debug("Processando: %s", pdf_path.name)
+
+    documents = parser.load_data(str(pdf_path))
+
+    return _build_result(pdf_path, documents, output_dir)
+
+
+async def aparse(
+    pdf_path: str | Path,
+    output_dir: str | Path = None,
+) -> Dict[str, Any]:
+    """Versão assíncrona de parse (LlamaParse.aload_data): não bloqueia o event loop."""
+
+    pdf_path, api_key = _check_input(pdf_path)
+    parser = _build_parser(api_key)
+
+    logger.debug("Processando: %s", pdf_path.name)
+
+    documents = await parser.aload_data(str(pdf_path))
+
+    return _build_result(pdf_path, documents, output_dir)
+
+
+async def parse_many(
+    pdf_paths: List[str | Path],
+    output_dir: str | Path = None,
+    concurrency: int = 4,
+) -> List[Dict[str, Any]]:
+    """
+    Parseia vários PDFs em paralelo, no máximo `concurrency` ao mesmo tempo
+    (evita rate limit da API). Resultados na mesma ordem de `pdf_paths`.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _parse_one(pdf_path: str | Path) -> Dict[str, Any]:
+        async with semaphore:
+            return await aparse(pdf_path, output_dir)
 
-    print(f"   ✓ {len(documents)} páginas | {len(full_text):,} caracteres\n")
-    return result
\ No newline at end of file
+    return await asyncio.gather(*(_parse_one(p) for p in pdf_paths))
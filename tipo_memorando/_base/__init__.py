@@ -3,6 +3,7 @@ Base compartilhado para tipos de memorando
 
 Componentes:
 - base_langgraph_orchestrator: Classe base LangGraph
+- rag_prefetch: Busca RAG de todas as seções em uma consulta
 - format_utils: Formatação de moeda, múltiplos, percentuais
 """
 
@@ -10,6 +11,7 @@ from .base_langgraph_orchestrator import (
     BaseLangGraphOrchestrator,
     BaseShortMemoGenerationState,
 )
+from .rag_prefetch import fetch_section_rag_contexts
 from .format_utils import (
     get_currency_symbol,
     get_currency_label,
@@ -21,6 +23,7 @@ from .format_utils import (
 __all__ = [
     "BaseLangGraphOrchestrator",
     "BaseShortMemoGenerationState",
+    "fetch_section_rag_contexts",
     "get_currency_symbol",
     "get_currency_label",
     "format_currency_value",
@@ -5,10 +5,13 @@ Centraliza lógica compartilhada entre:
 - short_searchfund, short_gestora, short_primario
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import TypedDict, Dict, Any, Optional, List, Literal
 from langgraph.graph import StateGraph, END
 from model_config import get_llm_for_agents
 from core.logger import get_logger
+from .rag_prefetch import fetch_section_rag_contexts
 
 logger = get_logger(__name__)
 
@@ -24,6 +27,7 @@ class BaseShortMemoGenerationState(TypedDict, total=False):
     
     # RAG Context
     section_rag_context: Optional[str]
+    rag_prefetched: bool  # section_rag_context já buscado em lote (agenerate_full_memo)
     query: str
     
     # Generation
@@ -62,7 +66,8 @@ class BaseLangGraphOrchestrator:
         section_queries: Optional[Dict[str, str]] = None,
         model: str = "gpt-4o",
         temperature: float = 0.25,
-        max_retries: int = 2
+        max_retries: int = 2,
+        seed: Optional[int] = None
     ):
         """
         Inicializa orchestrator base.
@@ -73,6 +78,10 @@ class BaseLangGraphOrchestrator:
             model: Modelo OpenAI
             temperature: Criatividade (0-1)
             max_retries: Tentativas de retry se falhar
+            seed: Seed das chamadas OpenAI (opcional; só a Gestora usa)
+        
+        Raises:
+            ValueError: Se a API key do provedor não estiver configurada
         """
         self.fixed_structure = fixed_structure
         self.section_queries = section_queries or {}
@@ -80,8 +89,9 @@ class BaseLangGraphOrchestrator:
         self.temperature = temperature
         self.max_retries = max_retries
         
-        # LLM centralizado em model_config (OpenAI/Anthropic conforme cadastro)
-        self.llm = get_llm_for_agents(model, temperature)
+        # LLM centralizado em model_config (OpenAI/Anthropic conforme cadastro).
+        # Sem API key, falha aqui, antes de qualquer seção montar prompts ou buscar RAG
+        self.llm = get_llm_for_agents(model, temperature, seed=seed)
         
         # Construir grafo
         self.graph = self._build_graph()
@@ -126,12 +136,21 @@ class BaseLangGraphOrchestrator:
         # Usar query específica se disponível, senão usar título genérico
         query = self.section_queries.get(section_title, section_title.lower().replace(" ", " "))
         
+        if state.get("rag_prefetched"):
+            # Contexto já buscado junto com o das demais seções (uma consulta ao ChromaDB)
+            return {
+                "section_rag_context": state.get("section_rag_context"),
+                "query": query
+            }
+        
         if memo_id and processor:
             try:
                 chunks = processor.search_chromadb_chunks(
                     memo_id=memo_id,
                     query=query,
-                    top_k=10
+                    top_k=10,
+                    # Queries por seção são estáticas: embedding calculado uma vez por processo
+                    cache_embedding=True
                 )
                 
                 if chunks:
@@ -249,6 +268,95 @@ class BaseLangGraphOrchestrator:
             "final_output": {"text": paragraphs}
         }
     
+    def _run_section(
+        self,
+        section_title: str,
+        agent: Any,
+        facts: Dict[str, Any],
+        memo_id: Optional[str],
+        processor: Optional[Any],
+        prefetched_rag: Optional[Dict[str, Optional[str]]] = None
+    ) -> List[str]:
+        """
+        Executa o grafo (RAG → geração → validação/retry) de uma seção e retorna os parágrafos.
+        
+        Com prefetched_rag (contexto de todas as seções, buscado em lote), o nó
+        prepare_section não consulta o ChromaDB.
+        """
+        logger.info(f"\n{'='*60}")
+        logger.info(f"📝 Processando: {section_title}")
+        logger.info(f"{'='*60}\n")
+        
+        # Estado inicial para esta seção
+        initial_state = {
+            "section_title": section_title,
+            "agent": agent,
+            "facts": facts,
+            "memo_id": memo_id,
+            "processor": processor,
+            "retry_count": 0,
+            "max_retries": self.max_retries
+        }
+        if prefetched_rag is not None:
+            initial_state["section_rag_context"] = prefetched_rag.get(section_title)
+            initial_state["rag_prefetched"] = True
+        
+        # Executar grafo (sincronamente)
+        try:
+            # O grafo é compilado, então executamos como função
+            final_state = self.graph.invoke(initial_state)
+            return final_state.get("paragraphs", [])
+            
+        except Exception as e:
+            logger.error(f"❌ Erro ao processar '{section_title}': {e}")
+            return [f"(Erro ao gerar seção: {e})"]
+    
+    async def agenerate_full_memo(
+        self,
+        facts: Dict[str, Any],
+        memo_id: Optional[str] = None,
+        processor: Optional[Any] = None,
+        rag_context: Optional[str] = None  # Deprecated
+    ) -> Dict[str, List[str]]:
+        """
+        Versão assíncrona de generate_full_memo.
+        
+        As seções não dependem umas das outras (só de facts e do RAG da própria
+        seção), então todas rodam em paralelo (asyncio.gather): o tempo total
+        fica próximo ao da seção mais lenta. Cada grafo roda em uma thread, pois
+        os agentes chamam o LLM de forma síncrona.
+        
+        Returns:
+            Dict com estrutura: {section_title: [paragraph1, paragraph2, ...]},
+            na ordem de fixed_structure
+        """
+        if rag_context:
+            logger.warning("⚠️ rag_context deprecated, use memo_id+processor")
+        
+        section_titles = list(self.fixed_structure)
+        
+        # RAG de todas as seções em uma única consulta ao ChromaDB, antes do fan-out
+        prefetched_rag = None
+        if memo_id and processor:
+            prefetched_rag = fetch_section_rag_contexts(
+                processor, memo_id, section_titles, self.section_queries
+            )
+        
+        loop = asyncio.get_running_loop()
+        # Uma thread por seção: o executor padrão pode ter menos workers que seções
+        with ThreadPoolExecutor(max_workers=max(1, len(section_titles))) as executor:
+            results = await asyncio.gather(*(
+                loop.run_in_executor(
+                    executor, self._run_section,
+                    section_title, agent, facts, memo_id, processor, prefetched_rag
+                )
+                for section_title, agent in self.fixed_structure.items()
+            ))
+        result = dict(zip(section_titles, results))
+        
+        logger.info(f"\n✅ Memo gerado com {len(result)} seções")
+        return result
+    
     def generate_full_memo(
         self,
         facts: Dict[str, Any],
@@ -259,6 +367,8 @@ class BaseLangGraphOrchestrator:
         """
         Gera memo completo orquestrando todos os agentes via LangGraph.
         
+        Wrapper síncrono de agenerate_full_memo (seções em paralelo).
+        
         Args:
             facts: Facts estruturados (todas as seções)
             memo_id: ID do memo no ChromaDB para RAG
@@ -268,37 +378,9 @@ class BaseLangGraphOrchestrator:
         Returns:
             Dict com estrutura: {section_title: [paragraph1, paragraph2, ...]}
         """
-        if rag_context:
-            logger.warning("⚠️ rag_context deprecated, use memo_id+processor")
-        
-        result = {}
-        
-        for section_title, agent in self.fixed_structure.items():
-            logger.info(f"\n{'='*60}")
-            logger.info(f"📝 Processando: {section_title}")
-            logger.info(f"{'='*60}\n")
-            
-            # Estado inicial para esta seção
-            initial_state = {
-                "section_title": section_title,
-                "agent": agent,
-                "facts": facts,
-                "memo_id": memo_id,
-                "processor": processor,
-                "retry_count": 0,
-                "max_retries": self.max_retries
-            }
-            
-            # Executar grafo (sincronamente)
-            try:
-                # O grafo é compilado, então executamos como função
-                final_state = self.graph.invoke(initial_state)
-                paragraphs = final_state.get("paragraphs", [])
-                result[section_title] = paragraphs
-                
-            except Exception as e:
-                logger.error(f"❌ Erro ao processar '{section_title}': {e}")
-                result[section_title] = [f"(Erro ao gerar seção: {e})"]
-        
-        logger.info(f"\n✅ Memo gerado com {len(result)} seções")
-        return result
+        return asyncio.run(self.agenerate_full_memo(
+            facts=facts,
+            memo_id=memo_id,
+            processor=processor,
+            rag_context=rag_context
+        ))
@@ -8,6 +8,24 @@ Consolida funcionalidades duplicadas dos builders específicos de cada tipo de m
 from typing import Dict, Any, Optional, Union
 
 
+# Títulos padrão para seções comuns (montado uma única vez no import)
+_DEFAULT_SECTION_TITLES: Dict[str, str] = {
+    "identification": "IDENTIFICAÇÃO",
+    "transaction_structure": "TRANSAÇÃO",
+    "financials_history": "FINANCIALS HISTÓRICO",
+    "projections": "PROJEÇÕES (SAÍDA)",
+    "saida": "SAÍDA",
+    "returns": "RETORNOS",
+    "qualitative": "ASPECTOS QUALITATIVOS",
+    "opinioes": "OPINIÕES",
+    "gestora": "GESTORA",
+    "fundo": "FUNDO",
+    "estrategia": "ESTRATÉGIA",
+    "estrategia_fundo": "ESTRATÉGIA",
+    "spectra_context": "CONTEXTO SPECTRA",
+}
+
+
 def build_facts_section(
     facts: Dict[str, Any],
     section_name: str,
@@ -55,25 +73,7 @@ def format_facts_for_prompt(
     section_titles: Optional[Dict[str, str]] = None
 ) -> str:
     """Formata múltiplas seções de facts para inclusão em prompt."""
-    default_titles = {
-        "identification": "IDENTIFICAÇÃO",
-        "transaction_structure": "TRANSAÇÃO",
-        "financials_history": "FINANCIALS HISTÓRICO",
-        "projections": "PROJEÇÕES (SAÍDA)",
-        "saida": "SAÍDA",
-        "returns": "RETORNOS",
-        "qualitative": "ASPECTOS QUALITATIVOS",
-        "opinioes": "OPINIÕES",
-        "gestora": "GESTORA",
-        "fundo": "FUNDO",
-        "estrategia": "ESTRATÉGIA",
-        "estrategia_fundo": "ESTRATÉGIA",
-        "spectra_context": "CONTEXTO SPECTRA",
-    }
-
-    if section_titles is None:
-        section_titles = {}
-    titles = {**default_titles, **section_titles}
+    titles = {**_DEFAULT_SECTION_TITLES, **section_titles} if section_titles else _DEFAULT_SECTION_TITLES
 
     sections = []
     for section_name, field_labels in section_configs.items():
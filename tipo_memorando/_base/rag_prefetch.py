@@ -0,0 +1,71 @@
+"""
+Busca RAG em lote compartilhada pelos orchestrators de Short Memo
+
+Usada pelo BaseLangGraphOrchestrator (agenerate_full_memo) e pelos caminhos
+de geração em lote de short_gestora (Batch API) e short_primario (uma única
+chamada ao LLM).
+"""
+
+from typing import Any, Dict, List, Optional
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def fetch_section_rag_contexts(
+    processor: Any,
+    memo_id: str,
+    section_titles: List[str],
+    section_queries: Dict[str, str]
+) -> Dict[str, Optional[str]]:
+    """
+    Busca o contexto RAG de todas as seções em uma única consulta ao ChromaDB
+    (embeddings das queries em uma chamada, reaproveitados do cache).
+
+    Se a consulta em lote falhar, busca cada seção separadamente; seções cuja
+    busca também falhar ficam sem contexto.
+
+    Args:
+        processor: DocumentProcessor para busca no ChromaDB
+        memo_id: ID do memo no ChromaDB
+        section_titles: Títulos das seções, na ordem do memo
+        section_queries: Query RAG por seção (ausentes usam o título)
+
+    Returns:
+        Dict {section_title: contexto ou None}
+    """
+    queries = [section_queries.get(title, title.lower()) for title in section_titles]
+    try:
+        batch_chunks = processor.search_chromadb_chunks_batch(
+            memo_id=memo_id,
+            queries=queries,
+            top_k=10,
+            # Queries por seção são estáticas: embeddings calculados uma vez por processo
+            cache_embeddings=True
+        )
+    except Exception as e:
+        logger.warning(f"⚠️ Falha na busca RAG em lote, buscando por seção: {e}")
+        batch_chunks = []
+        for title, query in zip(section_titles, queries):
+            try:
+                chunks = processor.search_chromadb_chunks(
+                    memo_id=memo_id,
+                    query=query,
+                    top_k=10,
+                    cache_embedding=True
+                )
+            except Exception as e:
+                logger.error(f"❌ Erro RAG em '{title}': {e}")
+                chunks = []
+            batch_chunks.append(chunks)
+
+    contexts = {}
+    for title, chunks in zip(section_titles, batch_chunks):
+        if chunks:
+            contexts[title] = "\n\n".join([chunk["chunk"] for chunk in chunks])
+            logger.info(f"✅ {len(chunks)} chunks para '{title}'")
+        else:
+            contexts[title] = None
+            logger.warning(f"⚠️ Nenhum chunk para '{title}'")
+    return contexts
@@ -4,17 +4,17 @@ Agentes para Memo Completo Search Fund
 Cada agente é responsável por gerar uma seção específica do memo completo.
 """
 
-from .intro_agent import generate_intro_section
-from .empresa_agent import generate_company_section
-from .mercado_agent import generate_market_section
-from .financials_agent import generate_financials_section
-from .transacao_agent import generate_transaction_section
-from .gestor_agent import generate_gestor_section
-from .projecoes_agent import generate_projections_section
-from .retornos_agent import generate_retornos_esperados_section
-from .board_cap_table_agent import generate_board_cap_table_section
-from .conclusao_agent import generate_conclusao_section
-from .risks_agent import generate_risks_section
+from .intro_agent import generate_intro_section, build_intro_messages
+from .empresa_agent import generate_company_section, build_company_messages
+from .mercado_agent import generate_market_section, build_market_messages
+from .financials_agent import generate_financials_section, build_financials_messages
+from .transacao_agent import generate_transaction_section, build_transaction_messages
+from .gestor_agent import generate_gestor_section, build_gestor_messages
+from .projecoes_agent import generate_projections_section, build_projections_messages
+from .retornos_agent import generate_retornos_esperados_section, build_retornos_esperados_messages
+from .board_cap_table_agent import generate_board_cap_table_section, build_board_cap_table_messages
+from .conclusao_agent import generate_conclusao_section, build_conclusao_messages
+from .risks_agent import generate_risks_section, build_risks_messages
 
 __all__ = [
     "generate_intro_section",
@@ -28,4 +28,16 @@ __all__ = [
     "generate_board_cap_table_section",
     "generate_conclusao_section",
     "generate_risks_section",
+    # Montagem de mensagens (sem chamar o LLM), usada na geração em lote
+    "build_intro_messages",
+    "build_company_messages",
+    "build_market_messages",
+    "build_financials_messages",
+    "build_transaction_messages",
+    "build_gestor_messages",
+    "build_projections_messages",
+    "build_retornos_esperados_messages",
+    "build_board_cap_table_messages",
+    "build_conclusao_messages",
+    "build_risks_messages",
 ]
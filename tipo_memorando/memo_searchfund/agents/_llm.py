@@ -0,0 +1,18 @@
+"""
+Cliente LLM compartilhado pelos agentes do Memo Completo Search Fund.
+
+Delega a model_config.get_openai_llm: o Memo Completo usa o mesmo cache de
+clientes ChatOpenAI (e pool de conexões HTTP) dos demais tipos de memorando.
+"""
+
+from model_config import get_openai_llm
+
+
+def get_chat_model(model: str = "gpt-4o", temperature: float = 0.25):
+    """
+    Retorna o ChatOpenAI compartilhado para o modelo e temperatura informados.
+
+    Raises:
+        ValueError: Se OPENAI_API_KEY não estiver configurada
+    """
+    return get_openai_llm(model, temperature)
@@ -0,0 +1,26 @@
+"""
+Mensagens LangChain compartilhadas pelos agentes do Memo Completo Search Fund.
+
+O import de langchain_core é feito sob demanda, para que importar o pacote de
+agentes não carregue o LangChain (pydantic, httpx, SDK da OpenAI) antes da
+primeira geração de seção.
+"""
+
+from functools import lru_cache
+
+
+# Persona do analista, compartilhada por todas as seções. O prompt de sistema
+# de cada seção é ANALYST_PERSONA + bloco de estrutura da seção, o que permite
+# à geração em uma única chamada enviar a persona uma só vez.
+ANALYST_PERSONA = "Você é um analista sênior de PE/Search Funds escrevendo MEMO COMPLETO para Spectra Capital."
+
+
+@lru_cache(maxsize=None)
+def system_message(content: str):
+    """
+    Retorna o SystemMessage para o texto informado.
+    
+    A mensagem é idêntica entre chamadas, então é criada uma única vez por texto.
+    """
+    from langchain_core.messages import SystemMessage
+    return SystemMessage(content=content)
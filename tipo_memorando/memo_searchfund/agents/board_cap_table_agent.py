@@ -4,33 +4,72 @@ Agente de Board e Cap Table - Memo Completo Search Fund
 Gera a seção "Board e Cap Table" do memo completo (4-6 parágrafos).
 """
 
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
-import os
+from typing import Dict, Any, List, Optional
 import json
 
 from facts.builder import build_facts_section
 from tipo_memorando._base.format_utils import get_currency_symbol, get_currency_label
 from ..validator import fix_number_formatting
+from ._messages import ANALYST_PERSONA, system_message
+from ._llm import get_chat_model
 
 
-def generate_board_cap_table_section(
+# Bloco ESTRUTURA OBRIGATÓRIA (estático; vai no prompt de sistema, após ANALYST_PERSONA)
+_STRUCTURE_BLOCK = """
+═══════════════════════════════════════════════════════════════════════
+ESTRUTURA OBRIGATÓRIA (4-6 parágrafos - MEMO COMPLETO)
+═══════════════════════════════════════════════════════════════════════
+
+§ PARÁGRAFO 1 - Composição do Board:
+  - Membros do board com seus backgrounds
+  - Quem indicou cada membro
+  - Experiência relevante de cada membro
+  - Papel esperado de cada membro
+
+§ PARÁGRAFO 2 - Análise da Qualidade do Board:
+  - Avaliação da qualidade e experiência do board
+  - Complementaridade dos membros
+  - Comparação com outros boards de Search Funds
+  - Pontos fortes e potenciais gaps
+
+§ PARÁGRAFO 3 - Estrutura de Investidores (Cap Table):
+  - Principais investidores e suas participações
+  - Tipos de investidores (Search Investor, Gap Investor, etc)
+  - Distribuição geográfica dos investidores
+  - Qualidade e reputação dos investidores
+
+§ PARÁGRAFO 4 - Governança e Direitos:
+  - Estrutura de governança
+  - Direitos de veto, tag-along, drag-along
+  - Composição e funcionamento do board
+  - Papel da Spectra (se board observer ou membro)
+
+§ PARÁGRAFO 5 - Análise da Qualidade do Cap Table:
+  - Avaliação da qualidade dos investidores
+  - Experiência em Search Funds
+  - Potencial de value-add
+  - Comparação com outros deals
+
+§ PARÁGRAFO 6 - Considerações Finais:
+  - Resumo da qualidade geral do board e cap table
+  - Pontos de atenção
+  - Expectativa de contribuição
+
+Gere apenas texto corrido (SEM títulos, SEM markdown).
+Se houver dados estruturados de board_members ou cap_table, incorpore nas análises.
+"""
+
+
+def build_board_cap_table_messages(
     facts: Dict[str, Any],
-    rag_context: Optional[str] = None,
-    model: str = "gpt-4o",
-    temperature: float = 0.25
-) -> str:
+    rag_context: Optional[str] = None
+) -> List[Any]:
     """
-    Gera seção Board e Cap Table COMPLETA para Memo Search Fund.
+    Monta as mensagens (system + prompt) da seção sem chamar o LLM.
     
-    EXTENSÃO: 4-6 parágrafos sobre composição do board e investidores.
+    Usado por generate_board_cap_table_section e pela geração em lote do orchestrator.
     """
-    apikey = os.getenv("OPENAI_API_KEY")
-    if not apikey:
-        raise ValueError("OPENAI_API_KEY não encontrada no ambiente")
-
-    llm = ChatOpenAI(model=model, api_key=apikey, temperature=temperature)
+    from langchain_core.messages import HumanMessage
 
     # Facts de board e cap table
     board_cap_table_facts = facts.get("board_cap_table", {})
@@ -56,9 +95,9 @@ def generate_board_cap_table_section(
             structured_data["cap_table"] = board_cap_table_facts["cap_table"]
         
         if structured_data:
-            board_cap_table_section += f"\n\nDADOS ESTRUTURADOS:\n{json.dumps(structured_data, indent=2, ensure_ascii=False)}"
+            board_cap_table_section += f"\n\nDADOS ESTRUTURADOS:\n{json.dumps(structured_data, ensure_ascii=False, separators=(',', ':'))}"
 
-    prompt = f"""
+    parts = [f"""
 Você é um analista sênior de PE/Search Funds, escrevendo a SEÇÃO BOARD E CAP TABLE de um MEMO COMPLETO para IC da Spectra Capital.
 
 ═══════════════════════════════════════════════════════════════════════
@@ -67,65 +106,37 @@ DADOS DO DEAL
 
 BOARD E CAP TABLE:
 {board_cap_table_section}
-"""
+"""]
 
     if rag_context:
-        prompt += f"""
+        parts.append(f"""
 ═══════════════════════════════════════════════════════════════════════
 CONTEXTO DO DOCUMENTO
 ═══════════════════════════════════════════════════════════════════════
 
 {rag_context}
-"""
+""")
 
-    prompt += """
-═══════════════════════════════════════════════════════════════════════
-ESTRUTURA OBRIGATÓRIA (4-6 parágrafos - MEMO COMPLETO)
-═══════════════════════════════════════════════════════════════════════
-
-§ PARÁGRAFO 1 - Composição do Board:
-  - Membros do board com seus backgrounds
-  - Quem indicou cada membro
-  - Experiência relevante de cada membro
-  - Papel esperado de cada membro
-
-§ PARÁGRAFO 2 - Análise da Qualidade do Board:
-  - Avaliação da qualidade e experiência do board
-  - Complementaridade dos membros
-  - Comparação com outros boards de Search Funds
-  - Pontos fortes e potenciais gaps
-
-§ PARÁGRAFO 3 - Estrutura de Investidores (Cap Table):
-  - Principais investidores e suas participações
-  - Tipos de investidores (Search Investor, Gap Investor, etc)
-  - Distribuição geográfica dos investidores
-  - Qualidade e reputação dos investidores
-
-§ PARÁGRAFO 4 - Governança e Direitos:
-  - Estrutura de governança
-  - Direitos de veto, tag-along, drag-along
-  - Composição e funcionamento do board
-  - Papel da Spectra (se board observer ou membro)
+    prompt = "".join(parts)
 
-§ PARÁGRAFO 5 - Análise da Qualidade do Cap Table:
-  - Avaliação da qualidade dos investidores
-  - Experiência em Search Funds
-  - Potencial de value-add
-  - Comparação com outros deals
-
-§ PARÁGRAFO 6 - Considerações Finais:
-  - Resumo da qualidade geral do board e cap table
-  - Pontos de atenção
-  - Expectativa de contribuição
-
-Gere apenas texto corrido (SEM títulos, SEM markdown).
-Se houver dados estruturados de board_members ou cap_table, incorpore nas análises.
-"""
-
-    messages = [
-        SystemMessage(content="Você é um analista sênior de PE/Search Funds escrevendo MEMO COMPLETO para Spectra Capital."),
+    # Estrutura no prompt de sistema: prefixo fixo antes dos dados do deal
+    return [
+        system_message(ANALYST_PERSONA + _STRUCTURE_BLOCK),
         HumanMessage(content=prompt),
     ]
+
+
+def generate_board_cap_table_section(
+    facts: Dict[str, Any],
+    rag_context: Optional[str] = None,
+    model: str = "gpt-4o",
+    temperature: float = 0.25
+) -> str:
+    """
+    Gera seção Board e Cap Table COMPLETA para Memo Search Fund.
     
-    result = llm.invoke(messages)
+    EXTENSÃO: 4-6 parágrafos sobre composição do board e investidores.
+    """
+    llm = get_chat_model(model, temperature)
+    result = llm.invoke(build_board_cap_table_messages(facts, rag_context))
     return fix_number_formatting(result.content.strip())
@@ -4,32 +4,73 @@ Agente de Empresa - Memo Completo Search Fund
 Gera a seção "Empresa" do memo completo (6-8 parágrafos).
 """
 
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
-import os
+from typing import Dict, Any, List, Optional
 
 from facts.builder import build_facts_section
 from tipo_memorando._base.format_utils import get_currency_symbol, get_currency_label
 from ..validator import fix_number_formatting
+from ._messages import ANALYST_PERSONA, system_message
+from ._llm import get_chat_model
 
 
-def generate_company_section(
+# Bloco ESTRUTURA OBRIGATÓRIA (estático; vai no prompt de sistema, após ANALYST_PERSONA)
+_STRUCTURE_BLOCK = """
+═══════════════════════════════════════════════════════════════════════
+ESTRUTURA OBRIGATÓRIA (6-8 parágrafos - MEMO COMPLETO)
+═══════════════════════════════════════════════════════════════════════
+
+§ PARÁGRAFO 1 - Histórico e Fundação:
+  - "Fundada em [ano] e sediada em [local], a [Empresa] é..."
+  - História da empresa, fundadores, evolução
+
+§ PARÁGRAFO 2 - Modelo de Negócio:
+  - Core business, proposta de valor
+  - Como a empresa gera receita
+
+§ PARÁGRAFO 3 - Produtos e Serviços:
+  - Principais linhas de negócio
+  - Mix de receita por vertical: "(X% da receita)"
+  - Detalhamento de cada vertical
+
+§ PARÁGRAFO 4 - Base de Clientes:
+  - Perfil de clientes (B2B, B2C, segmentos)
+  - Concentração de clientes
+  - Principais contratos e renovações
+
+§ PARÁGRAFO 5 - Evolução Histórica:
+  - "Entre [período], o faturamento apresentou CAGR de X%"
+  - Marcos importantes, mudanças estratégicas
+  - Drivers de crescimento
+
+§ PARÁGRAFO 6 - Estrutura Operacional:
+  - Número de funcionários, organograma
+  - Processos-chave, capacidade operacional
+  - Infraestrutura e ativos
+
+§ PARÁGRAFO 7 - Margens e Rentabilidade:
+  - Margem bruta e EBITDA
+  - Dinâmica de custos e despesas
+  - Conversão de caixa
+
+§ PARÁGRAFO 8 - Riscos Operacionais:
+  - Key person risk
+  - Dependências operacionais
+  - Pontos de atenção identificados
+
+Gere apenas texto corrido (SEM títulos, SEM markdown).
+"""
+
+
+def build_company_messages(
     facts: Dict[str, Any],
-    rag_context: Optional[str] = None,
-    model: str = "gpt-4o",
-    temperature: float = 0.25
-) -> str:
+    rag_context: Optional[str] = None
+) -> List[Any]:
     """
-    Gera seção Empresa COMPLETA para Memo Search Fund.
+    Monta as mensagens (system + prompt) da seção sem chamar o LLM.
     
-    EXTENSÃO: 6-8 parágrafos com análise profunda do negócio.
+    Usado por generate_company_section e pela geração em lote do orchestrator.
     """
-    apikey = os.getenv("OPENAI_API_KEY")
-    if not apikey:
-        raise ValueError("OPENAI_API_KEY não encontrada no ambiente")
-
-    llm = ChatOpenAI(model=model, api_key=apikey, temperature=temperature)
+    from langchain_core.messages import HumanMessage
 
     # ===== FACTS =====
     identification_section = build_facts_section(
@@ -71,7 +112,7 @@ def generate_company_section(
         }
     )
 
-    prompt = f"""
+    parts = [f"""
 Você é um analista sênior de PE/Search Funds, escrevendo a SEÇÃO EMPRESA de um MEMO COMPLETO para IC da Spectra Capital.
 
 ═══════════════════════════════════════════════════════════════════════
@@ -86,67 +127,37 @@ FINANCIALS:
 
 QUALITATIVO:
 {qualitative_section}
-"""
+"""]
 
     if rag_context:
-        prompt += f"""
+        parts.append(f"""
 ═══════════════════════════════════════════════════════════════════════
 CONTEXTO DO DOCUMENTO
 ═══════════════════════════════════════════════════════════════════════
 
 {rag_context}
-"""
+""")
 
-    prompt += """
-═══════════════════════════════════════════════════════════════════════
-ESTRUTURA OBRIGATÓRIA (6-8 parágrafos - MEMO COMPLETO)
-═══════════════════════════════════════════════════════════════════════
-
-§ PARÁGRAFO 1 - Histórico e Fundação:
-  - "Fundada em [ano] e sediada em [local], a [Empresa] é..."
-  - História da empresa, fundadores, evolução
-
-§ PARÁGRAFO 2 - Modelo de Negócio:
-  - Core business, proposta de valor
-  - Como a empresa gera receita
-
-§ PARÁGRAFO 3 - Produtos e Serviços:
-  - Principais linhas de negócio
-  - Mix de receita por vertical: "(X% da receita)"
-  - Detalhamento de cada vertical
-
-§ PARÁGRAFO 4 - Base de Clientes:
-  - Perfil de clientes (B2B, B2C, segmentos)
-  - Concentração de clientes
-  - Principais contratos e renovações
-
-§ PARÁGRAFO 5 - Evolução Histórica:
-  - "Entre [período], o faturamento apresentou CAGR de X%"
-  - Marcos importantes, mudanças estratégicas
-  - Drivers de crescimento
-
-§ PARÁGRAFO 6 - Estrutura Operacional:
-  - Número de funcionários, organograma
-  - Processos-chave, capacidade operacional
-  - Infraestrutura e ativos
-
-§ PARÁGRAFO 7 - Margens e Rentabilidade:
-  - Margem bruta e EBITDA
-  - Dinâmica de custos e despesas
-  - Conversão de caixa
-
-§ PARÁGRAFO 8 - Riscos Operacionais:
-  - Key person risk
-  - Dependências operacionais
-  - Pontos de atenção identificados
-
-Gere apenas texto corrido (SEM títulos, SEM markdown).
-"""
+    prompt = "".join(parts)
 
-    messages = [
-        SystemMessage(content="Você é um analista sênior de PE/Search Funds escrevendo MEMO COMPLETO para Spectra Capital."),
+    # Estrutura no prompt de sistema: prefixo fixo antes dos dados do deal
+    return [
+        system_message(ANALYST_PERSONA + _STRUCTURE_BLOCK),
         HumanMessage(content=prompt),
     ]
+
+
+def generate_company_section(
+    facts: Dict[str, Any],
+    rag_context: Optional[str] = None,
+    model: str = "gpt-4o",
+    temperature: float = 0.25
+) -> str:
+    """
+    Gera seção Empresa COMPLETA para Memo Search Fund.
     
-    result = llm.invoke(messages)
+    EXTENSÃO: 6-8 parágrafos com análise profunda do negócio.
+    """
+    llm = get_chat_model(model, temperature)
+    result = llm.invoke(build_company_messages(facts, rag_context))
     return fix_number_formatting(result.content.strip())
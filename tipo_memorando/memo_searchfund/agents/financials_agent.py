@@ -5,32 +5,75 @@ Gera a seção "Histórico Financeiro" do memo completo (6-8 parágrafos).
 """
 
 import json
-import os
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
+from typing import Dict, Any, List, Optional
 
 from facts.builder import build_facts_section
 from tipo_memorando._base.format_utils import get_currency_symbol, get_currency_label
 from ..validator import fix_number_formatting
+from ._messages import ANALYST_PERSONA, system_message
+from ._llm import get_chat_model
 
 
-def generate_financials_section(
+# Bloco ESTRUTURA OBRIGATÓRIA (estático; vai no prompt de sistema, após ANALYST_PERSONA)
+_STRUCTURE_BLOCK = """
+═══════════════════════════════════════════════════════════════════════
+ESTRUTURA OBRIGATÓRIA (6-8 parágrafos - MEMO COMPLETO)
+═══════════════════════════════════════════════════════════════════════
+
+§ PARÁGRAFO 1 - Evolução de Receita:
+  - "Entre [período], o faturamento apresentou CAGR de X%..."
+  - Evolução ano a ano
+  - Drivers de crescimento
+
+§ PARÁGRAFO 2 - Composição de Receita:
+  - Mix por produto/serviço/cliente
+  - Evolução do mix ao longo do tempo
+  - Concentração de receita
+
+§ PARÁGRAFO 3 - Margem Bruta:
+  - Margem bruta atual e histórica
+  - Dinâmica de custos
+  - Comparação com peers
+
+§ PARÁGRAFO 4 - EBITDA e Margem Operacional:
+  - EBITDA atual e evolução
+  - Análise da margem EBITDA
+  - Despesas operacionais como % da receita
+
+§ PARÁGRAFO 5 - Estrutura de Custos:
+  - Breakdown de custos e despesas
+  - Custos fixos vs variáveis
+  - Alavancagem operacional
+
+§ PARÁGRAFO 6 - Geração de Caixa:
+  - Conversão de EBITDA em caixa
+  - Capex (manutenção vs expansão)
+  - Necessidade de capital de giro
+
+§ PARÁGRAFO 7 - Posição de Balanço:
+  - Dívida líquida e estrutura de capital
+  - Ativos e passivos relevantes
+  - Contingências e provisões
+
+§ PARÁGRAFO 8 - Qualidade dos Números:
+  - Ajustes necessários (normalização)
+  - Consistência com QofE se disponível
+  - Red flags identificados
+
+Gere apenas texto corrido (SEM títulos, SEM markdown).
+"""
+
+
+def build_financials_messages(
     facts: Dict[str, Any],
-    rag_context: Optional[str] = None,
-    model: str = "gpt-4o",
-    temperature: float = 0.25
-) -> str:
+    rag_context: Optional[str] = None
+) -> List[Any]:
     """
-    Gera seção Histórico Financeiro COMPLETA para Memo Search Fund.
+    Monta as mensagens (system + prompt) da seção sem chamar o LLM.
     
-    EXTENSÃO: 6-8 parágrafos com análise profunda de financials.
+    Usado por generate_financials_section e pela geração em lote do orchestrator.
     """
-    apikey = os.getenv("OPENAI_API_KEY")
-    if not apikey:
-        raise ValueError("OPENAI_API_KEY não encontrada no ambiente")
-
-    llm = ChatOpenAI(model=model, api_key=apikey, temperature=temperature)
+    from langchain_core.messages import HumanMessage
 
     trx = facts.get("transaction_structure", {})
     currency = trx.get("currency") or "BRL"
@@ -87,7 +130,7 @@ CARG projetado (do ano de referência ao último ano de projeção):
 Use receita_liquida, ebitda, margem_ebitda, lucro_liquido, divida_liquida etc. para preencher a narrativa com números exatos.
 """
 
-    prompt = f"""
+    parts = [f"""
 Você é um analista sênior de PE/Search Funds, escrevendo a SEÇÃO HISTÓRICO FINANCEIRO de um MEMO COMPLETO para IC da Spectra Capital.
 
 ═══════════════════════════════════════════════════════════════════════
@@ -97,69 +140,37 @@ DADOS DO DEAL
 FINANCIALS:
 {financials_section}
 {dre_section}
-"""
+"""]
 
     if rag_context:
-        prompt += f"""
+        parts.append(f"""
 ═══════════════════════════════════════════════════════════════════════
 CONTEXTO DO DOCUMENTO
 ═══════════════════════════════════════════════════════════════════════
 
 {rag_context}
-"""
+""")
 
-    prompt += """
-═══════════════════════════════════════════════════════════════════════
-ESTRUTURA OBRIGATÓRIA (6-8 parágrafos - MEMO COMPLETO)
-═══════════════════════════════════════════════════════════════════════
-
-§ PARÁGRAFO 1 - Evolução de Receita:
-  - "Entre [período], o faturamento apresentou CAGR de X%..."
-  - Evolução ano a ano
-  - Drivers de crescimento
-
-§ PARÁGRAFO 2 - Composição de Receita:
-  - Mix por produto/serviço/cliente
-  - Evolução do mix ao longo do tempo
-  - Concentração de receita
-
-§ PARÁGRAFO 3 - Margem Bruta:
-  - Margem bruta atual e histórica
-  - Dinâmica de custos
-  - Comparação com peers
-
-§ PARÁGRAFO 4 - EBITDA e Margem Operacional:
-  - EBITDA atual e evolução
-  - Análise da margem EBITDA
-  - Despesas operacionais como % da receita
-
-§ PARÁGRAFO 5 - Estrutura de Custos:
-  - Breakdown de custos e despesas
-  - Custos fixos vs variáveis
-  - Alavancagem operacional
-
-§ PARÁGRAFO 6 - Geração de Caixa:
-  - Conversão de EBITDA em caixa
-  - Capex (manutenção vs expansão)
-  - Necessidade de capital de giro
+    prompt = "".join(parts)
 
-§ PARÁGRAFO 7 - Posição de Balanço:
-  - Dívida líquida e estrutura de capital
-  - Ativos e passivos relevantes
-  - Contingências e provisões
-
-§ PARÁGRAFO 8 - Qualidade dos Números:
-  - Ajustes necessários (normalização)
-  - Consistência com QofE se disponível
-  - Red flags identificados
-
-Gere apenas texto corrido (SEM títulos, SEM markdown).
-"""
-
-    messages = [
-        SystemMessage(content="Você é um analista sênior de PE/Search Funds escrevendo MEMO COMPLETO para Spectra Capital."),
+    # Estrutura no prompt de sistema: prefixo fixo antes dos dados do deal
+    return [
+        system_message(ANALYST_PERSONA + _STRUCTURE_BLOCK),
         HumanMessage(content=prompt),
     ]
+
+
+def generate_financials_section(
+    facts: Dict[str, Any],
+    rag_context: Optional[str] = None,
+    model: str = "gpt-4o",
+    temperature: float = 0.25
+) -> str:
+    """
+    Gera seção Histórico Financeiro COMPLETA para Memo Search Fund.
     
-    result = llm.invoke(messages)
+    EXTENSÃO: 6-8 parágrafos com análise profunda de financials.
+    """
+    llm = get_chat_model(model, temperature)
+    result = llm.invoke(build_financials_messages(facts, rag_context))
     return fix_number_formatting(result.content.strip())
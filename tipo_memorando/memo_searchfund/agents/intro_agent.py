@@ -4,41 +4,72 @@ Agente de Introdução - Memo Completo Search Fund
 Gera a seção "Overview/Introdução" do memo completo (5-7 parágrafos).
 """
 
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
-import os
+from typing import Dict, Any, List, Optional
 
 from facts.builder import build_facts_section
 from tipo_memorando._base.format_utils import get_currency_symbol, get_currency_label
 from ..validator import fix_number_formatting
+from ._messages import ANALYST_PERSONA, system_message
+from ._llm import get_chat_model
 
 
-def generate_intro_section(
+# Bloco ESTRUTURA OBRIGATÓRIA (template preenchido a cada chamada)
+_STRUCTURE_BLOCK = """
+═══════════════════════════════════════════════════════════════════════
+ESTRUTURA OBRIGATÓRIA (5-7 parágrafos - MEMO COMPLETO)
+═══════════════════════════════════════════════════════════════════════
+
+§ PARÁGRAFO 1 - Abertura e Contexto:
+   - "A {investor_name} (search liderado por {searcher_names}, que iniciou seu período de busca em {search_start_date}) está avaliando a aquisição da {company_name}..."
+   - Breve descrição do negócio e setor
+
+§ PARÁGRAFO 2 - Estrutura da Transação:
+   - Participação, EV, múltiplo de entrada
+   - Detalhe completo: à vista, seller note, earnout
+   - Análise da atratividade da estrutura
+
+§ PARÁGRAFO 3 - Tese de Investimento:
+   - Por que este deal faz sentido
+   - Principais drivers de valor
+   - Opcionalidades de crescimento
+
+§ PARÁGRAFO 4 - Destaques Financeiros:
+   - Receita, EBITDA, margens atuais
+   - Histórico de crescimento (CAGR)
+   - Conversão de caixa e alavancagem
+
+§ PARÁGRAFO 5 - Retornos Esperados:
+   - IRR e MOIC no cenário base
+   - Premissas principais
+   - Sensibilidade a variáveis-chave
+
+§ PARÁGRAFO 6 - Pontos Positivos:
+   - "Acreditamos que vale aprofundar no deal pelas seguintes razões..."
+   - Lista de 3-5 razões com justificativa
+
+§ PARÁGRAFO 7 - Pontos de Atenção:
+   - "Os principais pontos que precisamos aprofundar são..."
+   - Lista de 3-5 riscos/validações pendentes
+   - Plano de mitigação preliminar
+
+REGRAS:
+- Tom profissional e analítico
+- Parágrafos de 4-6 linhas cada
+- Sem títulos ou bullets no texto (parágrafos corridos)
+- Separar parágrafos com linha em branco
+"""
+
+
+def build_intro_messages(
     facts: Dict[str, Any],
-    rag_context: Optional[str] = None,
-    model: str = "gpt-4o",
-    temperature: float = 0.25
-) -> str:
+    rag_context: Optional[str] = None
+) -> List[Any]:
     """
-    Gera seção de Introdução COMPLETA para Memo Search Fund.
-    
-    EXTENSÃO: 5-7 parágrafos com contexto completo do deal.
-    
-    Args:
-        facts: Dict com facts estruturados
-        rag_context: Contexto extraído do documento (opcional)
-        model: Modelo OpenAI a usar
-        temperature: Criatividade (0.0-1.0)
+    Monta as mensagens (system + prompt) da seção sem chamar o LLM.
     
-    Returns:
-        Texto da introdução (5-7 parágrafos)
+    Usado por generate_intro_section e pela geração em lote do orchestrator.
     """
-    apikey = os.getenv("OPENAI_API_KEY")
-    if not apikey:
-        raise ValueError("OPENAI_API_KEY não encontrada no ambiente")
-
-    llm = ChatOpenAI(model=model, api_key=apikey, temperature=temperature)
+    from langchain_core.messages import HumanMessage
 
     # ===== CONSTRÓI SEÇÕES DE FACTS =====
     identification_section = build_facts_section(
@@ -121,7 +152,7 @@ def generate_intro_section(
     company_name = idf.get("company_name") or "a empresa"
 
     # ========== MONTA PROMPT ==========
-    prompt = f"""
+    parts = [f"""
 Você é um analista sênior de private equity focado em Search Funds, escrevendo a SEÇÃO INTRODUÇÃO de um MEMO COMPLETO para comitê de investimento da Spectra Capital.
 
 IMPORTANTE: Este é um MEMO COMPLETO (não short memo), portanto deve ser mais extenso e detalhado.
@@ -144,66 +175,51 @@ RETORNOS:
 
 QUALITATIVO:
 {qualitative_section}
-"""
+"""]
 
     if rag_context:
-        prompt += f"""
+        parts.append(f"""
 ═══════════════════════════════════════════════════════════════════════
 CONTEXTO DO DOCUMENTO ORIGINAL
 ═══════════════════════════════════════════════════════════════════════
 
 {rag_context}
-"""
-
-    prompt += f"""
-═══════════════════════════════════════════════════════════════════════
-ESTRUTURA OBRIGATÓRIA (5-7 parágrafos - MEMO COMPLETO)
-═══════════════════════════════════════════════════════════════════════
-
-§ PARÁGRAFO 1 - Abertura e Contexto:
-   - "A {investor_name} (search liderado por {searcher_names}, que iniciou seu período de busca em {search_start_date}) está avaliando a aquisição da {company_name}..."
-   - Breve descrição do negócio e setor
-
-§ PARÁGRAFO 2 - Estrutura da Transação:
-   - Participação, EV, múltiplo de entrada
-   - Detalhe completo: à vista, seller note, earnout
-   - Análise da atratividade da estrutura
-
-§ PARÁGRAFO 3 - Tese de Investimento:
-   - Por que este deal faz sentido
-   - Principais drivers de valor
-   - Opcionalidades de crescimento
-
-§ PARÁGRAFO 4 - Destaques Financeiros:
-   - Receita, EBITDA, margens atuais
-   - Histórico de crescimento (CAGR)
-   - Conversão de caixa e alavancagem
-
-§ PARÁGRAFO 5 - Retornos Esperados:
-   - IRR e MOIC no cenário base
-   - Premissas principais
-   - Sensibilidade a variáveis-chave
-
-§ PARÁGRAFO 6 - Pontos Positivos:
-   - "Acreditamos que vale aprofundar no deal pelas seguintes razões..."
-   - Lista de 3-5 razões com justificativa
-
-§ PARÁGRAFO 7 - Pontos de Atenção:
-   - "Os principais pontos que precisamos aprofundar são..."
-   - Lista de 3-5 riscos/validações pendentes
-   - Plano de mitigação preliminar
-
-REGRAS:
-- Tom profissional e analítico
-- Parágrafos de 4-6 linhas cada
-- Sem títulos ou bullets no texto (parágrafos corridos)
-- Separar parágrafos com linha em branco
-"""
-
-    messages = [
-        SystemMessage(content="Você é um analista sênior de PE/Search Funds escrevendo um MEMO COMPLETO para IC da Spectra Capital."),
+""")
+
+    parts.append(_STRUCTURE_BLOCK.format(
+        investor_name=investor_name,
+        searcher_names=searcher_names,
+        search_start_date=search_start_date,
+        company_name=company_name,
+    ))
+    prompt = "".join(parts)
+
+    return [
+        system_message(ANALYST_PERSONA),
         HumanMessage(content=prompt),
     ]
+
+
+def generate_intro_section(
+    facts: Dict[str, Any],
+    rag_context: Optional[str] = None,
+    model: str = "gpt-4o",
+    temperature: float = 0.25
+) -> str:
+    """
+    Gera seção de Introdução COMPLETA para Memo Search Fund.
+    
+    EXTENSÃO: 5-7 parágrafos com contexto completo do deal.
+    
+    Args:
+        facts: Dict com facts estruturados
+        rag_context: Contexto extraído do documento (opcional)
+        model: Modelo OpenAI a usar
+        temperature: Criatividade (0.0-1.0)
     
-    result = llm.invoke(messages)
+    Returns:
+        Texto da introdução (5-7 parágrafos)
+    """
+    llm = get_chat_model(model, temperature)
+    result = llm.invoke(build_intro_messages(facts, rag_context))
     return fix_number_formatting(result.content.strip())
@@ -4,32 +4,74 @@ Agente de Mercado - Memo Completo Search Fund
 Gera a seção "Mercado" do memo completo (5-7 parágrafos).
 """
 
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
-import os
+from typing import Dict, Any, List, Optional
 
 from facts.builder import build_facts_section
 from tipo_memorando._base.format_utils import get_currency_symbol, get_currency_label
 from ..validator import fix_number_formatting
+from ._messages import ANALYST_PERSONA, system_message
+from ._llm import get_chat_model
 
 
-def generate_market_section(
+# Bloco ESTRUTURA OBRIGATÓRIA (estático; vai no prompt de sistema, após ANALYST_PERSONA)
+_STRUCTURE_BLOCK = """
+═══════════════════════════════════════════════════════════════════════
+ESTRUTURA OBRIGATÓRIA (5-7 parágrafos - MEMO COMPLETO)
+═══════════════════════════════════════════════════════════════════════
+
+§ PARÁGRAFO 1 - Definição do Mercado:
+  - O que é o mercado/setor
+  - Tamanho (TAM/SAM/SOM) se disponível
+  - Características principais
+
+§ PARÁGRAFO 2 - Dinâmica de Crescimento:
+  - Taxa de crescimento histórica e projetada
+  - Drivers de crescimento
+  - Tendências estruturais
+
+§ PARÁGRAFO 3 - Estrutura Competitiva:
+  - Fragmentação vs concentração
+  - Principais players e market share
+  - Posicionamento da empresa
+
+§ PARÁGRAFO 4 - Análise de Competidores:
+  - Detalhamento dos principais competidores
+  - Comparativo de ofertas e posicionamento
+  - Validações do searcher
+
+§ PARÁGRAFO 5 - Diferenciais Competitivos:
+  - OBRIGATÓRIO: "De acordo com o searcher, os principais diferenciais são..."
+  - Lista detalhada: "(i) [diferencial 1], (ii) [diferencial 2]..."
+  - Análise crítica de cada diferencial
+
+§ PARÁGRAFO 6 - Barreiras à Entrada:
+  - Switching costs, network effects
+  - Regulação, certificações
+  - Escala e investimentos necessários
+
+§ PARÁGRAFO 7 - Riscos de Mercado:
+  - Ameaças competitivas
+  - Mudanças regulatórias
+  - Disrupção tecnológica
+
+REGRA DE OURO:
+- SEMPRE atribuir diferenciais ao searcher
+- Análise crítica, não apenas descritiva
+
+Gere apenas texto corrido (SEM títulos, SEM markdown).
+"""
+
+
+def build_market_messages(
     facts: Dict[str, Any],
-    rag_context: Optional[str] = None,
-    model: str = "gpt-4o",
-    temperature: float = 0.25
-) -> str:
+    rag_context: Optional[str] = None
+) -> List[Any]:
     """
-    Gera seção Mercado COMPLETA para Memo Search Fund.
+    Monta as mensagens (system + prompt) da seção sem chamar o LLM.
     
-    EXTENSÃO: 5-7 parágrafos com análise profunda de mercado e competição.
+    Usado por generate_market_section e pela geração em lote do orchestrator.
     """
-    apikey = os.getenv("OPENAI_API_KEY")
-    if not apikey:
-        raise ValueError("OPENAI_API_KEY não encontrada no ambiente")
-
-    llm = ChatOpenAI(model=model, api_key=apikey, temperature=temperature)
+    from langchain_core.messages import HumanMessage
 
     # ===== FACTS =====
     identification_section = build_facts_section(
@@ -55,7 +97,7 @@ def generate_market_section(
         }
     )
 
-    prompt = f"""
+    parts = [f"""
 Você é um analista sênior de PE/Search Funds, escrevendo a SEÇÃO MERCADO de um MEMO COMPLETO para IC da Spectra Capital.
 
 ═══════════════════════════════════════════════════════════════════════
@@ -67,68 +109,37 @@ IDENTIFICAÇÃO:
 
 QUALITATIVO:
 {qualitative_section}
-"""
+"""]
 
     if rag_context:
-        prompt += f"""
+        parts.append(f"""
 ═══════════════════════════════════════════════════════════════════════
 CONTEXTO DO DOCUMENTO
 ═══════════════════════════════════════════════════════════════════════
 
 {rag_context}
-"""
+""")
 
-    prompt += """
-═══════════════════════════════════════════════════════════════════════
-ESTRUTURA OBRIGATÓRIA (5-7 parágrafos - MEMO COMPLETO)
-═══════════════════════════════════════════════════════════════════════
-
-§ PARÁGRAFO 1 - Definição do Mercado:
-  - O que é o mercado/setor
-  - Tamanho (TAM/SAM/SOM) se disponível
-  - Características principais
+    prompt = "".join(parts)
 
-§ PARÁGRAFO 2 - Dinâmica de Crescimento:
-  - Taxa de crescimento histórica e projetada
-  - Drivers de crescimento
-  - Tendências estruturais
-
-§ PARÁGRAFO 3 - Estrutura Competitiva:
-  - Fragmentação vs concentração
-  - Principais players e market share
-  - Posicionamento da empresa
-
-§ PARÁGRAFO 4 - Análise de Competidores:
-  - Detalhamento dos principais competidores
-  - Comparativo de ofertas e posicionamento
-  - Validações do searcher
-
-§ PARÁGRAFO 5 - Diferenciais Competitivos:
-  - OBRIGATÓRIO: "De acordo com o searcher, os principais diferenciais são..."
-  - Lista detalhada: "(i) [diferencial 1], (ii) [diferencial 2]..."
-  - Análise crítica de cada diferencial
-
-§ PARÁGRAFO 6 - Barreiras à Entrada:
-  - Switching costs, network effects
-  - Regulação, certificações
-  - Escala e investimentos necessários
-
-§ PARÁGRAFO 7 - Riscos de Mercado:
-  - Ameaças competitivas
-  - Mudanças regulatórias
-  - Disrupção tecnológica
-
-REGRA DE OURO:
-- SEMPRE atribuir diferenciais ao searcher
-- Análise crítica, não apenas descritiva
-
-Gere apenas texto corrido (SEM títulos, SEM markdown).
-"""
-
-    messages = [
-        SystemMessage(content="Você é um analista sênior de PE/Search Funds escrevendo MEMO COMPLETO para Spectra Capital."),
+    # Estrutura no prompt de sistema: prefixo fixo antes dos dados do deal
+    return [
+        system_message(ANALYST_PERSONA + _STRUCTURE_BLOCK),
         HumanMessage(content=prompt),
     ]
+
+
+def generate_market_section(
+    facts: Dict[str, Any],
+    rag_context: Optional[str] = None,
+    model: str = "gpt-4o",
+    temperature: float = 0.25
+) -> str:
+    """
+    Gera seção Mercado COMPLETA para Memo Search Fund.
     
-    result = llm.invoke(messages)
+    EXTENSÃO: 5-7 parágrafos com análise profunda de mercado e competição.
+    """
+    llm = get_chat_model(model, temperature)
+    result = llm.invoke(build_market_messages(facts, rag_context))
     return fix_number_formatting(result.content.strip())
@@ -4,84 +4,18 @@ Agente de Projeções - Memo Completo Search Fund
 Gera a seção "Projeções Financeiras" do memo completo (6-8 parágrafos).
 """
 
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
-import os
+from typing import Dict, Any, List, Optional
 import json
 
 from facts.builder import build_facts_section
 from tipo_memorando._base.format_utils import get_currency_symbol, get_currency_label
 from ..validator import fix_number_formatting
+from ._messages import ANALYST_PERSONA, system_message
+from ._llm import get_chat_model
 
 
-def generate_projections_section(
-    facts: Dict[str, Any],
-    rag_context: Optional[str] = None,
-    model: str = "gpt-4o",
-    temperature: float = 0.25
-) -> str:
-    """
-    Gera seção Projeções Financeiras COMPLETA para Memo Search Fund.
-    
-    EXTENSÃO: 6-8 parágrafos com análise de 3 cenários (base/upside/downside).
-    """
-    apikey = os.getenv("OPENAI_API_KEY")
-    if not apikey:
-        raise ValueError("OPENAI_API_KEY não encontrada no ambiente")
-
-    llm = ChatOpenAI(model=model, api_key=apikey, temperature=temperature)
-
-    trx = facts.get("transaction_structure", {})
-    currency = trx.get("currency") or "BRL"
-    currency_label = get_currency_label(currency)
-
-    # Facts de projeções padrão
-    projections_section = build_facts_section(
-        facts, "saida",
-        {
-            "revenue_exit_mm": f"Receita na saída ({currency_label})",
-            "revenue_cagr_projected_pct": "CAGR receita projetado (%)",
-            "ebitda_exit_mm": f"EBITDA na saída ({currency_label})",
-            "ebitda_margin_exit_pct": "Margem EBITDA na saída (%)",
-            "exit_year": "Ano de saída",
-            "exit_multiple_ev_ebitda": "Múltiplo de saída",
-            "projection_period": "Período de projeção",
-            "growth_drivers": "Drivers de crescimento",
-        }
-    )
-    
-    # Facts de tabelas de projeções (se disponível)
-    projections_table = facts.get("projections_table", {})
-    projections_table_section = ""
-    if projections_table:
-        projections_table_section = f"""
-TABELAS DE PROJEÇÕES:
-{json.dumps(projections_table, indent=2, ensure_ascii=False)}
-"""
-
-    prompt = f"""
-Você é um analista sênior de PE/Search Funds, escrevendo a SEÇÃO PROJEÇÕES FINANCEIRAS de um MEMO COMPLETO para IC da Spectra Capital.
-
-═══════════════════════════════════════════════════════════════════════
-DADOS DO DEAL
-═══════════════════════════════════════════════════════════════════════
-
-PROJEÇÕES:
-{projections_section}
-{projections_table_section}
-"""
-
-    if rag_context:
-        prompt += f"""
-═══════════════════════════════════════════════════════════════════════
-CONTEXTO DO DOCUMENTO
-═══════════════════════════════════════════════════════════════════════
-
-{rag_context}
-"""
-
-    prompt += """
+# Bloco ESTRUTURA OBRIGATÓRIA (estático; vai no prompt de sistema, após ANALYST_PERSONA)
+_STRUCTURE_BLOCK = """
 ═══════════════════════════════════════════════════════════════════════
 ESTRUTURA OBRIGATÓRIA (6-8 parágrafos - MEMO COMPLETO)
 ═══════════════════════════════════════════════════════════════════════
@@ -134,10 +68,87 @@ Gere apenas texto corrido (SEM títulos, SEM markdown).
 Se houver tabelas de projeções nos facts, incorpore os dados nas análises.
 """
 
-    messages = [
-        SystemMessage(content="Você é um analista sênior de PE/Search Funds escrevendo MEMO COMPLETO para Spectra Capital."),
+
+def build_projections_messages(
+    facts: Dict[str, Any],
+    rag_context: Optional[str] = None
+) -> List[Any]:
+    """
+    Monta as mensagens (system + prompt) da seção sem chamar o LLM.
+    
+    Usado por generate_projections_section e pela geração em lote do orchestrator.
+    """
+    from langchain_core.messages import HumanMessage
+
+    trx = facts.get("transaction_structure", {})
+    currency = trx.get("currency") or "BRL"
+    currency_label = get_currency_label(currency)
+
+    # Facts de projeções padrão
+    projections_section = build_facts_section(
+        facts, "saida",
+        {
+            "revenue_exit_mm": f"Receita na saída ({currency_label})",
+            "revenue_cagr_projected_pct": "CAGR receita projetado (%)",
+            "ebitda_exit_mm": f"EBITDA na saída ({currency_label})",
+            "ebitda_margin_exit_pct": "Margem EBITDA na saída (%)",
+            "exit_year": "Ano de saída",
+            "exit_multiple_ev_ebitda": "Múltiplo de saída",
+            "projection_period": "Período de projeção",
+            "growth_drivers": "Drivers de crescimento",
+        }
+    )
+    
+    # Facts de tabelas de projeções (se disponível)
+    projections_table = facts.get("projections_table", {})
+    projections_table_section = ""
+    if projections_table:
+        projections_table_section = f"""
+TABELAS DE PROJEÇÕES:
+{json.dumps(projections_table, ensure_ascii=False, separators=(',', ':'))}
+"""
+
+    parts = [f"""
+Você é um analista sênior de PE/Search Funds, escrevendo a SEÇÃO PROJEÇÕES FINANCEIRAS de um MEMO COMPLETO para IC da Spectra Capital.
+
+═══════════════════════════════════════════════════════════════════════
+DADOS DO DEAL
+═══════════════════════════════════════════════════════════════════════
+
+PROJEÇÕES:
+{projections_section}
+{projections_table_section}
+"""]
+
+    if rag_context:
+        parts.append(f"""
+═══════════════════════════════════════════════════════════════════════
+CONTEXTO DO DOCUMENTO
+═══════════════════════════════════════════════════════════════════════
+
+{rag_context}
+""")
+
+    prompt = "".join(parts)
+
+    # Estrutura no prompt de sistema: prefixo fixo antes dos dados do deal
+    return [
+        system_message(ANALYST_PERSONA + _STRUCTURE_BLOCK),
         HumanMessage(content=prompt),
     ]
+
+
+def generate_projections_section(
+    facts: Dict[str, Any],
+    rag_context: Optional[str] = None,
+    model: str = "gpt-4o",
+    temperature: float = 0.25
+) -> str:
+    """
+    Gera seção Projeções Financeiras COMPLETA para Memo Search Fund.
     
-    result = llm.invoke(messages)
+    EXTENSÃO: 6-8 parágrafos com análise de 3 cenários (base/upside/downside).
+    """
+    llm = get_chat_model(model, temperature)
+    result = llm.invoke(build_projections_messages(facts, rag_context))
     return fix_number_formatting(result.content.strip())
@@ -4,79 +4,18 @@ Agente de Retornos - Memo Completo Search Fund
 Gera a seção "Retornos Esperados" do memo completo (5-7 parágrafos).
 """
 
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
-import os
+from typing import Dict, Any, List, Optional
 import json
 
 from facts.builder import build_facts_section
 from tipo_memorando._base.format_utils import get_currency_symbol, get_currency_label
 from ..validator import fix_number_formatting
+from ._messages import ANALYST_PERSONA, system_message
+from ._llm import get_chat_model
 
 
-def generate_retornos_esperados_section(
-    facts: Dict[str, Any],
-    rag_context: Optional[str] = None,
-    model: str = "gpt-4o",
-    temperature: float = 0.25
-) -> str:
-    """
-    Gera seção Retornos Esperados COMPLETA para Memo Search Fund.
-    
-    EXTENSÃO: 5-7 parágrafos com análise detalhada de retornos por cenário.
-    """
-    apikey = os.getenv("OPENAI_API_KEY")
-    if not apikey:
-        raise ValueError("OPENAI_API_KEY não encontrada no ambiente")
-
-    llm = ChatOpenAI(model=model, api_key=apikey, temperature=temperature)
-
-    trx = facts.get("transaction_structure", {})
-    currency = trx.get("currency") or "BRL"
-    currency_label = get_currency_label(currency)
-    
-    # Facts de retornos padrão
-    returns_section = build_facts_section(
-        facts, "returns",
-        {
-            "irr_pct": "IRR base (%)",
-            "moic": "MOIC base (x)",
-            "holding_period_years": "Holding period (anos)",
-        }
-    )
-    
-    # Facts de tabelas de retornos (se disponível)
-    returns_table = facts.get("returns_table", {})
-    returns_table_section = ""
-    if returns_table:
-        returns_table_section = f"""
-TABELAS DE RETORNOS:
-{json.dumps(returns_table, indent=2, ensure_ascii=False)}
-"""
-
-    prompt = f"""
-Você é um analista sênior de PE/Search Funds, escrevendo a SEÇÃO RETORNOS ESPERADOS de um MEMO COMPLETO para IC da Spectra Capital.
-
-═══════════════════════════════════════════════════════════════════════
-DADOS DO DEAL
-═══════════════════════════════════════════════════════════════════════
-
-RETORNOS:
-{returns_section}
-{returns_table_section}
-"""
-
-    if rag_context:
-        prompt += f"""
-═══════════════════════════════════════════════════════════════════════
-CONTEXTO DO DOCUMENTO
-═══════════════════════════════════════════════════════════════════════
-
-{rag_context}
-"""
-
-    prompt += """
+# Bloco ESTRUTURA OBRIGATÓRIA (estático; vai no prompt de sistema, após ANALYST_PERSONA)
+_STRUCTURE_BLOCK = """
 ═══════════════════════════════════════════════════════════════════════
 ESTRUTURA OBRIGATÓRIA (5-7 parágrafos - MEMO COMPLETO)
 ═══════════════════════════════════════════════════════════════════════
@@ -123,10 +62,82 @@ Gere apenas texto corrido (SEM títulos, SEM markdown).
 Se houver tabelas de retornos nos facts, incorpore os dados nas análises.
 """
 
-    messages = [
-        SystemMessage(content="Você é um analista sênior de PE/Search Funds escrevendo MEMO COMPLETO para Spectra Capital."),
+
+def build_retornos_esperados_messages(
+    facts: Dict[str, Any],
+    rag_context: Optional[str] = None
+) -> List[Any]:
+    """
+    Monta as mensagens (system + prompt) da seção sem chamar o LLM.
+    
+    Usado por generate_retornos_esperados_section e pela geração em lote do orchestrator.
+    """
+    from langchain_core.messages import HumanMessage
+
+    trx = facts.get("transaction_structure", {})
+    currency = trx.get("currency") or "BRL"
+    currency_label = get_currency_label(currency)
+    
+    # Facts de retornos padrão
+    returns_section = build_facts_section(
+        facts, "returns",
+        {
+            "irr_pct": "IRR base (%)",
+            "moic": "MOIC base (x)",
+            "holding_period_years": "Holding period (anos)",
+        }
+    )
+    
+    # Facts de tabelas de retornos (se disponível)
+    returns_table = facts.get("returns_table", {})
+    returns_table_section = ""
+    if returns_table:
+        returns_table_section = f"""
+TABELAS DE RETORNOS:
+{json.dumps(returns_table, ensure_ascii=False, separators=(',', ':'))}
+"""
+
+    parts = [f"""
+Você é um analista sênior de PE/Search Funds, escrevendo a SEÇÃO RETORNOS ESPERADOS de um MEMO COMPLETO para IC da Spectra Capital.
+
+═══════════════════════════════════════════════════════════════════════
+DADOS DO DEAL
+═══════════════════════════════════════════════════════════════════════
+
+RETORNOS:
+{returns_section}
+{returns_table_section}
+"""]
+
+    if rag_context:
+        parts.append(f"""
+═══════════════════════════════════════════════════════════════════════
+CONTEXTO DO DOCUMENTO
+═══════════════════════════════════════════════════════════════════════
+
+{rag_context}
+""")
+
+    prompt = "".join(parts)
+
+    # Estrutura no prompt de sistema: prefixo fixo antes dos dados do deal
+    return [
+        system_message(ANALYST_PERSONA + _STRUCTURE_BLOCK),
         HumanMessage(content=prompt),
     ]
+
+
+def generate_retornos_esperados_section(
+    facts: Dict[str, Any],
+    rag_context: Optional[str] = None,
+    model: str = "gpt-4o",
+    temperature: float = 0.25
+) -> str:
+    """
+    Gera seção Retornos Esperados COMPLETA para Memo Search Fund.
     
-    result = llm.invoke(messages)
+    EXTENSÃO: 5-7 parágrafos com análise detalhada de retornos por cenário.
+    """
+    llm = get_chat_model(model, temperature)
+    result = llm.invoke(build_retornos_esperados_messages(facts, rag_context))
     return fix_number_formatting(result.content.strip())
@@ -4,68 +4,17 @@ Agente de Riscos - Memo Completo Search Fund
 Gera a seção "Riscos e Mitigações" do memo completo (5-7 parágrafos).
 """
 
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
-import os
+from typing import Dict, Any, List, Optional
 
 from facts.builder import build_facts_section
 from tipo_memorando._base.format_utils import get_currency_symbol, get_currency_label
 from ..validator import fix_number_formatting
+from ._messages import ANALYST_PERSONA, system_message
+from ._llm import get_chat_model
 
 
-def generate_risks_section(
-    facts: Dict[str, Any],
-    rag_context: Optional[str] = None,
-    model: str = "gpt-4o",
-    temperature: float = 0.25
-) -> str:
-    """
-    Gera seção Riscos e Mitigações COMPLETA para Memo Search Fund.
-    
-    EXTENSÃO: 5-7 parágrafos com análise detalhada de riscos.
-    """
-    apikey = os.getenv("OPENAI_API_KEY")
-    if not apikey:
-        raise ValueError("OPENAI_API_KEY não encontrada no ambiente")
-
-    llm = ChatOpenAI(model=model, api_key=apikey, temperature=temperature)
-
-    qualitative_section = build_facts_section(
-        facts, "qualitative",
-        {
-            "key_risks": "Principais riscos",
-            "key_person_risk": "Key person risk",
-            "client_concentration": "Concentração de clientes",
-            "supplier_concentration": "Concentração de fornecedores",
-            "regulatory_risks": "Riscos regulatórios",
-            "competitive_risks": "Riscos competitivos",
-            "operational_risks": "Riscos operacionais",
-            "mitigations": "Mitigações propostas",
-        }
-    )
-
-    prompt = f"""
-Você é um analista sênior de PE/Search Funds, escrevendo a SEÇÃO RISCOS E MITIGAÇÕES de um MEMO COMPLETO para IC da Spectra Capital.
-
-═══════════════════════════════════════════════════════════════════════
-DADOS DO DEAL
-═══════════════════════════════════════════════════════════════════════
-
-QUALITATIVO:
-{qualitative_section}
-"""
-
-    if rag_context:
-        prompt += f"""
-═══════════════════════════════════════════════════════════════════════
-CONTEXTO DO DOCUMENTO
-═══════════════════════════════════════════════════════════════════════
-
-{rag_context}
-"""
-
-    prompt += """
+# Bloco ESTRUTURA OBRIGATÓRIA (estático; vai no prompt de sistema, após ANALYST_PERSONA)
+_STRUCTURE_BLOCK = """
 ═══════════════════════════════════════════════════════════════════════
 ESTRUTURA OBRIGATÓRIA (5-7 parágrafos - MEMO COMPLETO)
 ═══════════════════════════════════════════════════════════════════════
@@ -119,10 +68,72 @@ REGRA DE OURO:
 Gere apenas texto corrido (SEM títulos, SEM markdown).
 """
 
-    messages = [
-        SystemMessage(content="Você é um analista sênior de PE/Search Funds escrevendo MEMO COMPLETO para Spectra Capital."),
+
+def build_risks_messages(
+    facts: Dict[str, Any],
+    rag_context: Optional[str] = None
+) -> List[Any]:
+    """
+    Monta as mensagens (system + prompt) da seção sem chamar o LLM.
+    
+    Usado por generate_risks_section e pela geração em lote do orchestrator.
+    """
+    from langchain_core.messages import HumanMessage
+
+    qualitative_section = build_facts_section(
+        facts, "qualitative",
+        {
+            "key_risks": "Principais riscos",
+            "key_person_risk": "Key person risk",
+            "client_concentration": "Concentração de clientes",
+            "supplier_concentration": "Concentração de fornecedores",
+            "regulatory_risks": "Riscos regulatórios",
+            "competitive_risks": "Riscos competitivos",
+            "operational_risks": "Riscos operacionais",
+            "mitigations": "Mitigações propostas",
+        }
+    )
+
+    parts = [f"""
+Você é um analista sênior de PE/Search Funds, escrevendo a SEÇÃO RISCOS E MITIGAÇÕES de um MEMO COMPLETO para IC da Spectra Capital.
+
+═══════════════════════════════════════════════════════════════════════
+DADOS DO DEAL
+═══════════════════════════════════════════════════════════════════════
+
+QUALITATIVO:
+{qualitative_section}
+"""]
+
+    if rag_context:
+        parts.append(f"""
+═══════════════════════════════════════════════════════════════════════
+CONTEXTO DO DOCUMENTO
+═══════════════════════════════════════════════════════════════════════
+
+{rag_context}
+""")
+
+    prompt = "".join(parts)
+
+    # Estrutura no prompt de sistema: prefixo fixo antes dos dados do deal
+    return [
+        system_message(ANALYST_PERSONA + _STRUCTURE_BLOCK),
         HumanMessage(content=prompt),
     ]
+
+
+def generate_risks_section(
+    facts: Dict[str, Any],
+    rag_context: Optional[str] = None,
+    model: str = "gpt-4o",
+    temperature: float = 0.25
+) -> str:
+    """
+    Gera seção Riscos e Mitigações COMPLETA para Memo Search Fund.
     
-    result = llm.invoke(messages)
+    EXTENSÃO: 5-7 parágrafos com análise detalhada de riscos.
+    """
+    llm = get_chat_model(model, temperature)
+    result = llm.invoke(build_risks_messages(facts, rag_context))
     return fix_number_formatting(result.content.strip())
@@ -4,32 +4,70 @@ Agente de Transação - Memo Completo Search Fund
 Gera a seção "Estrutura da Transação" do memo completo (5-7 parágrafos).
 """
 
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
-import os
+from typing import Dict, Any, List, Optional
 
 from facts.builder import build_facts_section
 from tipo_memorando._base.format_utils import get_currency_symbol, get_currency_label
 from ..validator import fix_number_formatting
+from ._messages import ANALYST_PERSONA, system_message
+from ._llm import get_chat_model
 
 
-def generate_transaction_section(
+# Bloco ESTRUTURA OBRIGATÓRIA (estático; vai no prompt de sistema, após ANALYST_PERSONA)
+_STRUCTURE_BLOCK = """
+═══════════════════════════════════════════════════════════════════════
+ESTRUTURA OBRIGATÓRIA (5-7 parágrafos - MEMO COMPLETO)
+═══════════════════════════════════════════════════════════════════════
+
+§ PARÁGRAFO 1 - Visão Geral da Transação:
+  - Participação adquirida, EV, Equity Value
+  - Múltiplo de entrada e período de referência
+  - Comparação com transações similares
+
+§ PARÁGRAFO 2 - Estrutura de Pagamento:
+  - Pagamento à vista: valor e múltiplo implícito
+  - Seller note: valor, prazo, juros, garantias
+  - Earnout: valor máximo, condições, período
+
+§ PARÁGRAFO 3 - Análise da Atratividade:
+  - Por que a estrutura é favorável (ou não)
+  - Alinhamento de incentivos com vendedor
+  - Proteções e garantias
+
+§ PARÁGRAFO 4 - Estrutura de Financiamento:
+  - Equity vs dívida de aquisição
+  - Termos da dívida (se aplicável)
+  - Capacidade de debt service
+
+§ PARÁGRAFO 5 - Governança e Direitos:
+  - Direitos de veto, tag-along, drag-along
+  - Composição do board
+  - Papel do vendedor pós-transação
+
+§ PARÁGRAFO 6 - Comparação com Benchmarks:
+  - Múltiplo vs deals de Search Fund comparáveis
+  - % de seller finance vs médias de mercado
+  - Análise de prêmio/desconto
+
+§ PARÁGRAFO 7 - Riscos da Estrutura:
+  - Riscos de execução
+  - Contingências e cláusulas de ajuste
+  - Pontos de negociação pendentes
+
+Gere apenas texto corrido (SEM títulos, SEM markdown).
+"""
+
+
+def build_transaction_messages(
     facts: Dict[str, Any],
-    rag_context: Optional[str] = None,
-    model: str = "gpt-4o",
-    temperature: float = 0.25
-) -> str:
+    rag_context: Optional[str] = None
+) -> List[Any]:
     """
-    Gera seção Estrutura da Transação COMPLETA para Memo Search Fund.
+    Monta as mensagens (system + prompt) da seção sem chamar o LLM.
     
-    EXTENSÃO: 5-7 parágrafos com análise detalhada da estrutura.
+    Usado por generate_transaction_section e pela geração em lote do orchestrator.
     """
-    apikey = os.getenv("OPENAI_API_KEY")
-    if not apikey:
-        raise ValueError("OPENAI_API_KEY não encontrada no ambiente")
-
-    llm = ChatOpenAI(model=model, api_key=apikey, temperature=temperature)
+    from langchain_core.messages import HumanMessage
 
     trx = facts.get("transaction_structure", {})
     currency = trx.get("currency") or "BRL"
@@ -65,7 +103,7 @@ def generate_transaction_section(
         }
     )
 
-    prompt = f"""
+    parts = [f"""
 Você é um analista sênior de PE/Search Funds, escrevendo a SEÇÃO ESTRUTURA DA TRANSAÇÃO de um MEMO COMPLETO para IC da Spectra Capital.
 
 ═══════════════════════════════════════════════════════════════════════
@@ -77,64 +115,37 @@ TRANSAÇÃO:
 
 RETORNOS:
 {returns_section}
-"""
+"""]
 
     if rag_context:
-        prompt += f"""
+        parts.append(f"""
 ═══════════════════════════════════════════════════════════════════════
 CONTEXTO DO DOCUMENTO
 ═══════════════════════════════════════════════════════════════════════
 
 {rag_context}
-"""
+""")
 
-    prompt += """
-═══════════════════════════════════════════════════════════════════════
-ESTRUTURA OBRIGATÓRIA (5-7 parágrafos - MEMO COMPLETO)
-═══════════════════════════════════════════════════════════════════════
-
-§ PARÁGRAFO 1 - Visão Geral da Transação:
-  - Participação adquirida, EV, Equity Value
-  - Múltiplo de entrada e período de referência
-  - Comparação com transações similares
+    prompt = "".join(parts)
 
-§ PARÁGRAFO 2 - Estrutura de Pagamento:
-  - Pagamento à vista: valor e múltiplo implícito
-  - Seller note: valor, prazo, juros, garantias
-  - Earnout: valor máximo, condições, período
-
-§ PARÁGRAFO 3 - Análise da Atratividade:
-  - Por que a estrutura é favorável (ou não)
-  - Alinhamento de incentivos com vendedor
-  - Proteções e garantias
-
-§ PARÁGRAFO 4 - Estrutura de Financiamento:
-  - Equity vs dívida de aquisição
-  - Termos da dívida (se aplicável)
-  - Capacidade de debt service
-
-§ PARÁGRAFO 5 - Governança e Direitos:
-  - Direitos de veto, tag-along, drag-along
-  - Composição do board
-  - Papel do vendedor pós-transação
-
-§ PARÁGRAFO 6 - Comparação com Benchmarks:
-  - Múltiplo vs deals de Search Fund comparáveis
-  - % de seller finance vs médias de mercado
-  - Análise de prêmio/desconto
-
-§ PARÁGRAFO 7 - Riscos da Estrutura:
-  - Riscos de execução
-  - Contingências e cláusulas de ajuste
-  - Pontos de negociação pendentes
-
-Gere apenas texto corrido (SEM títulos, SEM markdown).
-"""
-
-    messages = [
-        SystemMessage(content="Você é um analista sênior de PE/Search Funds escrevendo MEMO COMPLETO para Spectra Capital."),
+    # Estrutura no prompt de sistema: prefixo fixo antes dos dados do deal
+    return [
+        system_message(ANALYST_PERSONA + _STRUCTURE_BLOCK),
         HumanMessage(content=prompt),
     ]
+
+
+def generate_transaction_section(
+    facts: Dict[str, Any],
+    rag_context: Optional[str] = None,
+    model: str = "gpt-4o",
+    temperature: float = 0.25
+) -> str:
+    """
+    Gera seção Estrutura da Transação COMPLETA para Memo Search Fund.
     
-    result = llm.invoke(messages)
+    EXTENSÃO: 5-7 parágrafos com análise detalhada da estrutura.
+    """
+    llm = get_chat_model(model, temperature)
+    result = llm.invoke(build_transaction_messages(facts, rag_context))
     return fix_number_formatting(result.content.strip())
@@ -37,6 +37,41 @@ from .agents import (
 # ROUTER PRINCIPAL
 # ============================================================================
 
+# Nome da seção (e aliases) → função de geração do agente (montada uma vez no
+# import, em vez de a cada chamada de generate_section)
+_SECTION_GENERATORS = {
+    "intro": generate_intro_section,
+    "introduction": generate_intro_section,
+    "introducao": generate_intro_section,
+    "overview": generate_intro_section,  # Alias para overview
+    "company": generate_company_section,
+    "empresa": generate_company_section,
+    "market": generate_market_section,
+    "mercado": generate_market_section,
+    "financials": generate_financials_section,
+    "financeiro": generate_financials_section,
+    "historico_financeiro": generate_financials_section,
+    "transaction": generate_transaction_section,
+    "transacao": generate_transaction_section,
+    "estrutura": generate_transaction_section,
+    "projections": generate_projections_section,
+    "projecoes": generate_projections_section,
+    "projecoes_financeiras": generate_projections_section,
+    "saida": generate_projections_section,
+    "retornos_esperados": generate_retornos_esperados_section,
+    "retornos": generate_retornos_esperados_section,
+    "gestor": generate_gestor_section,
+    "searcher": generate_gestor_section,  # Alias
+    "board_cap_table": generate_board_cap_table_section,
+    "board": generate_board_cap_table_section,
+    "cap_table": generate_board_cap_table_section,
+    "conclusao": generate_conclusao_section,
+    "conclusão": generate_conclusao_section,
+    "risks": generate_risks_section,
+    "riscos": generate_risks_section,
+}
+
+
 def generate_section(
     section_name: str,
     facts: Dict[str, Any],
@@ -57,42 +92,10 @@ def generate_section(
     Returns:
         Texto gerado (5-8 parágrafos)
     """
-    section_map = {
-        "intro": generate_intro_section,
-        "introduction": generate_intro_section,
-        "introducao": generate_intro_section,
-        "overview": generate_intro_section,  # Alias para overview
-        "company": generate_company_section,
-        "empresa": generate_company_section,
-        "market": generate_market_section,
-        "mercado": generate_market_section,
-        "financials": generate_financials_section,
-        "financeiro": generate_financials_section,
-        "historico_financeiro": generate_financials_section,
-        "transaction": generate_transaction_section,
-        "transacao": generate_transaction_section,
-        "estrutura": generate_transaction_section,
-        "projections": generate_projections_section,
-        "projecoes": generate_projections_section,
-        "projecoes_financeiras": generate_projections_section,
-        "saida": generate_projections_section,
-        "retornos_esperados": generate_retornos_esperados_section,
-        "retornos": generate_retornos_esperados_section,
-        "gestor": generate_gestor_section,
-        "searcher": generate_gestor_section,  # Alias
-        "board_cap_table": generate_board_cap_table_section,
-        "board": generate_board_cap_table_section,
-        "cap_table": generate_board_cap_table_section,
-        "conclusao": generate_conclusao_section,
-        "conclusão": generate_conclusao_section,
-        "risks": generate_risks_section,
-        "riscos": generate_risks_section,
-    }
-    
     section_key = section_name.lower().replace("1. ", "").replace("2. ", "").replace("3. ", "").replace(" ", "_")
     
-    if section_key not in section_map:
-        raise ValueError(f"Seção '{section_name}' não implementada. Disponíveis: {list(section_map.keys())}")
+    generator_func = _SECTION_GENERATORS.get(section_key)
+    if generator_func is None:
+        raise ValueError(f"Seção '{section_name}' não implementada. Disponíveis: {list(_SECTION_GENERATORS.keys())}")
     
-    generator_func = section_map[section_key]
     return generator_func(facts, rag_context, model, temperature)
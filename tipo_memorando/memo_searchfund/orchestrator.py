@@ -4,6 +4,13 @@ Orchestrator para Memo Completo Search Fund - Estrutura Fixa de 9 Seções
 ARQUITETURA:
 - Estrutura FIXA de 9 seções (não customizável)
 - Cada seção usa função de geração especializada
+- Contexto RAG de todas as seções obtido em uma única busca em lote
+- Seções geradas em paralelo (asyncio.gather)
+- Cache por conteúdo opcional: seções com mesmos facts/prompt não chamam o LLM
+- Cache semântico opcional para prompts quase idênticos (mesmos facts)
+- Streaming opcional (generate_full_memo_stream): parágrafos entregues à medida que ficam prontos
+- Streaming de tokens de uma seção (generate_section_stream)
+- Geração em uma única chamada opcional (generate_full_memo_single_call)
 - Integração com RAG para contexto por seção
 - Validação de não-redundância entre seções
 
@@ -19,7 +26,11 @@ SEÇÕES FIXAS:
 9. Conclusão → generate_conclusao_section
 """
 
-from typing import Dict, Any, Optional, TYPE_CHECKING
+import asyncio
+import re
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Dict, Any, AsyncIterator, Callable, Iterator, List, Optional, Tuple, TYPE_CHECKING
 from .agents import (
     generate_intro_section,
     generate_gestor_section,
@@ -30,12 +41,36 @@ from .agents import (
     generate_retornos_esperados_section,
     generate_board_cap_table_section,
     generate_conclusao_section,
+    build_intro_messages,
+    build_gestor_messages,
+    build_market_messages,
+    build_company_messages,
+    build_transaction_messages,
+    build_projections_messages,
+    build_retornos_esperados_messages,
+    build_board_cap_table_messages,
+    build_conclusao_messages,
+)
+from .agents._llm import get_chat_model
+from .agents._messages import ANALYST_PERSONA, system_message
+from .validator import fix_number_formatting, split_paragraphs, _PARA_RE
+from .section_cache import (
+    hash_facts,
+    section_cache_key,
+    load_cached_section,
+    save_cached_section,
+    find_similar_section,
+    add_semantic_entry,
+    save_semantic_index,
 )
 from . import FIXED_STRUCTURE
+from core.logger import get_logger
 
 if TYPE_CHECKING:
     from core.document_processor import DocumentProcessor
 
+logger = get_logger(__name__)
+
 
 # Mapeamento de seções para funções de geração
 SECTION_GENERATORS = {
@@ -50,6 +85,27 @@ SECTION_GENERATORS = {
     "conclusao": generate_conclusao_section,
 }
 
+# Mapeamento de seções para montagem de mensagens (geração em paralelo)
+SECTION_MESSAGE_BUILDERS = {
+    "overview": build_intro_messages,
+    "gestor": build_gestor_messages,
+    "mercado": build_market_messages,
+    "empresa": build_company_messages,
+    "transacao": build_transaction_messages,
+    "projecoes_financeiras": build_projections_messages,
+    "retornos_esperados": build_retornos_esperados_messages,
+    "board_cap_table": build_board_cap_table_messages,
+    "conclusao": build_conclusao_messages,
+}
+
+# Sugestão de model_overrides: seções mais templatizadas (apresentação e
+# listagem de board/cap table) com um modelo menor; as seções analíticas
+# (transação, projeções, retornos) continuam no modelo principal
+LIGHT_MODEL_OVERRIDES = {
+    "overview": "gpt-4o-mini",
+    "board_cap_table": "gpt-4o-mini",
+}
+
 # Queries semânticas para busca RAG por seção no ChromaDB
 SECTION_QUERIES = {
     "1. Overview": (
@@ -94,65 +150,170 @@ SECTION_QUERIES = {
 }
 
 
-def _get_rag_context_for_section(
-    section_title: str,
+@dataclass(frozen=True)
+class _SectionSpec:
+    """Seção da estrutura fixa com a montagem de mensagens e a query RAG já resolvidas."""
+    title: str
+    key: str
+    build_messages: Callable[..., list]
+    query: Optional[str]
+
+
+# Estrutura fixa resolvida uma única vez no import, na ordem de FIXED_STRUCTURE
+_PIPELINE: Tuple[_SectionSpec, ...] = tuple(
+    _SectionSpec(title, key, SECTION_MESSAGE_BUILDERS[key], SECTION_QUERIES.get(title))
+    for title, key in FIXED_STRUCTURE.items()
+)
+
+
+# Texto de um resultado de search_chromadb_chunks_batch
+_chunk_text = itemgetter("chunk")
+
+
+def _prefetch_all_rag_contexts(
+    sections: Tuple[_SectionSpec, ...],
     memo_id: Optional[str],
     processor: Optional["DocumentProcessor"]
-) -> Optional[str]:
+) -> Dict[str, str]:
     """
-    Obtém contexto RAG específico para uma seção usando busca semântica.
+    Obtém o contexto RAG de todas as seções com uma única busca em lote.
+    
+    As queries de SECTION_QUERIES são embedadas juntas (e só na primeira vez,
+    pois o DocumentProcessor guarda os embeddings) e enviadas ao ChromaDB em
+    um único round-trip (em vez de uma busca por seção).
     
     Args:
-        section_title: Título da seção (ex: "1. Overview")
+        sections: Seções do memo (normalmente _PIPELINE)
         memo_id: ID do memo no ChromaDB
         processor: Instância de DocumentProcessor para busca
     
     Returns:
-        Contexto RAG relevante para a seção ou None
+        Dict {section_title: contexto}; seções sem contexto ficam de fora
     """
     if not processor or not memo_id:
-        return None
+        return {}
+    
+    sections = [spec for spec in sections if spec.query]
+    if not sections:
+        return {}
     
     try:
-        query = SECTION_QUERIES.get(section_title, "")
-        if not query:
-            return None
-        
-        # Buscar contexto relevante no ChromaDB
-        results = processor.search_chromadb_chunks(
+        # Buscar contexto relevante no ChromaDB (uma chamada para todas as seções)
+        batch_results = processor.search_chromadb_chunks_batch(
             memo_id=memo_id,
-            query=query,
+            queries=[spec.query for spec in sections],
             top_k=3,
-            section=None
+            section=None,
+            # Queries estáticas: embeddings calculados uma vez por processo
+            cache_embeddings=True
         )
-        
-        if results:
-            # Combinar chunks relevantes
-            context = "\n\n".join([
-                r.get("document", "") or r.get("text", "") or r.get("chunk", "")
-                for r in results 
-                if r.get("document") or r.get("text") or r.get("chunk")
-            ])
-            return context if context.strip() else None
-        
     except Exception as e:
         # Se houver erro na busca RAG, continuar sem contexto
-        print(f"   ⚠️  Erro ao buscar RAG para '{section_title}': {e}")
+        logger.warning("⚠️  Erro ao buscar RAG das seções: %s", e)
+        return {}
+    
+    contexts = {}
+    for spec, results in zip(sections, batch_results):
+        # Combinar chunks relevantes (search_chromadb_chunks_batch já normaliza
+        # o texto de cada resultado no campo "chunk")
+        context = "\n\n".join(filter(None, map(_chunk_text, results)))
+        if context.strip():
+            contexts[spec.title] = context
     
-    return None
+    return contexts
 
 
-def generate_full_memo(
+def _create_llm(model: str, temperature: float):
+    """
+    Retorna o cliente ChatOpenAI compartilhado pelas seções do memo.
+    
+    O mesmo cliente (e pool de conexões) é reaproveitado entre memos e pelos
+    generate_*_section dos agentes.
+    
+    Raises:
+        ValueError: Se OPENAI_API_KEY não estiver configurada
+    """
+    return get_chat_model(model, temperature)
+
+
+# Limite de caracteres do prompt enviado ao modelo de embedding (cache semântico)
+_SEMANTIC_MAX_CHARS = 24000
+
+
+def _embed_prompts(processor: "DocumentProcessor", messages_list: List[list]) -> List[List[float]]:
+    """
+    Gera embeddings dos prompts (system + human) para o cache semântico.
+    
+    Returns:
+        Lista de embeddings (vazia se a geração falhar)
+    """
+    texts = [
+        "\n".join(message.content for message in messages)[:_SEMANTIC_MAX_CHARS]
+        for messages in messages_list
+    ]
+    try:
+        return processor.embeddings.embed_documents(texts)
+    except Exception as e:
+        logger.warning("⚠️  Erro ao gerar embeddings para cache semântico: %s", e)
+        return []
+
+
+async def _generate_one_section(messages: list, llm) -> list:
+    """
+    Gera uma seção do memo (chamada ao LLM) de forma assíncrona.
+    
+    Returns:
+        Lista de parágrafos da seção
+    """
+    result = await llm.ainvoke(messages)
+    section_text = fix_number_formatting(result.content.strip())
+    
+    # Dividir em parágrafos
+    return split_paragraphs(section_text)
+
+
+def _transient_llm_errors() -> Tuple[type, ...]:
+    """Erros transitórios da API da OpenAI (rate limit, timeout, conexão)."""
+    from openai import APIConnectionError, APITimeoutError, RateLimitError
+    return (RateLimitError, APITimeoutError, APIConnectionError)
+
+
+async def _retry_one_section(messages: list, llm, retryable: Tuple[type, ...]) -> list:
+    """
+    Regera uma seção que falhou com erro transitório, com backoff exponencial.
+    
+    Até 3 tentativas (esperas de 1s a 16s); erros não transitórios ou a última
+    falha são propagados.
+    """
+    from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential
+    
+    async for attempt in AsyncRetrying(
+        wait=wait_exponential(min=1, max=16),
+        stop=stop_after_attempt(3),
+        retry=retry_if_exception_type(retryable),
+        reraise=True,
+    ):
+        with attempt:
+            return await _generate_one_section(messages, llm)
+
+
+async def generate_full_memo_async(
     facts: Dict[str, Any],
     rag_context: str = None,  # Deprecated - usar memo_id/processor
     memo_id: Optional[str] = None,
     processor: Optional["DocumentProcessor"] = None,
     model: str = "gpt-4o",
-    temperature: float = 0.25
+    temperature: float = 0.25,
+    use_cache: bool = False,
+    semantic_cache: bool = False,
+    model_overrides: Optional[Dict[str, str]] = None
 ) -> Dict[str, list]:
     """
     Gera memo COMPLETO de Memo Search Fund (estrutura fixa de 9 seções).
     
+    As seções são independentes entre si, então são geradas em paralelo
+    (asyncio.gather): o tempo total fica próximo ao da seção mais lenta.
+    
     Args:
         facts: Facts extraídos (todas as seções)
         rag_context: Contexto do documento (DEPRECATED - usar memo_id/processor)
@@ -160,70 +321,387 @@ def generate_full_memo(
         processor: Instância de DocumentProcessor para busca no ChromaDB
         model: Modelo OpenAI
         temperature: Criatividade
+        use_cache: Reaproveita seções já geradas com os mesmos facts, mensagens,
+            modelo e temperatura (desligado por padrão: regerar produz um novo rascunho)
+        semantic_cache: Também reaproveita seções com os mesmos facts cujo prompt
+            seja quase idêntico (similaridade de embeddings > 0.97); requer processor
+        model_overrides: Modelo por chave de seção (ex: LIGHT_MODEL_OVERRIDES);
+            seções ausentes usam `model`
     
     Returns:
         Dict com estrutura: {section_title: [paragraph1, paragraph2, ...]}
     """
     memo_sections = {}
     
-    print(f"Gerando Memo Completo Search Fund com {len(FIXED_STRUCTURE)} seções...")
+    # Modelo de cada seção (cache e índice semântico usam o modelo da seção)
+    section_models = [
+        (model_overrides or {}).get(spec.key, model) for spec in _PIPELINE
+    ]
     
-    for section_title, section_key in FIXED_STRUCTURE.items():
-        print(f"   Gerando seção: {section_title}...")
-        
-        # Obter função de geração
-        generator_func = SECTION_GENERATORS.get(section_key)
-        if not generator_func:
-            print(f"   ⚠️  Função não encontrada para '{section_key}', pulando...")
-            continue
-        
-        # Obter contexto RAG específico para esta seção
-        section_rag_context = _get_rag_context_for_section(
-            section_title, memo_id, processor
-        ) or rag_context  # Fallback para contexto geral se disponível
-        
+    logger.info("Gerando Memo Completo Search Fund com %d seções...", len(_PIPELINE))
+    
+    # Contexto RAG de todas as seções em uma única busca (síncrona: roda em thread)
+    rag_contexts = await asyncio.to_thread(
+        _prefetch_all_rag_contexts, _PIPELINE, memo_id, processor
+    )
+    # Fallback para contexto geral se disponível
+    section_contexts = [rag_contexts.get(spec.title) or rag_context for spec in _PIPELINE]
+    
+    # Monta as mensagens de todas as seções
+    results: list = [None] * len(_PIPELINE)
+    section_messages = {}
+    for i, spec in enumerate(_PIPELINE):
         try:
-            # Gerar seção
-            section_text = generator_func(
-                facts=facts,
-                rag_context=section_rag_context,
-                model=model,
-                temperature=temperature
+            section_messages[i] = spec.build_messages(facts, section_contexts[i])
+        except Exception as e:
+            results[i] = e
+    pending = list(section_messages)
+    
+    # Seções cujas (facts, mensagens, modelo, temperatura) não mudaram vêm do cache
+    cache_keys: list = [None] * len(_PIPELINE)
+    if use_cache or semantic_cache:
+        facts_hash = hash_facts(facts)  # facts serializados uma vez para todas as seções
+    if use_cache:
+        for i in pending:
+            cache_keys[i] = section_cache_key(
+                facts_hash, _PIPELINE[i].key, section_messages[i], section_models[i], temperature
             )
-            
-            # Dividir em parágrafos
-            paragraphs = [p.strip() for p in section_text.split('\n\n') if p.strip()]
-            
-            memo_sections[section_title] = paragraphs
-            
-            print(f"   ✅ '{section_title}': {len(paragraphs)} parágrafo(s)")
-            
+            results[i] = load_cached_section(cache_keys[i])
+        pending = [i for i in pending if results[i] is None]
+    
+    # Cache semântico: prompts quase idênticos (com os mesmos facts) reaproveitam seções já geradas
+    prompt_embeddings = {}
+    if semantic_cache and processor and pending:
+        facts_digest = facts_hash.hexdigest()
+        embeddings = await asyncio.to_thread(
+            _embed_prompts, processor, [section_messages[i] for i in pending]
+        )
+        prompt_embeddings = dict(zip(pending, embeddings))
+        for i, embedding in prompt_embeddings.items():
+            results[i] = find_similar_section(
+                facts_digest, _PIPELINE[i].key, section_models[i], temperature, embedding
+            )
+        pending = [i for i in pending if results[i] is None]
+    
+    if pending:
+        try:
+            llms = {
+                section_models[i]: _create_llm(section_models[i], temperature) for i in pending
+            }
         except Exception as e:
-            print(f"   ❌ Erro ao gerar '{section_title}': {e}")
-            memo_sections[section_title] = [f"[Erro ao gerar seção: {str(e)}]"]
+            pending_results = [e] * len(pending)
+        else:
+            # Executar em paralelo (ordem dos resultados = ordem de `pending`)
+            logger.info("Gerando %d seção(ões) em paralelo...", len(pending))
+            pending_results = await asyncio.gather(
+                *[_generate_one_section(section_messages[i], llms[section_models[i]]) for i in pending],
+                return_exceptions=True,
+            )
+            
+            # Retentar apenas as seções com erro transitório (ex: 429), sem
+            # regerar as que já deram certo
+            retryable = _transient_llm_errors()
+            failed = [
+                n for n, result in enumerate(pending_results)
+                if isinstance(result, retryable)
+            ]
+            if failed:
+                logger.warning("⚠️  Retentando %d seção(ões) com erro transitório...", len(failed))
+                retried = await asyncio.gather(
+                    *[
+                        _retry_one_section(
+                            section_messages[pending[n]], llms[section_models[pending[n]]], retryable
+                        )
+                        for n in failed
+                    ],
+                    return_exceptions=True,
+                )
+                for n, result in zip(failed, retried):
+                    pending_results[n] = result
+        
+        for i, result in zip(pending, pending_results):
+            results[i] = result
+            if isinstance(result, Exception):
+                continue
+            if use_cache:
+                save_cached_section(cache_keys[i], _PIPELINE[i].title, result)
+            if i in prompt_embeddings:
+                add_semantic_entry(
+                    facts_digest, _PIPELINE[i].key, section_models[i], temperature,
+                    prompt_embeddings[i], result
+                )
+        if prompt_embeddings:
+            save_semantic_index()
     
-    print(f"✅ Memo completo gerado com {len(memo_sections)} seções")
+    for i, (spec, result) in enumerate(zip(_PIPELINE, results)):
+        if isinstance(result, Exception):
+            logger.error("❌ Erro ao gerar '%s': %s", spec.title, result)
+            memo_sections[spec.title] = [f"[Erro ao gerar seção: {str(result)}]"]
+        else:
+            memo_sections[spec.title] = result
+            logger.info(
+                "✅ '%s': %d parágrafo(s)%s",
+                spec.title, len(result), "" if i in pending else " (cache)"
+            )
+    
+    logger.info("✅ Memo completo gerado com %d seções", len(memo_sections))
     
     # Validação de não-redundância
     try:
         from .validator import validate_no_redundancy
         
-        # Converter para formato de texto (juntar parágrafos)
+        # Converter para formato de texto (juntar parágrafos), ignorando as
+        # seções que falharam (o placeholder de erro não é conteúdo do memo)
         sections_text = {
-            title: "\n\n".join(paragraphs)
-            for title, paragraphs in memo_sections.items()
+            spec.title: "\n\n".join(result)
+            for spec, result in zip(_PIPELINE, results)
+            if not isinstance(result, Exception)
         }
         
-        redundancy_check = validate_no_redundancy(sections_text, threshold=0.3)
+        if len(sections_text) < 2:
+            redundancy_check = {"has_redundancy": False}
+        else:
+            redundancy_check = validate_no_redundancy(sections_text)
         
         if redundancy_check["has_redundancy"]:
-            print(f"   ⚠️  Redundâncias detectadas: {len(redundancy_check['redundant_pairs'])} pares")
+            logger.warning("⚠️  Redundâncias detectadas: %d pares", len(redundancy_check["redundant_pairs"]))
             for suggestion in redundancy_check["suggestions"][:3]:  # Mostrar apenas top 3
-                print(f"      - {suggestion}")
+                logger.warning("   - %s", suggestion)
         else:
-            print(f"   ✅ Nenhuma redundância significativa detectada")
+            logger.info("✅ Nenhuma redundância significativa detectada")
             
     except Exception as e:
-        print(f"   ⚠️  Erro na validação de redundância: {e}")
+        logger.warning("⚠️  Erro na validação de redundância: %s", e)
     
     return memo_sections
+
+
+def generate_full_memo(
+    facts: Dict[str, Any],
+    rag_context: str = None,  # Deprecated - usar memo_id/processor
+    memo_id: Optional[str] = None,
+    processor: Optional["DocumentProcessor"] = None,
+    model: str = "gpt-4o",
+    temperature: float = 0.25,
+    use_cache: bool = False,
+    semantic_cache: bool = False,
+    model_overrides: Optional[Dict[str, str]] = None
+) -> Dict[str, list]:
+    """
+    Wrapper síncrono de generate_full_memo_async (mantém a API existente).
+    """
+    return asyncio.run(generate_full_memo_async(
+        facts, rag_context, memo_id, processor, model, temperature,
+        use_cache, semantic_cache, model_overrides
+    ))
+
+
+# Marcador de início de seção na resposta de generate_full_memo_single_call
+_SECTION_MARKER_RE = re.compile(r'^=== SECTION: (\w+) ===[ \t]*$', re.MULTILINE)
+
+# Persona compartilhada pelas seções, enviada uma única vez
+_SINGLE_CALL_SYSTEM_PROMPT = ANALYST_PERSONA
+
+_SINGLE_CALL_HEADER = """Você vai escrever TODAS as {count} seções de um MEMO COMPLETO de Search Fund em uma única resposta.
+
+Cada bloco [n] abaixo traz os dados e a ESTRUTURA OBRIGATÓRIA de uma seção. Escreva as seções na ordem dos blocos,
+começando cada uma com uma linha contendo apenas o marcador indicado (ex: "=== SECTION: overview ==="),
+seguida do texto corrido da seção. Não escreva nada antes do primeiro marcador.
+"""
+
+
+def generate_full_memo_single_call(
+    facts: Dict[str, Any],
+    rag_context: str = None,  # Deprecated - usar memo_id/processor
+    memo_id: Optional[str] = None,
+    processor: Optional["DocumentProcessor"] = None,
+    model: str = "gpt-4o",
+    temperature: float = 0.25
+) -> Dict[str, list]:
+    """
+    Gera as 9 seções do memo em uma única chamada ao LLM (batch prompting).
+    
+    Os prompts de cada agente viram blocos numerados de um único prompt, com a
+    persona do analista enviada uma só vez, e a resposta é dividida pelos
+    marcadores "=== SECTION: <key> ===". Troca 9 round-trips por um, ao custo
+    de uma resposta longa (pode esbarrar no limite de tokens de saída do
+    modelo); seções ausentes na resposta recebem o placeholder de erro.
+    
+    Os generate_*_section continuam disponíveis para gerar seções isoladas.
+    
+    Args:
+        facts: Facts extraídos (todas as seções)
+        rag_context: Contexto do documento (DEPRECATED - usar memo_id/processor)
+        memo_id: ID do memo no ChromaDB para busca RAG por seção
+        processor: Instância de DocumentProcessor para busca no ChromaDB
+        model: Modelo OpenAI
+        temperature: Criatividade
+    
+    Returns:
+        Dict com estrutura: {section_title: [paragraph1, paragraph2, ...]}
+    """
+    from langchain_core.messages import HumanMessage
+    
+    rag_contexts = _prefetch_all_rag_contexts(_PIPELINE, memo_id, processor)
+    
+    section_messages = [
+        # Fallback para contexto geral se disponível
+        spec.build_messages(facts, rag_contexts.get(spec.title) or rag_context)
+        for spec in _PIPELINE
+    ]
+    
+    # Cada bloco leva os dados (prompt) e a estrutura da seção: o prompt de
+    # sistema do agente sem a persona, que vai uma única vez no prompt de sistema
+    parts = [_SINGLE_CALL_HEADER.format(count=len(_PIPELINE))]
+    for n, (spec, (system, human)) in enumerate(zip(_PIPELINE, section_messages), 1):
+        structure = system.content.removeprefix(ANALYST_PERSONA)
+        parts.append(
+            f"\n\n[{n}] {spec.title} (marcador: === SECTION: {spec.key} ===)\n"
+            f"{human.content}\n{structure}"
+        )
+    
+    logger.info("Gerando Memo Completo Search Fund com %d seções em uma única chamada...", len(_PIPELINE))
+    result = _create_llm(model, temperature).invoke([
+        system_message(_SINGLE_CALL_SYSTEM_PROMPT),
+        HumanMessage(content="".join(parts)),
+    ])
+    
+    # Resposta: [texto antes do 1º marcador, key1, texto1, key2, texto2, ...]
+    pieces = _SECTION_MARKER_RE.split(result.content)
+    generated = dict(zip(pieces[1::2], pieces[2::2]))
+    
+    memo_sections = {}
+    for spec in _PIPELINE:
+        paragraphs = split_paragraphs(fix_number_formatting(generated.get(spec.key, "").strip()))
+        if not paragraphs:
+            logger.error("❌ Seção '%s' ausente na resposta", spec.title)
+            paragraphs = ["[Erro ao gerar seção: seção ausente na resposta do modelo]"]
+        memo_sections[spec.title] = paragraphs
+    
+    return memo_sections
+
+
+def generate_section_stream(
+    section_key: str,
+    facts: Dict[str, Any],
+    rag_context: Optional[str] = None,
+    model: str = "gpt-4o",
+    temperature: float = 0.25
+) -> Iterator[str]:
+    """
+    Gera uma única seção entregando os tokens à medida que o LLM os escreve.
+    
+    Versão em streaming de SECTION_GENERATORS[section_key]: o primeiro trecho
+    chega em ~1s em vez de após a seção inteira. Os trechos são o texto cru do
+    modelo; fix_number_formatting deve ser aplicado ao texto final
+    ("".join(...)), já que um número pode vir partido entre dois trechos.
+    
+    Args:
+        section_key: Chave da seção (ex: "overview", "gestor")
+        facts: Facts extraídos
+        rag_context: Contexto RAG da seção
+        model: Modelo OpenAI
+        temperature: Criatividade
+    
+    Yields:
+        Trechos de texto da seção
+    
+    Raises:
+        KeyError: Se section_key não for uma seção da estrutura fixa
+    """
+    messages = SECTION_MESSAGE_BUILDERS[section_key](facts, rag_context)
+    llm = _create_llm(model, temperature)
+    for chunk in llm.stream(messages):
+        if chunk.content:
+            yield chunk.content
+
+
+async def _stream_one_section(
+    section_title: str,
+    messages: list,
+    llm,
+    queue: "asyncio.Queue"
+) -> None:
+    """
+    Gera uma seção via streaming, publicando cada parágrafo assim que completo.
+    
+    Parágrafos são publicados na fila como (section_title, paragraph); ao
+    final, publica (section_title, None) para sinalizar que a seção terminou.
+    """
+    buffer = ""
+    try:
+        async for chunk in llm.astream(messages):
+            buffer += chunk.content
+            # Parágrafo completo a cada linha em branco (mesmo separador de split_paragraphs)
+            while (separator := _PARA_RE.search(buffer)):
+                paragraph, buffer = buffer[:separator.start()], buffer[separator.end():]
+                if paragraph.strip():
+                    await queue.put((section_title, fix_number_formatting(paragraph.strip())))
+        if buffer.strip():
+            await queue.put((section_title, fix_number_formatting(buffer.strip())))
+    except Exception as e:
+        logger.error("❌ Erro ao gerar '%s': %s", section_title, e)
+        await queue.put((section_title, f"[Erro ao gerar seção: {str(e)}]"))
+    finally:
+        await queue.put((section_title, None))
+
+
+async def generate_full_memo_stream(
+    facts: Dict[str, Any],
+    rag_context: str = None,  # Deprecated - usar memo_id/processor
+    memo_id: Optional[str] = None,
+    processor: Optional["DocumentProcessor"] = None,
+    model: str = "gpt-4o",
+    temperature: float = 0.25
+) -> AsyncIterator[Tuple[str, str]]:
+    """
+    Versão em streaming de generate_full_memo_async.
+    
+    Todas as seções são geradas em paralelo e cada parágrafo é entregue assim
+    que o LLM termina de escrevê-lo, permitindo que a UI (ou a validação)
+    comece a trabalhar antes do memo completo. Parágrafos de seções diferentes
+    chegam intercalados; não usa o cache de seções.
+    
+    Args:
+        facts: Facts extraídos (todas as seções)
+        rag_context: Contexto do documento (DEPRECATED - usar memo_id/processor)
+        memo_id: ID do memo no ChromaDB para busca RAG por seção
+        processor: Instância de DocumentProcessor para busca no ChromaDB
+        model: Modelo OpenAI
+        temperature: Criatividade
+    
+    Yields:
+        Tuplas (section_title, paragraph)
+    """
+    # Contexto RAG de todas as seções em uma única busca (síncrona: roda em thread)
+    rag_contexts = await asyncio.to_thread(
+        _prefetch_all_rag_contexts, _PIPELINE, memo_id, processor
+    )
+    
+    llm = _create_llm(model, temperature)
+    queue: asyncio.Queue = asyncio.Queue()
+    
+    tasks = []
+    for spec in _PIPELINE:
+        try:
+            # Fallback para contexto geral se disponível
+            messages = spec.build_messages(facts, rag_contexts.get(spec.title) or rag_context)
+        except Exception as e:
+            yield spec.title, f"[Erro ao gerar seção: {str(e)}]"
+            continue
+        tasks.append(asyncio.create_task(
+            _stream_one_section(spec.title, messages, llm, queue)
+        ))
+    
+    pending_sections = len(tasks)
+    try:
+        while pending_sections:
+            section_title, paragraph = await queue.get()
+            if paragraph is None:
+                pending_sections -= 1
+                continue
+            yield section_title, paragraph
+    finally:
+        # Consumidor interrompeu a iteração: cancela as seções em andamento
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,256 @@
+"""
+Cache de seções geradas do Memo Completo Search Fund
+
+Cache endereçado por conteúdo: a chave é um hash de (facts, seção, mensagens
+enviadas ao LLM, modelo, temperatura). As mensagens já incluem o prompt e o
+contexto RAG, então qualquer edição de prompt invalida as seções cacheadas.
+Se nada disso mudou desde a última geração, a seção é reaproveitada sem chamar
+o LLM. Desligado por padrão no orchestrator: regerar o memo deve produzir um
+novo rascunho.
+
+Segue o mesmo formato do cache de parsing do app: um arquivo JSON por chave
+em .cache/.
+
+Opcionalmente (cache semântico), prompts quase idênticos com os mesmos facts
+também reaproveitam a seção já gerada, comparando embeddings dos prompts.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+SECTION_CACHE_DIR = Path(".cache/memo_sections")
+
+
+def hash_facts(facts: Dict[str, Any]) -> "hashlib.blake2b":
+    """
+    Serializa e faz o hash dos facts uma única vez por memo.
+    
+    O objeto retornado é copiado (hash.copy()) por section_cache_key, então os
+    facts não são serializados novamente para cada seção.
+    
+    Args:
+        facts: Facts estruturados usados na geração
+    
+    Returns:
+        Objeto blake2b já alimentado com os facts
+    """
+    facts_bytes = json.dumps(
+        facts, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str
+    ).encode("utf-8")
+    return hashlib.blake2b(facts_bytes, digest_size=16)
+
+
+def section_cache_key(
+    facts_hash: "hashlib.blake2b",
+    section_key: str,
+    messages: list,
+    model: str,
+    temperature: float
+) -> str:
+    """
+    Calcula a chave de cache de uma seção.
+    
+    Args:
+        facts_hash: Hash dos facts retornado por hash_facts
+        section_key: Chave da seção (ex: "overview")
+        messages: Mensagens (system, human) montadas para a seção; cobrem o
+            prompt e o contexto RAG
+        model: Modelo do LLM
+        temperature: Temperatura do LLM
+    
+    Returns:
+        Hash blake2b (128 bits) em hexadecimal
+    """
+    h = facts_hash.copy()
+    h.update(section_key.encode("utf-8"))
+    for message in messages:
+        h.update(hashlib.sha1(message.content.encode("utf-8")).digest())
+    h.update(model.encode("utf-8"))
+    h.update(f"{temperature}".encode("utf-8"))
+    return h.hexdigest()
+
+
+def load_cached_section(cache_key: str) -> Optional[List[str]]:
+    """
+    Carrega os parágrafos de uma seção do cache, se existir.
+
+    Args:
+        cache_key: Chave calculada por section_cache_key
+
+    Returns:
+        Lista de parágrafos ou None se não houver cache
+    """
+    cache_path = SECTION_CACHE_DIR / f"{cache_key}.json"
+    if not cache_path.exists():
+        return None
+
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)["paragraphs"]
+    except (json.JSONDecodeError, KeyError, OSError) as e:
+        logger.warning("Erro ao carregar cache de seção %s...: %s", cache_key[:8], e)
+        cache_path.unlink(missing_ok=True)  # Remover cache corrompido
+        return None
+
+
+def save_cached_section(cache_key: str, section_title: str, paragraphs: List[str]) -> None:
+    """
+    Salva os parágrafos de uma seção no cache.
+
+    Args:
+        cache_key: Chave calculada por section_cache_key
+        section_title: Título da seção (apenas informativo)
+        paragraphs: Parágrafos gerados
+    """
+    try:
+        SECTION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_data = {
+            'paragraphs': paragraphs,
+            'section_title': section_title,
+            'cached_at': datetime.now().isoformat(),
+        }
+        with open(SECTION_CACHE_DIR / f"{cache_key}.json", 'w', encoding='utf-8') as f:
+            json.dump(cache_data, f, ensure_ascii=False)
+    except Exception as e:
+        logger.warning("Erro ao salvar cache de seção %s...: %s", cache_key[:8], e)
+
+
+# ============================================================================
+# CACHE SEMÂNTICO
+# ============================================================================
+# Além da chave exata, guarda o embedding do prompt de cada seção gerada.
+# Só entradas com os MESMOS facts (hash exato), seção, modelo e temperatura são
+# candidatas: um número alterado nos facts nunca reaproveita a seção antiga.
+# A similaridade de cosseno apenas escolhe entre essas candidatas (ex: contexto
+# RAG ou prompt levemente diferentes).
+
+SEMANTIC_INDEX_PATH = SECTION_CACHE_DIR / "semantic_index.json"
+SEMANTIC_SIMILARITY_THRESHOLD = 0.97
+# Máximo de entradas no índice (as mais antigas são descartadas)
+SEMANTIC_INDEX_MAX_ENTRIES = 500
+
+# Índice carregado sob demanda:
+# [{"facts", "section_key", "model", "temperature", "embedding", "norm", "paragraphs"}]
+_semantic_index: Optional[List[Dict[str, Any]]] = None
+
+
+def _vector_norm(vector: List[float]) -> float:
+    """Norma L2 de um embedding."""
+    return sum(x * x for x in vector) ** 0.5
+
+
+def _load_semantic_index() -> List[Dict[str, Any]]:
+    """Carrega o índice semântico do disco (uma única vez por processo)."""
+    global _semantic_index
+
+    if _semantic_index is None:
+        _semantic_index = []
+        if SEMANTIC_INDEX_PATH.exists():
+            try:
+                with open(SEMANTIC_INDEX_PATH, 'r', encoding='utf-8') as f:
+                    # Entradas de versões anteriores (sem hash dos facts) são descartadas
+                    _semantic_index = [entry for entry in json.load(f) if "facts" in entry]
+            except (json.JSONDecodeError, OSError, TypeError) as e:
+                logger.warning("Erro ao carregar índice semântico de seções: %s", e)
+
+    return _semantic_index
+
+
+def find_similar_section(
+    facts_digest: str,
+    section_key: str,
+    model: str,
+    temperature: float,
+    embedding: List[float],
+    threshold: float = SEMANTIC_SIMILARITY_THRESHOLD
+) -> Optional[List[str]]:
+    """
+    Busca uma seção já gerada com os mesmos facts e prompt semanticamente equivalente.
+
+    Args:
+        facts_digest: hash_facts(facts).hexdigest() (só compara com os mesmos facts)
+        section_key: Chave da seção (só compara com a mesma seção)
+        model: Modelo do LLM (só compara com o mesmo modelo)
+        temperature: Temperatura do LLM (só compara com a mesma temperatura)
+        embedding: Embedding do prompt atual
+        threshold: Similaridade de cosseno mínima para reaproveitar
+
+    Returns:
+        Parágrafos da seção mais similar ou None se nenhuma passar do limiar
+    """
+    norm = _vector_norm(embedding)
+    if not norm:
+        return None
+
+    best_score, best_paragraphs = threshold, None
+    for entry in _load_semantic_index():
+        if (
+            entry["facts"] != facts_digest
+            or entry["section_key"] != section_key
+            or entry["model"] != model
+            or entry["temperature"] != temperature
+        ):
+            continue
+        score = sum(a * b for a, b in zip(embedding, entry["embedding"])) / (norm * entry["norm"])
+        if score >= best_score:
+            best_score, best_paragraphs = score, entry["paragraphs"]
+
+    if best_paragraphs is not None:
+        logger.info("Cache semântico: '%s' reaproveitada (similaridade %.3f)", section_key, best_score)
+    return best_paragraphs
+
+
+def add_semantic_entry(
+    facts_digest: str,
+    section_key: str,
+    model: str,
+    temperature: float,
+    embedding: List[float],
+    paragraphs: List[str]
+) -> None:
+    """
+    Adiciona uma seção gerada ao índice semântico (em memória).
+
+    O índice só é gravado em disco por save_semantic_index, uma vez por memo.
+
+    Args:
+        facts_digest: hash_facts(facts).hexdigest()
+        section_key: Chave da seção
+        model: Modelo do LLM
+        temperature: Temperatura do LLM
+        embedding: Embedding do prompt usado na geração
+        paragraphs: Parágrafos gerados
+    """
+    norm = _vector_norm(embedding)
+    if not norm:
+        return
+
+    index = _load_semantic_index()
+    index.append({
+        "facts": facts_digest,
+        "section_key": section_key,
+        "model": model,
+        "temperature": temperature,
+        "embedding": embedding,
+        "norm": norm,
+        "paragraphs": paragraphs,
+    })
+    # Limita o tamanho do índice descartando as entradas mais antigas
+    del index[:-SEMANTIC_INDEX_MAX_ENTRIES]
+
+
+def save_semantic_index() -> None:
+    """Persiste o índice semântico em disco."""
+    try:
+        SECTION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(SEMANTIC_INDEX_PATH, 'w', encoding='utf-8') as f:
+            json.dump(_load_semantic_index(), f, ensure_ascii=False)
+    except Exception as e:
+        logger.warning("Erro ao salvar índice semântico de seções: %s", e)
@@ -20,6 +20,8 @@ USO:
 
 from .orchestrator import (
     generate_full_memo,
+    submit_full_memo_batch,
+    collect_full_memo_batch,
     FIXED_STRUCTURE,
 )
 
@@ -43,6 +45,8 @@ from .agents import (
 __all__ = [
     # Generators
     "generate_full_memo",
+    "submit_full_memo_batch",
+    "collect_full_memo_batch",
     "FIXED_STRUCTURE",
     # Agents
     "IntroAgent",
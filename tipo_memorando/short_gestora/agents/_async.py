@@ -0,0 +1,31 @@
+"""
+Geração assíncrona compartilhada pelos agentes do Short Memo Gestora.
+
+Todos os agentes com agenerate delegam a agenerate_section: a resposta é
+recebida via streaming (llm.astream, em ainvoke_cached), permitindo gerar as
+seções em paralelo e cancelar a geração no meio.
+"""
+
+from typing import Any, Dict, Optional
+
+from core.llm_cache import ainvoke_cached
+from ..validator import fix_number_formatting
+
+
+async def agenerate_section(agent: Any, facts: Dict[str, Any], rag_context: Optional[str] = None) -> str:
+    """
+    Versão assíncrona de agent.generate (mesmas mensagens, via build_messages).
+
+    Args:
+        agent: Agente com _get_llm e build_messages
+        facts: Dict com facts estruturados
+        rag_context: Contexto opcional do documento
+
+    Returns:
+        Texto da seção
+    """
+    llm = agent._get_llm()
+    messages = agent.build_messages(facts, rag_context)
+
+    content = await ainvoke_cached(llm, messages)
+    return fix_number_formatting(content.strip())
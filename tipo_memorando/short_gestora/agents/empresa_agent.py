@@ -4,20 +4,21 @@ Agente de Empresa - Short Memo Gestora
 Responsável por gerar a seção "Empresa" com modelo de negócio e diferenciais.
 """
 
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, List, Optional
+from model_config import OPENAI_SEED, get_openai_llm
+from core.llm_cache import invoke_cached
 from langchain_core.messages import SystemMessage, HumanMessage
-import os
 from ..facts_builder import build_facts_section
 from ..validator import fix_number_formatting
-from ..facts_utils import get_name_safe, get_text_safe, get_numeric_safe, get_currency_safe
+from ._async import agenerate_section
+from ..facts_utils import get_name_safe, get_section_values_safe, get_currency_safe
 from ..._base.format_utils import get_currency_symbol, get_currency_label
 
 
 class EmpresaAgent:
     """Agente especializado em geração de Empresa para Short Memo Gestora."""
     
-    def __init__(self, model: str = "gpt-4o", temperature: float = 0.25):
+    def __init__(self, model: str = "gpt-4o", temperature: float = 0.0):
         self.model = model
         self.temperature = temperature
         self.section_name = "Empresa"
@@ -27,6 +28,12 @@ class EmpresaAgent:
         """Injeta LLM compartilhado (usado pelo LangGraph orchestrator)"""
         self.llm = llm
     
+    def _get_llm(self):
+        """LLM injetado se disponível, senão o cliente compartilhado (compatibilidade)"""
+        if not self.llm:
+            self.llm = get_openai_llm(self.model, self.temperature, seed=OPENAI_SEED)
+        return self.llm
+    
     def generate(
         self,
         facts: Dict[str, Any],
@@ -42,15 +49,36 @@ class EmpresaAgent:
         Returns:
             Texto da seção (3-5 parágrafos)
         """
-        # Usar LLM injetado se disponível, senão criar novo (compatibilidade)
-        if not self.llm:
-            apikey = os.getenv("OPENAI_API_KEY")
-            if not apikey:
-                raise ValueError("OPENAI_API_KEY não encontrada no ambiente")
-            self.llm = ChatOpenAI(model=self.model, api_key=apikey, temperature=self.temperature)
+        llm = self._get_llm()
+        messages = self.build_messages(facts, rag_context)
         
-        llm = self.llm
-
+        # Regeração com as mesmas mensagens reaproveita a resposta (se LLM_RESPONSE_CACHE=true)
+        content = invoke_cached(llm, messages)
+        return fix_number_formatting(content.strip())
+    
+    async def agenerate(
+        self,
+        facts: Dict[str, Any],
+        rag_context: Optional[str] = None
+    ) -> str:
+        """Versão assíncrona de generate (ver _async.agenerate_section)."""
+        return await agenerate_section(self, facts, rag_context)
+    
+    def build_messages(
+        self,
+        facts: Dict[str, Any],
+        rag_context: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Monta as mensagens (system + user) da seção sem chamar o LLM.
+        
+        Args:
+            facts: Dict com facts estruturados
+            rag_context: Contexto opcional
+        
+        Returns:
+            Lista [SystemMessage, HumanMessage]
+        """
         # ===== QUERY DOS FACTS =====
         identification_section = build_facts_section(
             facts, "identification",
@@ -102,9 +130,12 @@ class EmpresaAgent:
         # ===== EXTRAI INFORMAÇÕES CHAVE =====
         company_name = get_name_safe(facts, "identification", "company_name", "[nome da empresa]")
         
-        founding_year = get_text_safe(facts, "identification", "company_founding_year")
-        location = get_text_safe(facts, "identification", "company_location")
-        business_description = get_text_safe(facts, "identification", "business_description")
+        identification = get_section_values_safe(facts, "identification", (
+            "company_founding_year", "company_location", "business_description",
+        ))
+        founding_year = identification["company_founding_year"]
+        location = identification["company_location"]
+        business_description = identification["business_description"]
         
         # Placeholders apenas para validação do prompt
         if founding_year is None:
@@ -217,10 +248,7 @@ INSTRUÇÕES FINAIS
 
 Comece AGORA com o primeiro parágrafo (fundação e porte):"""
         
-        messages = [
+        return [
             SystemMessage(content=system_prompt),
             HumanMessage(content=user_prompt)
         ]
-
-        response = llm.invoke(messages)
-        return fix_number_formatting(response.content.strip())
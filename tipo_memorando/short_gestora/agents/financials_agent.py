@@ -5,20 +5,64 @@ Responsável por gerar a seção "Financials" com histórico e projeções.
 """
 
 import json
-import os
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from langchain_core.messages import SystemMessage, HumanMessage
 from ..facts_builder import build_facts_section
 from ..validator import fix_number_formatting
-from ..facts_utils import get_name_safe, get_numeric_safe, get_text_safe, get_currency_safe
+from ._async import agenerate_section
+from ..facts_utils import get_name_safe, get_currency_safe, get_section_values_safe
 from ..._base.format_utils import get_currency_symbol, get_currency_label
+from model_config import OPENAI_SEED, get_openai_llm
+from core.llm_cache import invoke_cached
+
+
+# Labels dos facts usados no prompt (só mudam com a moeda: montados uma vez por moeda)
+_IDENTIFICATION_LABELS = {
+    "company_name": "Nome da empresa",
+}
+
+
+@lru_cache(maxsize=8)
+def _history_labels(currency_label: str) -> Dict[str, str]:
+    """Labels da seção financials_history para a moeda (não modificar o dict retornado)."""
+    return {
+        "revenue_current_mm": f"Receita atual ({currency_label})",
+        "revenue_cagr_pct": "CAGR receita histórico (%)",
+        "revenue_cagr_period": "Período CAGR",
+        "ebitda_current_mm": f"EBITDA atual ({currency_label})",
+        "ebitda_margin_current_pct": "Margem EBITDA (%)",
+        "ebitda_cagr_pct": "CAGR EBITDA (%)",
+        "gross_margin_pct": "Margem bruta (%)",
+        "net_debt_mm": f"Dívida líquida ({currency_label})",
+        "leverage_net_debt_ebitda": "Alavancagem (ND/EBITDA)",
+        "cash_conversion_pct": "Conversão de caixa (% EBITDA)",
+        "employees_count": "Funcionários",
+        "financials_commentary": "Contexto do histórico",
+    }
+
+
+@lru_cache(maxsize=8)
+def _projections_labels(currency_label: str) -> Dict[str, str]:
+    """Labels da seção projections para a moeda (não modificar o dict retornado)."""
+    return {
+        "revenue_exit_mm": f"Receita na saída ({currency_label})",
+        "exit_year": "Ano de saída",
+        "revenue_cagr_projected_pct": "CAGR receita projetado (%)",
+        "projection_period": "Período de projeção",
+        "ebitda_exit_mm": f"EBITDA na saída ({currency_label})",
+        "ebitda_margin_exit_pct": "Margem EBITDA na saída (%)",
+        "exit_multiple_ev_ebitda": "Múltiplo de saída (EV/EBITDA)",
+        "growth_drivers": "Drivers de crescimento",
+        "margin_expansion_plan": "Plano de expansão de margem",
+        "projections_commentary": "Contexto das projeções",
+    }
 
 
 class FinancialsAgent:
     """Agente especializado em geração de Financials para Short Memo Gestora."""
     
-    def __init__(self, model: str = "gpt-4o", temperature: float = 0.25):
+    def __init__(self, model: str = "gpt-4o", temperature: float = 0.0):
         self.model = model
         self.temperature = temperature
         self.section_name = "Financials"
@@ -28,6 +72,12 @@ class FinancialsAgent:
         """Injeta LLM compartilhado (usado pelo LangGraph orchestrator)"""
         self.llm = llm
     
+    def _get_llm(self):
+        """LLM injetado se disponível, senão o cliente compartilhado (compatibilidade)"""
+        if not self.llm:
+            self.llm = get_openai_llm(self.model, self.temperature, seed=OPENAI_SEED)
+        return self.llm
+    
     def generate(
         self,
         facts: Dict[str, Any],
@@ -43,21 +93,39 @@ class FinancialsAgent:
         Returns:
             Texto da seção (2-3 parágrafos)
         """
-        # Usar LLM injetado se disponível, senão criar novo (compatibilidade)
-        if not self.llm:
-            apikey = os.getenv("OPENAI_API_KEY")
-            if not apikey:
-                raise ValueError("OPENAI_API_KEY não encontrada no ambiente")
-            self.llm = ChatOpenAI(model=self.model, api_key=apikey, temperature=self.temperature)
+        llm = self._get_llm()
+        messages = self.build_messages(facts, rag_context)
         
-        llm = self.llm
-
+        # Regeração com as mesmas mensagens reaproveita a resposta (se LLM_RESPONSE_CACHE=true)
+        content = invoke_cached(llm, messages)
+        return fix_number_formatting(content.strip())
+    
+    async def agenerate(
+        self,
+        facts: Dict[str, Any],
+        rag_context: Optional[str] = None
+    ) -> str:
+        """Versão assíncrona de generate (ver _async.agenerate_section)."""
+        return await agenerate_section(self, facts, rag_context)
+    
+    def build_messages(
+        self,
+        facts: Dict[str, Any],
+        rag_context: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Monta as mensagens (system + user) da seção sem chamar o LLM.
+        
+        Args:
+            facts: Dict com facts estruturados
+            rag_context: Contexto opcional do RAG
+        
+        Returns:
+            Lista [SystemMessage, HumanMessage]
+        """
         # ===== QUERY DOS FACTS =====
         identification_section = build_facts_section(
-            facts, "identification",
-            {
-                "company_name": "Nome da empresa",
-            }
+            facts, "identification", _IDENTIFICATION_LABELS
         )
         
         # Obtém moeda
@@ -66,65 +134,51 @@ class FinancialsAgent:
         currency_symbol = get_currency_symbol(currency)
         
         financials_section = build_facts_section(
-            facts, "financials_history",
-            {
-                "revenue_current_mm": f"Receita atual ({currency_label})",
-                "revenue_cagr_pct": "CAGR receita histórico (%)",
-                "revenue_cagr_period": "Período CAGR",
-                "ebitda_current_mm": f"EBITDA atual ({currency_label})",
-                "ebitda_margin_current_pct": "Margem EBITDA (%)",
-                "ebitda_cagr_pct": "CAGR EBITDA (%)",
-                "gross_margin_pct": "Margem bruta (%)",
-                "net_debt_mm": f"Dívida líquida ({currency_label})",
-                "leverage_net_debt_ebitda": "Alavancagem (ND/EBITDA)",
-                "cash_conversion_pct": "Conversão de caixa (% EBITDA)",
-                "employees_count": "Funcionários",
-                "financials_commentary": "Contexto do histórico",
-            }
+            facts, "financials_history", _history_labels(currency_label)
         )
         
         projections_section = build_facts_section(
-            facts, "projections",
-            {
-                "revenue_exit_mm": f"Receita na saída ({currency_label})",
-                "exit_year": "Ano de saída",
-                "revenue_cagr_projected_pct": "CAGR receita projetado (%)",
-                "projection_period": "Período de projeção",
-                "ebitda_exit_mm": f"EBITDA na saída ({currency_label})",
-                "ebitda_margin_exit_pct": "Margem EBITDA na saída (%)",
-                "exit_multiple_ev_ebitda": "Múltiplo de saída (EV/EBITDA)",
-                "growth_drivers": "Drivers de crescimento",
-                "margin_expansion_plan": "Plano de expansão de margem",
-                "projections_commentary": "Contexto das projeções",
-            }
+            facts, "projections", _projections_labels(currency_label)
         )
         
         # ===== EXTRAI INFORMAÇÕES CHAVE =====
         company_name = get_name_safe(facts, "identification", "company_name", "[nome da empresa]")
         
-        # Valores numéricos retornam None se desabilitados
-        revenue_current = get_numeric_safe(facts, "financials_history", "revenue_current_mm")
-        revenue_cagr = get_numeric_safe(facts, "financials_history", "revenue_cagr_pct")
-        ebitda_current = get_numeric_safe(facts, "financials_history", "ebitda_current_mm")
-        ebitda_margin = get_numeric_safe(facts, "financials_history", "ebitda_margin_current_pct")
-        gross_margin = get_numeric_safe(facts, "financials_history", "gross_margin_pct")
-        net_debt = get_numeric_safe(facts, "financials_history", "net_debt_mm")
-        leverage = get_numeric_safe(facts, "financials_history", "leverage_net_debt_ebitda")
-        cash_conversion = get_numeric_safe(facts, "financials_history", "cash_conversion_pct")
+        # Valores retornam None se desabilitados (cada seção de facts é lida uma única vez)
+        history = get_section_values_safe(facts, "financials_history", (
+            "revenue_current_mm", "revenue_cagr_pct", "ebitda_current_mm",
+            "ebitda_margin_current_pct", "gross_margin_pct", "net_debt_mm",
+            "leverage_net_debt_ebitda", "cash_conversion_pct",
+            "revenue_cagr_period", "financials_commentary",
+        ))
+        projections = get_section_values_safe(facts, "projections", (
+            "revenue_exit_mm", "revenue_cagr_projected_pct", "ebitda_exit_mm",
+            "ebitda_margin_exit_pct", "exit_multiple_ev_ebitda",
+            "exit_year", "growth_drivers", "projections_commentary",
+        ))
+        
+        revenue_current = history["revenue_current_mm"]
+        revenue_cagr = history["revenue_cagr_pct"]
+        ebitda_current = history["ebitda_current_mm"]
+        ebitda_margin = history["ebitda_margin_current_pct"]
+        gross_margin = history["gross_margin_pct"]
+        net_debt = history["net_debt_mm"]
+        leverage = history["leverage_net_debt_ebitda"]
+        cash_conversion = history["cash_conversion_pct"]
         
         # Projeções
-        revenue_exit = get_numeric_safe(facts, "projections", "revenue_exit_mm")
-        revenue_cagr_proj = get_numeric_safe(facts, "projections", "revenue_cagr_projected_pct")
-        ebitda_exit = get_numeric_safe(facts, "projections", "ebitda_exit_mm")
-        ebitda_margin_exit = get_numeric_safe(facts, "projections", "ebitda_margin_exit_pct")
-        exit_multiple = get_numeric_safe(facts, "projections", "exit_multiple_ev_ebitda")
+        revenue_exit = projections["revenue_exit_mm"]
+        revenue_cagr_proj = projections["revenue_cagr_projected_pct"]
+        ebitda_exit = projections["ebitda_exit_mm"]
+        ebitda_margin_exit = projections["ebitda_margin_exit_pct"]
+        exit_multiple = projections["exit_multiple_ev_ebitda"]
         
         # Datas e textos
-        revenue_cagr_period = get_text_safe(facts, "financials_history", "revenue_cagr_period")
-        exit_year = get_numeric_safe(facts, "projections", "exit_year")
-        growth_drivers = get_text_safe(facts, "projections", "growth_drivers")
-        financials_commentary = get_text_safe(facts, "financials_history", "financials_commentary")
-        projections_commentary = get_text_safe(facts, "projections", "projections_commentary")
+        revenue_cagr_period = history["revenue_cagr_period"]
+        exit_year = projections["exit_year"]
+        growth_drivers = projections["growth_drivers"]
+        financials_commentary = history["financials_commentary"]
+        projections_commentary = projections["projections_commentary"]
         
         # Placeholders apenas para validação do prompt
         if revenue_cagr_period is None:
@@ -151,20 +205,17 @@ ESTRUTURA OBRIGATÓRIA - 2-3 PARÁGRAFOS
   - Abertura típica: "Entre [ano inicial] e [ano final], o faturamento da **{company_name}** apresentou CAGR de {revenue_cagr or 'X'}%, passando de {currency_symbol} [valor inicial]m para {currency_symbol} {revenue_current or 'Y'}m."
   - Drivers de crescimento: "sustentado por [fator 1] e [fator 2]"
   - EBITDA: "O EBITDA cresceu de {currency_symbol} [valor inicial]m para {currency_symbol} {ebitda_current or 'Y'}m no mesmo período."
-  - Se dados ausentes: "O faturamento da **{company_name}** apresentou crescimento consistente no período analisado."
 
 § PARÁGRAFO 2 - Margens e Dívida (2-3 frases):
   - Evolução de margem bruta e EBITDA: "A margem bruta tem flutuado entre X% e Y%, fechando [ano] em {gross_margin or 'Z'}%."
   - Patamar atual: "Em [ano atual], a margem EBITDA foi de {ebitda_margin or 'X'}% ({currency_symbol} {ebitda_current or 'Y'}m de EBITDA)."
   - Posição de dívida: "A empresa opera com dívida líquida de {currency_symbol} {net_debt or 'X'}m ({leverage or 'Y,Z'}x EBITDA)" ou "dívida líquida zero/positiva"
   - Conversão de caixa: "com conversão de {cash_conversion or 'X'}% do EBITDA"
-  - Se dívida ausente: "A empresa apresenta posição financeira saudável"
 
 § PARÁGRAFO 3 - Projeções (opcional, 2-3 frases):
   - Cenário base: "No cenário base, projeta-se receita de {currency_symbol} {revenue_exit or 'X'}m em {exit_year} (CAGR de {revenue_cagr_proj or 'Y'}%)"
   - Drivers: "sustentado por {growth_drivers}"
   - Margem e múltiplo: "Com margem EBITDA de {ebitda_margin_exit or 'X'}%, o EBITDA na saída seria de {currency_symbol} {ebitda_exit or 'Y'}m, resultando em saída a {exit_multiple or 'Z,W'}x EBITDA"
-  - Se projeções ausentes: Mencione apenas que há projeções de crescimento
 
 ═══════════════════════════════════════════════════════════════════════
 VOCABULÁRIO ESPECÍFICO DE FINANCIALS (USE NATURALMENTE)
@@ -298,10 +349,7 @@ INSTRUÇÕES FINAIS
 
 Comece AGORA com o primeiro parágrafo (histórico de receita):"""
 
-        messages = [
+        return [
             SystemMessage(content=system_prompt),
             HumanMessage(content=user_prompt)
         ]
-
-        response = llm.invoke(messages)
-        return fix_number_formatting(response.content.strip())
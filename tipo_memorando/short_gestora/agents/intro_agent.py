@@ -3,20 +3,54 @@ Agente especializado em INTRODUÇÃO para Short Memo Gestora
 
 """
 
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, List, Optional
+from model_config import OPENAI_SEED, get_openai_llm
+from core.llm_cache import invoke_cached
 from langchain_core.messages import SystemMessage, HumanMessage
-import os
 from ..facts_builder import build_facts_section
 from ..validator import fix_number_formatting
+from ._async import agenerate_section
 from ..facts_utils import get_name_safe, get_currency_safe, get_numeric_safe, get_text_safe
 from ..._base.format_utils import get_currency_symbol, get_currency_label
 
 
+# ===== SYSTEM PROMPT =====
+# Sem dados do deal: o prompt de sistema é idêntico entre memos (prefixo
+# reaproveitado pelo cache de prompt do provedor); nomes e moeda vão no
+# bloco CONTEXTO DO DEAL da mensagem do usuário
+_SYSTEM_PROMPT = """Você é um analista sênior de Private Equity escrevendo a seção "Introdução" de um Short Memo de Co-investimento (gestora) para o comitê da Spectra.
+
+**OBRIGATÓRIO: EXATAMENTE 2 PARÁGRAFOS. Nada mais.**
+
+═══════════════════════════════════════════════════════════════════════
+PARÁGRAFO 1 (contexto e negócio)
+═══════════════════════════════════════════════════════════════════════
+- Primeira frase: "[Gestora] nos apresentou a oportunidade de co-investir na [Empresa]." (use os nomes do CONTEXTO DO DEAL).
+- Em seguida: "A [empresa] é uma empresa que [descrição do negócio em 2-4 frases]." Descreva o que a empresa faz, como opera, posicionamento (use business_description e contexto dos facts). Ex.: "A Hero é uma empresa que opera o seguro na ponta: desenvolve o produto, define preços e critérios de aceitação, distribui nos canais e gerencia a operação, enquanto a seguradora parceira carrega o risco e responde pelos sinistros."
+
+═══════════════════════════════════════════════════════════════════════
+PARÁGRAFO 2 (transação e alocação)
+═══════════════════════════════════════════════════════════════════════
+- Comece: "A transação consiste em comprar [X]% da companhia, por [valor] ([múltiplo] EBITDA [período])."
+- Detalhe o montante: "Desse montante, [valor] seriam pagos à vista ([múltiplo]x EBITDA), [valor] em [prazo], [indexador], e [valor] via compensação de dividendos" (ou o que constar nos facts: à vista, seller note, earn-out).
+- Feche: "A ideia da gestora é alocar [valor/faixa] pelo fundo e captar o restante junto a co-investidores." Use os facts de alocação/coinvestimento quando disponíveis.
+
+═══════════════════════════════════════════════════════════════════════
+REGRAS
+═══════════════════════════════════════════════════════════════════════
+✅ Use os números EXATOS dos facts (moeda do CONTEXTO DO DEAL, milhões, %, múltiplos)
+✅ Tom profissional, primeira pessoa plural
+✅ NÃO use bullets, títulos ou numeração
+✅ NÃO invente dados; se faltar dado, omita ou use "a definir"
+✅ Separe os dois parágrafos com uma linha em branco
+
+**OUTPUT:** Apenas os 2 parágrafos, sem título "Introdução"."""
+
+
 class IntroAgent:
     """Agente especializado em gerar Introdução para Short Memo Gestora"""
     
-    def __init__(self, model: str = "gpt-4o", temperature: float = 0.25):
+    def __init__(self, model: str = "gpt-4o", temperature: float = 0.0):
         """
         Inicializa agente de Introdução.
         
@@ -33,6 +67,12 @@ class IntroAgent:
         """Injeta LLM compartilhado (usado pelo LangGraph orchestrator)"""
         self.llm = llm
     
+    def _get_llm(self):
+        """LLM injetado se disponível, senão o cliente compartilhado (compatibilidade)"""
+        if not self.llm:
+            self.llm = get_openai_llm(self.model, self.temperature, seed=OPENAI_SEED)
+        return self.llm
+    
     def generate(self, facts: Dict[str, Any], rag_context: Optional[str] = None) -> str:
         """
         Gera seção de Introdução contextualizando gestora, ativo e transação.
@@ -44,15 +84,32 @@ class IntroAgent:
         Returns:
             Texto da seção (parágrafos separados por \\n\\n)
         """
-        # Usar LLM injetado se disponível, senão criar novo (compatibilidade)
-        if not self.llm:
-            apikey = os.getenv("OPENAI_API_KEY")
-            if not apikey:
-                raise ValueError("OPENAI_API_KEY não encontrada no ambiente")
-            self.llm = ChatOpenAI(model=self.model, api_key=apikey, temperature=self.temperature)
+        llm = self._get_llm()
+        messages = self.build_messages(facts, rag_context)
         
-        llm = self.llm
-
+        # Regeração com as mesmas mensagens reaproveita a resposta (se LLM_RESPONSE_CACHE=true)
+        content = invoke_cached(llm, messages)
+        return fix_number_formatting(content.strip())
+    
+    async def agenerate(self, facts: Dict[str, Any], rag_context: Optional[str] = None) -> str:
+        """Versão assíncrona de generate (ver _async.agenerate_section)."""
+        return await agenerate_section(self, facts, rag_context)
+    
+    def build_messages(
+        self,
+        facts: Dict[str, Any],
+        rag_context: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Monta as mensagens (system + user) da seção sem chamar o LLM.
+        
+        Args:
+            facts: Facts extraídos do CIM
+            rag_context: Contexto opcional do documento original
+        
+        Returns:
+            Lista [SystemMessage, HumanMessage]
+        """
         # ===== QUERY DOS FACTS =====
         # Seção gestora: track record, equipe, tese, performance (extraídos pelo prompt gestora.txt)
         gestora_section = build_facts_section(
@@ -117,35 +174,6 @@ class IntroAgent:
         if business_description is None:
             business_description = "[descrição do negócio]"
         
-        # ===== SYSTEM PROMPT =====
-        system_prompt = f"""Você é um analista sênior de Private Equity escrevendo a seção "Introdução" de um Short Memo de Co-investimento (gestora) para o comitê da Spectra.
-
-**OBRIGATÓRIO: EXATAMENTE 2 PARÁGRAFOS. Nada mais.**
-
-═══════════════════════════════════════════════════════════════════════
-PARÁGRAFO 1 (contexto e negócio)
-═══════════════════════════════════════════════════════════════════════
-- Primeira frase: "[{gestora_name}] nos apresentou a oportunidade de co-investir na [{company_name}]." (use os nomes dos facts).
-- Em seguida: "A [empresa] é uma empresa que [descrição do negócio em 2-4 frases]." Descreva o que a empresa faz, como opera, posicionamento (use business_description e contexto dos facts). Ex.: "A Hero é uma empresa que opera o seguro na ponta: desenvolve o produto, define preços e critérios de aceitação, distribui nos canais e gerencia a operação, enquanto a seguradora parceira carrega o risco e responde pelos sinistros."
-
-═══════════════════════════════════════════════════════════════════════
-PARÁGRAFO 2 (transação e alocação)
-═══════════════════════════════════════════════════════════════════════
-- Comece: "A transação consiste em comprar [X]% da companhia, por [valor] ([múltiplo] EBITDA [período])."
-- Detalhe o montante: "Desse montante, [valor] seriam pagos à vista ([múltiplo]x EBITDA), [valor] em [prazo], [indexador], e [valor] via compensação de dividendos" (ou o que constar nos facts: à vista, seller note, earn-out).
-- Feche: "A ideia da gestora é alocar [valor/faixa] pelo fundo e captar o restante junto a co-investidores." Use os facts de alocação/coinvestimento quando disponíveis.
-
-═══════════════════════════════════════════════════════════════════════
-REGRAS
-═══════════════════════════════════════════════════════════════════════
-✅ Use os números EXATOS dos facts ({currency_symbol}, milhões, %, múltiplos)
-✅ Tom profissional, primeira pessoa plural
-✅ NÃO use bullets, títulos ou numeração
-✅ NÃO invente dados; se faltar dado, omita ou use "a definir"
-✅ Separe os dois parágrafos com uma linha em branco
-
-**OUTPUT:** Apenas os 2 parágrafos, sem título "Introdução"."""
-
         # ===== USER PROMPT =====
         rag_section = ""
         if rag_context:
@@ -174,6 +202,14 @@ DADOS ESTRUTURADOS (FACTS)
 [TRANSAÇÃO]
 {transaction_section}
 {rag_section}
+═══════════════════════════════════════════════════════════════════════
+CONTEXTO DO DEAL
+═══════════════════════════════════════════════════════════════════════
+
+Gestora: {gestora_name}
+Empresa: {company_name}
+Moeda: {currency_symbol}
+
 ═══════════════════════════════════════════════════════════════════════
 INSTRUÇÃO
 ═══════════════════════════════════════════════════════════════════════
@@ -183,11 +219,8 @@ Gere EXATAMENTE 2 parágrafos conforme o modelo:
 - Parágrafo 2: "A transação consiste em comprar [X]% da companhia, por [valor] ([múltiplo] EBITDA). Desse montante, [à vista], [parcelado], [dividendos]. A ideia da gestora é alocar [valor] pelo fundo e captar o restante junto a co-investidores."
 
 Use os números e nomes EXATOS dos facts. Comece agora:"""
-
-        messages = [
-            SystemMessage(content=system_prompt),
+        
+        return [
+            SystemMessage(content=_SYSTEM_PROMPT),
             HumanMessage(content=user_prompt)
         ]
-        
-        response = llm.invoke(messages)
-        return fix_number_formatting(response.content.strip())
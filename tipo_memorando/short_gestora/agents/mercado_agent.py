@@ -4,20 +4,88 @@ Agente de Mercado - Short Memo Gestora
 Responsável por gerar a seção "Mercado" com análise de tamanho, dinâmica e competição.
 """
 
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, List, Optional
+from model_config import OPENAI_SEED, get_openai_llm
+from core.llm_cache import invoke_cached
 from langchain_core.messages import SystemMessage, HumanMessage
-import os
 from ..facts_builder import build_facts_section
 from ..validator import fix_number_formatting
+from ._async import agenerate_section
 from ..facts_utils import get_name_safe, get_text_safe
 from ..._base.format_utils import get_currency_symbol
 
 
+# ===== SYSTEM PROMPT =====
+# Sem dados do deal: o prompt de sistema é idêntico entre memos (prefixo
+# reaproveitado pelo cache de prompt do provedor); o nome da empresa vai
+# no bloco CONTEXTO DO DEAL da mensagem do usuário
+_SYSTEM_PROMPT = """Você é um analista sênior de Private Equity com 15 anos de experiência escrevendo a seção "Mercado" de um Short Memo de Co-investimento para o comitê de investimento da Spectra Capital. [Empresa] é o nome informado no CONTEXTO DO DEAL.
+
+═══════════════════════════════════════════════════════════════════════
+ESTRUTURA OBRIGATÓRIA - 2-3 PARÁGRAFOS
+═══════════════════════════════════════════════════════════════════════
+
+§ PARÁGRAFO 1 - Mercado e Posicionamento (2-3 frases):
+  - Abertura típica: "O mercado de [setor] apresenta [característica]..."
+  - Tamanho e crescimento: mencione valores, CAGR com período (se disponível)
+  - Posicionamento: "A **[Empresa]** se posiciona como [one-stop-shop/líder/especialista]..."
+  - Modelo de atuação: integração vertical, nicho específico, etc.
+
+§ PARÁGRAFO 2 - Dinâmica Competitiva (3-5 frases):
+  - Segmentação: "O mercado é segmentado por [porte/região/especialização]..."
+  - Fragmentação: mencione quantos players existem (fragmentado/consolidado)
+  - Market share se disponível: "A **[Empresa]** detém X% de participação"
+  - Competidores: "Apesar disso, tem competidores relevantes como [LISTE NOMES ESPECÍFICOS]."
+  - **CRÍTICO:** SEMPRE liste pelo menos 2-3 nomes de competidores se disponíveis
+
+§ PARÁGRAFO 3 - Diferenciais Competitivos (formato numerado inline):
+  - **OBRIGATÓRIO começar com:** "Os principais diferenciais competitivos da **[Empresa]** são:"
+  - Liste 4-6 itens no formato: "(i) [Nome do diferencial] — [explicação de 1-2 linhas]; (ii) [Nome] — [explicação]; ..."
+  - Use travessão (—) depois do nome do diferencial, não hífen ou dois pontos
+  - **SEMPRE** termine itens com ponto-e-vírgula (;), EXCETO o último que termina com ponto final (.)
+  - Diferenciais típicos: Marca, Parceria OEM, Localização, Base de clientes, Certificações, Know-how, Switching costs
+
+═══════════════════════════════════════════════════════════════════════
+VOCABULÁRIO ESPECÍFICO DE MERCADO (USE NATURALMENTE)
+═══════════════════════════════════════════════════════════════════════
+
+✅ "mercado fragmentado/consolidado", "pulverizado"
+✅ "posiciona-se como", "one-stop-shop", "integração vertical", "verticalmente integrado"
+✅ "diferenciais competitivos", "switching costs", "custos de troca"
+✅ "base pulverizada", "alta recorrência", "receita recorrente"
+✅ "barreiras de entrada", "moat competitivo"
+✅ "dinâmica competitiva", "landscape competitivo"
+
+═══════════════════════════════════════════════════════════════════════
+REGRAS DE ESTILO (NÃO NEGOCIÁVEIS)
+═══════════════════════════════════════════════════════════════════════
+
+✅ Tom profissional e analítico
+✅ Quantifique TUDO: tamanho de mercado, CAGR (com período), market share, número de competidores
+✅ Use **negrito** para: empresa ([Empresa]), valores, percentuais
+✅ Seja específico sobre competidores - SEMPRE liste nomes se disponíveis
+✅ Cada parágrafo: 3-5 frases, bem conectadas
+✅ NÃO invente dados: se campo estiver vazio, use frases genéricas apropriadas
+✅ NÃO use bullets, numerações ou títulos - apenas parágrafos fluidos (exceto diferenciais inline)
+✅ Separe parágrafos com linha em branco
+
+═══════════════════════════════════════════════════════════════════════
+TRATAMENTO DE DADOS AUSENTES
+═══════════════════════════════════════════════════════════════════════
+
+- **Sem tamanho de mercado:** "O mercado de [setor] apresenta crescimento consistente..."
+- **Sem market share:** "A empresa se posiciona entre os principais players do segmento..."
+- **Sem número de competidores:** "O mercado apresenta dinâmica competitiva com diversos players..."
+- **Sem lista de competidores:** Mencione genericamente "competidores estabelecidos no segmento"
+- **SEMPRE** mencione diferenciais competitivos mesmo com RAG limitado (use facts como base)
+
+**OUTPUT:** Apenas os 2-3 parágrafos, sem título de seção."""
+
+
 class MercadoAgent:
     """Agente especializado em geração de Mercado para Short Memo Gestora."""
     
-    def __init__(self, model: str = "gpt-4o", temperature: float = 0.25):
+    def __init__(self, model: str = "gpt-4o", temperature: float = 0.0):
         self.model = model
         self.temperature = temperature
         self.section_name = "Mercado"
@@ -27,6 +95,12 @@ class MercadoAgent:
         """Injeta LLM compartilhado (usado pelo LangGraph orchestrator)"""
         self.llm = llm
     
+    def _get_llm(self):
+        """LLM injetado se disponível, senão o cliente compartilhado (compatibilidade)"""
+        if not self.llm:
+            self.llm = get_openai_llm(self.model, self.temperature, seed=OPENAI_SEED)
+        return self.llm
+    
     def generate(
         self,
         facts: Dict[str, Any],
@@ -42,15 +116,36 @@ class MercadoAgent:
         Returns:
             Texto da seção (2-3 parágrafos)
         """
-        # Usar LLM injetado se disponível, senão criar novo (compatibilidade)
-        if not self.llm:
-            apikey = os.getenv("OPENAI_API_KEY")
-            if not apikey:
-                raise ValueError("OPENAI_API_KEY não encontrada no ambiente")
-            self.llm = ChatOpenAI(model=self.model, api_key=apikey, temperature=self.temperature)
+        llm = self._get_llm()
+        messages = self.build_messages(facts, rag_context)
         
-        llm = self.llm
-
+        # Regeração com as mesmas mensagens reaproveita a resposta (se LLM_RESPONSE_CACHE=true)
+        content = invoke_cached(llm, messages)
+        return fix_number_formatting(content.strip())
+    
+    async def agenerate(
+        self,
+        facts: Dict[str, Any],
+        rag_context: Optional[str] = None
+    ) -> str:
+        """Versão assíncrona de generate (ver _async.agenerate_section)."""
+        return await agenerate_section(self, facts, rag_context)
+    
+    def build_messages(
+        self,
+        facts: Dict[str, Any],
+        rag_context: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Monta as mensagens (system + user) da seção sem chamar o LLM.
+        
+        Args:
+            facts: Dict com facts estruturados
+            rag_context: Contexto opcional
+        
+        Returns:
+            Lista [SystemMessage, HumanMessage]
+        """
         # ===== QUERY DOS FACTS =====
         identification_section = build_facts_section(
             facts, "identification",
@@ -94,69 +189,6 @@ class MercadoAgent:
         if main_competitors is None:
             main_competitors = ""
 
-        # ===== SYSTEM PROMPT =====
-        system_prompt = f"""Você é um analista sênior de Private Equity com 15 anos de experiência escrevendo a seção "Mercado" de um Short Memo de Co-investimento para o comitê de investimento da Spectra Capital.
-
-═══════════════════════════════════════════════════════════════════════
-ESTRUTURA OBRIGATÓRIA - 2-3 PARÁGRAFOS
-═══════════════════════════════════════════════════════════════════════
-
-§ PARÁGRAFO 1 - Mercado e Posicionamento (2-3 frases):
-  - Abertura típica: "O mercado de [setor] apresenta [característica]..."
-  - Tamanho e crescimento: mencione valores, CAGR com período (se disponível)
-  - Posicionamento: "A **{company_name}** se posiciona como [one-stop-shop/líder/especialista]..."
-  - Modelo de atuação: integração vertical, nicho específico, etc.
-
-§ PARÁGRAFO 2 - Dinâmica Competitiva (3-5 frases):
-  - Segmentação: "O mercado é segmentado por [porte/região/especialização]..."
-  - Fragmentação: mencione quantos players existem (fragmentado/consolidado)
-  - Market share se disponível: "A **{company_name}** detém X% de participação"
-  - Competidores: "Apesar disso, tem competidores relevantes como [LISTE NOMES ESPECÍFICOS]."
-  - **CRÍTICO:** SEMPRE liste pelo menos 2-3 nomes de competidores se disponíveis
-
-§ PARÁGRAFO 3 - Diferenciais Competitivos (formato numerado inline):
-  - **OBRIGATÓRIO começar com:** "Os principais diferenciais competitivos da **{company_name}** são:"
-  - Liste 4-6 itens no formato: "(i) [Nome do diferencial] — [explicação de 1-2 linhas]; (ii) [Nome] — [explicação]; ..."
-  - Use travessão (—) depois do nome do diferencial, não hífen ou dois pontos
-  - **SEMPRE** termine itens com ponto-e-vírgula (;), EXCETO o último que termina com ponto final (.)
-  - Diferenciais típicos: Marca, Parceria OEM, Localização, Base de clientes, Certificações, Know-how, Switching costs
-
-═══════════════════════════════════════════════════════════════════════
-VOCABULÁRIO ESPECÍFICO DE MERCADO (USE NATURALMENTE)
-═══════════════════════════════════════════════════════════════════════
-
-✅ "mercado fragmentado/consolidado", "pulverizado"
-✅ "posiciona-se como", "one-stop-shop", "integração vertical", "verticalmente integrado"
-✅ "diferenciais competitivos", "switching costs", "custos de troca"
-✅ "base pulverizada", "alta recorrência", "receita recorrente"
-✅ "barreiras de entrada", "moat competitivo"
-✅ "dinâmica competitiva", "landscape competitivo"
-
-═══════════════════════════════════════════════════════════════════════
-REGRAS DE ESTILO (NÃO NEGOCIÁVEIS)
-═══════════════════════════════════════════════════════════════════════
-
-✅ Tom profissional e analítico
-✅ Quantifique TUDO: tamanho de mercado, CAGR (com período), market share, número de competidores
-✅ Use **negrito** para: empresa ({company_name}), valores, percentuais
-✅ Seja específico sobre competidores - SEMPRE liste nomes se disponíveis
-✅ Cada parágrafo: 3-5 frases, bem conectadas
-✅ NÃO invente dados: se campo estiver vazio, use frases genéricas apropriadas
-✅ NÃO use bullets, numerações ou títulos - apenas parágrafos fluidos (exceto diferenciais inline)
-✅ Separe parágrafos com linha em branco
-
-═══════════════════════════════════════════════════════════════════════
-TRATAMENTO DE DADOS AUSENTES
-═══════════════════════════════════════════════════════════════════════
-
-- **Sem tamanho de mercado:** "O mercado de [setor] apresenta crescimento consistente..."
-- **Sem market share:** "A empresa se posiciona entre os principais players do segmento..."
-- **Sem número de competidores:** "O mercado apresenta dinâmica competitiva com diversos players..."
-- **Sem lista de competidores:** Mencione genericamente "competidores estabelecidos no segmento"
-- **SEMPRE** mencione diferenciais competitivos mesmo com RAG limitado (use facts como base)
-
-**OUTPUT:** Apenas os 2-3 parágrafos, sem título de seção."""
-
         # ===== USER PROMPT =====
         rag_section = ""
         if rag_context:
@@ -189,6 +221,12 @@ DADOS ESTRUTURADOS (FACTS) - USE EXATAMENTE COMO FORNECIDO
 [ASPECTOS QUALITATIVOS E COMPETITIVOS]
 {qualitative_section}
 {rag_section}
+═══════════════════════════════════════════════════════════════════════
+CONTEXTO DO DEAL
+═══════════════════════════════════════════════════════════════════════
+
+Empresa: {company_name}
+
 ═══════════════════════════════════════════════════════════════════════
 INSTRUÇÕES FINAIS
 ═══════════════════════════════════════════════════════════════════════
@@ -202,11 +240,8 @@ INSTRUÇÕES FINAIS
 7. Mantenha tom profissional e crítico
 
 Comece AGORA com o primeiro parágrafo (tamanho e posicionamento do mercado):"""
-
-        messages = [
-            SystemMessage(content=system_prompt),
+        
+        return [
+            SystemMessage(content=_SYSTEM_PROMPT),
             HumanMessage(content=user_prompt)
         ]
-
-        response = llm.invoke(messages)
-        return fix_number_formatting(response.content.strip())
@@ -14,10 +14,10 @@ ESTRUTURA:
 VERSÃO: 1.0
 """
 
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, List, Optional
+from model_config import OPENAI_SEED, get_openai_llm
+from core.llm_cache import invoke_cached
 from langchain_core.messages import SystemMessage, HumanMessage
-import os
 from ..facts_builder import build_facts_section
 from ..validator import fix_number_formatting
 
@@ -25,7 +25,7 @@ from ..validator import fix_number_formatting
 class OportunidadeAgent:
     """Agente especializado em gerar Oportunidade para Short Memo Gestora"""
     
-    def __init__(self, model: str = "gpt-4o", temperature: float = 0.25):
+    def __init__(self, model: str = "gpt-4o", temperature: float = 0.0):
         """
         Inicializa agente de Oportunidade.
         
@@ -42,6 +42,12 @@ class OportunidadeAgent:
         """Injeta LLM compartilhado (usado pelo LangGraph orchestrator)"""
         self.llm = llm
     
+    def _get_llm(self):
+        """LLM injetado se disponível, senão o cliente compartilhado (compatibilidade)"""
+        if not self.llm:
+            self.llm = get_openai_llm(self.model, self.temperature, seed=OPENAI_SEED)
+        return self.llm
+    
     def generate(self, facts: Dict[str, Any], rag_context: Optional[str] = None) -> str:
         """
         Gera seção de Oportunidade.
@@ -53,6 +59,28 @@ class OportunidadeAgent:
         Returns:
             Texto da seção (parágrafos separados por \\n\\n)
         """
+        llm = self._get_llm()
+        messages = self.build_messages(facts, rag_context)
+        
+        # Regeração com as mesmas mensagens reaproveita a resposta (se LLM_RESPONSE_CACHE=true)
+        content = invoke_cached(llm, messages)
+        return fix_number_formatting(content.strip())
+    
+    def build_messages(
+        self,
+        facts: Dict[str, Any],
+        rag_context: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Monta as mensagens (system + user) da seção sem chamar o LLM.
+        
+        Args:
+            facts: Facts extraídos do CIM
+            rag_context: Contexto opcional do documento original
+        
+        Returns:
+            Lista [SystemMessage, HumanMessage]
+        """
         # 1. Query de facts relevantes
         fund_structure_section = build_facts_section(facts, "transacao", [
             "fund_size_target", "fund_size_committed", "fund_vintage",
@@ -105,22 +133,7 @@ OUTPUT: Retorne APENAS os parágrafos, sem títulos ou marcadores."""
 
 Lembre-se: 2-3 parágrafos, foco em estrutura do fundo, termos econômicos e racional de timing."""
         
-        # 5. Gerar com LLM
-        # Usar LLM injetado se disponível, senão criar novo (compatibilidade)
-        if not self.llm:
-            apikey = os.getenv("OPENAI_API_KEY")
-            if not apikey:
-                raise ValueError("OPENAI_API_KEY não encontrada no ambiente")
-            self.llm = ChatOpenAI(model=self.model, api_key=apikey, temperature=self.temperature)
-        
-        llm = self.llm
-        
-        messages = [
+        return [
             SystemMessage(content=system_prompt),
             HumanMessage(content=human_prompt)
         ]
-        
-        response = llm.invoke(messages)
-        
-        # 6. Pós-processamento
-        return fix_number_formatting(response.content.strip())
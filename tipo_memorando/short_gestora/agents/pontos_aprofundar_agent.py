@@ -4,19 +4,20 @@ Agente de Pontos a Aprofundar - Short Memo Gestora
 Responsável por gerar a seção "Pontos a Aprofundar" com questões críticas para DD.
 """
 
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, List, Optional
+from model_config import OPENAI_SEED, get_openai_llm
+from core.llm_cache import invoke_cached
 from langchain_core.messages import SystemMessage, HumanMessage
-import os
 from ..facts_builder import build_facts_section
 from ..validator import fix_number_formatting
+from ._async import agenerate_section
 from ..facts_utils import get_name_safe, get_text_safe
 
 
 class PontosAprofundarAgent:
     """Agente especializado em geração de Pontos a Aprofundar para Short Memo Gestora."""
     
-    def __init__(self, model: str = "gpt-4o", temperature: float = 0.25):
+    def __init__(self, model: str = "gpt-4o", temperature: float = 0.0):
         self.model = model
         self.temperature = temperature
         self.section_name = "Pontos a Aprofundar"
@@ -26,6 +27,12 @@ class PontosAprofundarAgent:
         """Injeta LLM compartilhado (usado pelo LangGraph orchestrator)"""
         self.llm = llm
     
+    def _get_llm(self):
+        """LLM injetado se disponível, senão o cliente compartilhado (compatibilidade)"""
+        if not self.llm:
+            self.llm = get_openai_llm(self.model, self.temperature, seed=OPENAI_SEED)
+        return self.llm
+    
     def generate(
         self,
         facts: Dict[str, Any],
@@ -41,15 +48,36 @@ class PontosAprofundarAgent:
         Returns:
             Texto da seção (lista organizada)
         """
-        # Usar LLM injetado se disponível, senão criar novo (compatibilidade)
-        if not self.llm:
-            apikey = os.getenv("OPENAI_API_KEY")
-            if not apikey:
-                raise ValueError("OPENAI_API_KEY não encontrada no ambiente")
-            self.llm = ChatOpenAI(model=self.model, api_key=apikey, temperature=self.temperature)
+        llm = self._get_llm()
+        messages = self.build_messages(facts, rag_context)
         
-        llm = self.llm
-
+        # Regeração com as mesmas mensagens reaproveita a resposta (se LLM_RESPONSE_CACHE=true)
+        content = invoke_cached(llm, messages)
+        return fix_number_formatting(content.strip())
+    
+    async def agenerate(
+        self,
+        facts: Dict[str, Any],
+        rag_context: Optional[str] = None
+    ) -> str:
+        """Versão assíncrona de generate (ver _async.agenerate_section)."""
+        return await agenerate_section(self, facts, rag_context)
+    
+    def build_messages(
+        self,
+        facts: Dict[str, Any],
+        rag_context: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Monta as mensagens (system + user) da seção sem chamar o LLM.
+        
+        Args:
+            facts: Dict com facts estruturados
+            rag_context: Contexto opcional
+        
+        Returns:
+            Lista [SystemMessage, HumanMessage]
+        """
         # ===== QUERY DOS FACTS =====
         identification_section = build_facts_section(
             facts, "identification",
@@ -292,11 +320,8 @@ INSTRUÇÕES FINAIS
 9. Base-se EXCLUSIVAMENTE em informações disponíveis
 
 Comece AGORA com a frase de abertura seguida pelos pontos:"""
-
-        messages = [
+        
+        return [
             SystemMessage(content=system_prompt),
             HumanMessage(content=user_prompt)
         ]
-
-        response = llm.invoke(messages)
-        return fix_number_formatting(response.content.strip())
@@ -12,18 +12,48 @@ ESTRUTURA:
 VERSÃO: 1.0
 """
 
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, List, Optional
+from model_config import OPENAI_SEED, get_openai_llm
+from core.llm_cache import invoke_cached
 from langchain_core.messages import SystemMessage, HumanMessage
-import os
 from ..facts_builder import build_facts_section
 from ..validator import fix_number_formatting
 
 
+# Prompt de sistema constante (sem interpolação: montado uma única vez no import)
+_SYSTEM_PROMPT = """Você é um analista de Private Equity escrevendo a seção de RISCOS E CONSIDERAÇÕES de um Short Memo sobre uma gestora.
+
+CONTEXTO: Short Memo Gestora - identificação de pontos de atenção e riscos materiais.
+
+ESTRUTURA SUGERIDA (escolher formato mais adequado):
+OPÇÃO 1 - Parágrafos (2-3):
+- Parágrafo 1: Riscos de estratégia e mercado
+- Parágrafo 2: Riscos de portfólio e concentração
+- Parágrafo 3: Riscos de governança e equipe
+
+OPÇÃO 2 - Lista organizada por categoria:
+- **Estratégia**: [riscos estratégicos]
+- **Portfólio**: [concentração, exposição]
+- **Governança**: [equipe, key person]
+- **Mercado**: [ciclo, competição]
+
+REGRAS:
+- Tom objetivo e construtivo (não alarmista)
+- Foco em riscos MATERIAIS e quantificáveis
+- Mencione concentrações específicas: "XX% do portfólio em setor Y"
+- Avalie maturação do track record: "ZZ% do MOIC não realizado"
+- Identifique key person risks se relevante
+- Considere riscos de timing de mercado (valuations altos, saídas difíceis)
+- Seja balanceado: riscos sem exagero, mas sem omitir pontos críticos
+- Use dados e números quando disponível
+
+OUTPUT: Retorne APENAS os parágrafos ou lista organizada, sem títulos de seção."""
+
+
 class RiscosAgent:
     """Agente especializado em gerar Riscos e Considerações para Short Memo Gestora"""
     
-    def __init__(self, model: str = "gpt-4o", temperature: float = 0.25):
+    def __init__(self, model: str = "gpt-4o", temperature: float = 0.0):
         """
         Inicializa agente de Riscos e Considerações.
         
@@ -40,6 +70,12 @@ class RiscosAgent:
         """Injeta LLM compartilhado (usado pelo LangGraph orchestrator)"""
         self.llm = llm
     
+    def _get_llm(self):
+        """LLM injetado se disponível, senão o cliente compartilhado (compatibilidade)"""
+        if not self.llm:
+            self.llm = get_openai_llm(self.model, self.temperature, seed=OPENAI_SEED)
+        return self.llm
+    
     def generate(self, facts: Dict[str, Any], rag_context: Optional[str] = None) -> str:
         """
         Gera seção de Riscos e Considerações.
@@ -51,6 +87,28 @@ class RiscosAgent:
         Returns:
             Texto da seção (parágrafos ou lista organizada)
         """
+        llm = self._get_llm()
+        messages = self.build_messages(facts, rag_context)
+        
+        # Regeração com as mesmas mensagens reaproveita a resposta (se LLM_RESPONSE_CACHE=true)
+        content = invoke_cached(llm, messages)
+        return fix_number_formatting(content.strip())
+    
+    def build_messages(
+        self,
+        facts: Dict[str, Any],
+        rag_context: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Monta as mensagens (system + user) da seção sem chamar o LLM.
+        
+        Args:
+            facts: Facts extraídos do CIM
+            rag_context: Contexto opcional do documento original
+        
+        Returns:
+            Lista [SystemMessage, HumanMessage]
+        """
         # 1. Query de facts relevantes
         portfolio_risks_section = build_facts_section(facts, "qualitativo", [
             "portfolio_concentration", "sector_concentration",
@@ -72,35 +130,6 @@ class RiscosAgent:
             "conflicts_of_interest", "transparency"
         ])
         
-        # System prompt especializado
-        system_prompt = f"""Você é um analista de Private Equity escrevendo a seção de RISCOS E CONSIDERAÇÕES de um Short Memo sobre uma gestora.
-
-CONTEXTO: Short Memo Gestora - identificação de pontos de atenção e riscos materiais.
-
-ESTRUTURA SUGERIDA (escolher formato mais adequado):
-OPÇÃO 1 - Parágrafos (2-3):
-- Parágrafo 1: Riscos de estratégia e mercado
-- Parágrafo 2: Riscos de portfólio e concentração
-- Parágrafo 3: Riscos de governança e equipe
-
-OPÇÃO 2 - Lista organizada por categoria:
-- **Estratégia**: [riscos estratégicos]
-- **Portfólio**: [concentração, exposição]
-- **Governança**: [equipe, key person]
-- **Mercado**: [ciclo, competição]
-
-REGRAS:
-- Tom objetivo e construtivo (não alarmista)
-- Foco em riscos MATERIAIS e quantificáveis
-- Mencione concentrações específicas: "XX% do portfólio em setor Y"
-- Avalie maturação do track record: "ZZ% do MOIC não realizado"
-- Identifique key person risks se relevante
-- Considere riscos de timing de mercado (valuations altos, saídas difíceis)
-- Seja balanceado: riscos sem exagero, mas sem omitir pontos críticos
-- Use dados e números quando disponível
-
-OUTPUT: Retorne APENAS os parágrafos ou lista organizada, sem títulos de seção."""
-        
         # 4. Human prompt com facts
         human_prompt = f"""Gere a seção de RISCOS E CONSIDERAÇÕES para esta gestora:
 
@@ -114,22 +143,7 @@ OUTPUT: Retorne APENAS os parágrafos ou lista organizada, sem títulos de seç
 
 Lembre-se: Identifique riscos materiais de estratégia, portfólio, governança e mercado. Seja objetivo e construtivo."""
         
-        # 5. Gerar com LLM
-        # Usar LLM injetado se disponível, senão criar novo (compatibilidade)
-        if not self.llm:
-            apikey = os.getenv("OPENAI_API_KEY")
-            if not apikey:
-                raise ValueError("OPENAI_API_KEY não encontrada no ambiente")
-            self.llm = ChatOpenAI(model=self.model, api_key=apikey, temperature=self.temperature)
-        
-        llm = self.llm
-        
-        messages = [
-            SystemMessage(content=system_prompt),
+        return [
+            SystemMessage(content=_SYSTEM_PROMPT),
             HumanMessage(content=human_prompt)
         ]
-        
-        response = llm.invoke(messages)
-        
-        # 6. Pós-processamento
-        return fix_number_formatting(response.content.strip())
@@ -4,20 +4,21 @@ Agente de Transação - Short Memo Gestora
 Responsável por gerar a seção "Transação" com valuation e estrutura.
 """
 
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, List, Optional
+from model_config import OPENAI_SEED, get_openai_llm
+from core.llm_cache import invoke_cached
 from langchain_core.messages import SystemMessage, HumanMessage
-import os
 from ..facts_builder import build_facts_section
 from ..validator import fix_number_formatting
-from ..facts_utils import get_name_safe, get_numeric_safe, get_currency_safe
+from ._async import agenerate_section
+from ..facts_utils import get_name_safe, get_section_values_safe, get_currency_safe
 from ..._base.format_utils import get_currency_symbol, get_currency_label
 
 
 class TransacaoAgent:
     """Agente especializado em geração de Transação para Short Memo Gestora."""
     
-    def __init__(self, model: str = "gpt-4o", temperature: float = 0.25):
+    def __init__(self, model: str = "gpt-4o", temperature: float = 0.0):
         self.model = model
         self.temperature = temperature
         self.section_name = "Transação"
@@ -27,6 +28,12 @@ class TransacaoAgent:
         """Injeta LLM compartilhado (usado pelo LangGraph orchestrator)"""
         self.llm = llm
     
+    def _get_llm(self):
+        """LLM injetado se disponível, senão o cliente compartilhado (compatibilidade)"""
+        if not self.llm:
+            self.llm = get_openai_llm(self.model, self.temperature, seed=OPENAI_SEED)
+        return self.llm
+    
     def generate(
         self,
         facts: Dict[str, Any],
@@ -42,15 +49,36 @@ class TransacaoAgent:
         Returns:
             Texto da seção (3-4 parágrafos)
         """
-        # Usar LLM injetado se disponível, senão criar novo (compatibilidade)
-        if not self.llm:
-            apikey = os.getenv("OPENAI_API_KEY")
-            if not apikey:
-                raise ValueError("OPENAI_API_KEY não encontrada no ambiente")
-            self.llm = ChatOpenAI(model=self.model, api_key=apikey, temperature=self.temperature)
+        llm = self._get_llm()
+        messages = self.build_messages(facts, rag_context)
         
-        llm = self.llm
-
+        # Regeração com as mesmas mensagens reaproveita a resposta (se LLM_RESPONSE_CACHE=true)
+        content = invoke_cached(llm, messages)
+        return fix_number_formatting(content.strip())
+    
+    async def agenerate(
+        self,
+        facts: Dict[str, Any],
+        rag_context: Optional[str] = None
+    ) -> str:
+        """Versão assíncrona de generate (ver _async.agenerate_section)."""
+        return await agenerate_section(self, facts, rag_context)
+    
+    def build_messages(
+        self,
+        facts: Dict[str, Any],
+        rag_context: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Monta as mensagens (system + user) da seção sem chamar o LLM.
+        
+        Args:
+            facts: Dict com facts estruturados
+            rag_context: Contexto opcional
+        
+        Returns:
+            Lista [SystemMessage, HumanMessage]
+        """
         # ===== QUERY DOS FACTS =====
         identification_section = build_facts_section(
             facts, "identification",
@@ -119,10 +147,12 @@ class TransacaoAgent:
         company_name = get_name_safe(facts, "identification", "company_name", "[nome da empresa]")
         
         # Valores numéricos retornam None se desabilitados
-        irr_pct = get_numeric_safe(facts, "returns", "irr_pct")
-        moic = get_numeric_safe(facts, "returns", "moic")
-        exit_year = get_numeric_safe(facts, "projections", "exit_year")
-        exit_multiple = get_numeric_safe(facts, "projections", "exit_multiple_ev_ebitda")
+        returns = get_section_values_safe(facts, "returns", ("irr_pct", "moic"))
+        projections = get_section_values_safe(facts, "projections", ("exit_year", "exit_multiple_ev_ebitda"))
+        irr_pct = returns["irr_pct"]
+        moic = returns["moic"]
+        exit_year = projections["exit_year"]
+        exit_multiple = projections["exit_multiple_ev_ebitda"]
         
         # Placeholders apenas para validação do prompt
         if exit_year is None:
@@ -252,11 +282,8 @@ INSTRUÇÕES FINAIS
 6. Mantenha tom profissional e crítico
 
 Comece AGORA com o primeiro parágrafo (estrutura da transação):"""
-
-        messages = [
+        
+        return [
             SystemMessage(content=system_prompt),
             HumanMessage(content=user_prompt)
         ]
-
-        response = llm.invoke(messages)
-        return fix_number_formatting(response.content.strip())
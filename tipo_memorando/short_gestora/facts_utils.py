@@ -10,6 +10,7 @@ from facts.utils import (
     get_name_safe as _get_name_safe,
     get_numeric_safe,
     get_text_safe,
+    get_section_values_safe,
 )
 
 
@@ -56,4 +57,4 @@ def get_name_safe(
 
 
 # Re-exportar funções que não precisam de wrapper
-__all__ = ["get_currency_safe", "get_name_safe", "get_numeric_safe", "get_text_safe"]
\ No newline at end of file
+__all__ = ["get_currency_safe", "get_name_safe", "get_numeric_safe", "get_text_safe", "get_section_values_safe"]
\ No newline at end of file
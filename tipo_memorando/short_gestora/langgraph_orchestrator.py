@@ -6,6 +6,7 @@ Herda de BaseLangGraphOrchestrator toda lógica de orquestração.
 """
 
 from typing import Dict, Any
+from model_config import OPENAI_SEED
 from .._base.base_langgraph_orchestrator import BaseLangGraphOrchestrator
 
 
@@ -22,7 +23,7 @@ class GestaraLangGraphOrchestrator(BaseLangGraphOrchestrator):
         fixed_structure: Dict[str, Any],
         section_queries: Dict[str, str],
         model: str = "gpt-4o",
-        temperature: float = 0.25,
+        temperature: float = 0.0,
         max_retries: int = 2
     ):
         """
@@ -32,9 +33,12 @@ class GestaraLangGraphOrchestrator(BaseLangGraphOrchestrator):
             fixed_structure: Dict de {section_title: specialized_agent}
             section_queries: Dict de queries RAG específicas por seção
             model: Modelo LLM (default: gpt-4o)
-            temperature: Temperatura do LLM (default: 0.25)
+            temperature: Temperatura do LLM (default: 0.0, determinístico para o cache de respostas)
             max_retries: Máximo de tentativas de retry (default: 2)
         """
         # Inicializar a classe base (constrói o grafo + LLM)
-        # Passa section_queries para a classe base usar em _prepare_section
-        super().__init__(fixed_structure, section_queries, model, temperature, max_retries)
+        # Passa section_queries para a classe base usar em _prepare_section;
+        # seed fixa só nos clientes da Gestora
+        super().__init__(
+            fixed_structure, section_queries, model, temperature, max_retries, seed=OPENAI_SEED
+        )
@@ -7,6 +7,8 @@ ARQUITETURA:
 - Integração com core/few_shot.py para exemplos
 - Query de facts nos prompts para contextualização
 - LangGraph para orquestração com retry automático e validação
+- Seções geradas em paralelo (independentes entre si)
+- Regeração em massa via OpenAI Batch API (submit/collect_full_memo_batch)
 
 SEÇÕES FIXAS:
 1. Introdução → IntroAgent
@@ -19,11 +21,15 @@ SEÇÕES FIXAS:
 VERSÃO 3.0 - Reestruturação para co-investimentos
 """
 
-from typing import Dict, Any, Optional, TYPE_CHECKING
+import json
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from core.document_processor import DocumentProcessor
 
+from core.logger import get_logger
+from model_config import OPENAI_SEED
+
 from .agents import (
     IntroAgent,
     MercadoAgent,
@@ -32,7 +38,11 @@ from .agents import (
     TransacaoAgent,
     PontosAprofundarAgent,
 )
+from .._base.rag_prefetch import fetch_section_rag_contexts
 from .langgraph_orchestrator import GestaraLangGraphOrchestrator
+from .validator import fix_number_formatting
+
+logger = get_logger(__name__)
 
 
 # Estrutura FIXA (não pode ser alterada)
@@ -85,7 +95,7 @@ def generate_full_memo(
     memo_id: Optional[str] = None,
     processor: Optional["DocumentProcessor"] = None,
     model: str = "gpt-4o",
-    temperature: float = 0.25
+    temperature: float = 0.0
 ) -> Dict[str, list]:
     """
     Gera memo COMPLETO de Short Memo Gestora (estrutura fixa).
@@ -118,3 +128,143 @@ def generate_full_memo(
         processor=processor,
         rag_context=rag_context
     )
+
+
+# ============================================================================
+# GERAÇÃO EM LOTE (OpenAI Batch API)
+# ============================================================================
+
+# Papel de cada mensagem LangChain no formato da API da OpenAI
+_BATCH_ROLES = {"system": "system", "human": "user", "ai": "assistant"}
+
+# Status de um batch ainda em andamento (os demais, exceto "completed", são falhas)
+_BATCH_PENDING_STATUSES = {"validating", "in_progress", "finalizing"}
+
+
+def submit_full_memo_batch(
+    memos: List[Dict[str, Any]],
+    processor: Optional["DocumentProcessor"] = None,
+    model: str = "gpt-4o",
+    temperature: float = 0.0
+) -> str:
+    """
+    Envia a geração de vários memos para a Batch API da OpenAI.
+    
+    Para regerações em massa fora da UI: custo ~50% menor e sem limite de
+    RPM/TPM, mas o resultado pode levar até 24h. Cada (memo, seção) vira uma
+    requisição com as mesmas mensagens que o agente enviaria (build_messages).
+    
+    Args:
+        memos: Lista de {"memo_id": str, "facts": dict}
+        processor: DocumentProcessor para o RAG por seção (opcional)
+        model: Modelo OpenAI
+        temperature: Criatividade
+    
+    Returns:
+        ID do batch (usar em collect_full_memo_batch)
+    """
+    from openai import OpenAI
+    
+    lines = []
+    for memo in memos:
+        memo_id = memo["memo_id"]
+        rag_contexts = {}
+        if processor and memo_id:
+            rag_contexts = fetch_section_rag_contexts(
+                processor, memo_id, list(FIXED_STRUCTURE), SECTION_QUERIES
+            )
+        for section_title, agent in FIXED_STRUCTURE.items():
+            messages = agent.build_messages(memo["facts"], rag_contexts.get(section_title))
+            lines.append(json.dumps({
+                "custom_id": f"{memo_id}::{section_title}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "temperature": temperature,
+                    "seed": OPENAI_SEED,
+                    "messages": [
+                        {"role": _BATCH_ROLES[m.type], "content": m.content} for m in messages
+                    ],
+                },
+            }, ensure_ascii=False))
+    
+    client = OpenAI()
+    batch_file = client.files.create(
+        file=("short_memo_gestora_batch.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    logger.info("Batch %s enviado: %d memo(s), %d requisições", batch.id, len(memos), len(lines))
+    return batch.id
+
+
+def collect_full_memo_batch(batch_id: str) -> Optional[Dict[str, Dict[str, List[str]]]]:
+    """
+    Coleta o resultado de submit_full_memo_batch.
+    
+    Args:
+        batch_id: ID retornado por submit_full_memo_batch
+    
+    Returns:
+        {memo_id: {section_title: [paragraph1, ...]}} na ordem de FIXED_STRUCTURE,
+        ou None se o batch ainda está em andamento (validating, in_progress,
+        finalizing)
+    
+    Raises:
+        RuntimeError: Se o batch terminou sem concluir (failed, expired,
+            cancelling, cancelled), com os erros reportados pela API
+    """
+    from openai import OpenAI
+    
+    client = OpenAI()
+    batch = client.batches.retrieve(batch_id)
+    if batch.status in _BATCH_PENDING_STATUSES:
+        logger.info("Batch %s ainda não concluído (status: %s)", batch_id, batch.status)
+        return None
+    if batch.status != "completed":
+        errors = [
+            f"{error.code}: {error.message}" for error in getattr(batch.errors, "data", None) or []
+        ]
+        raise RuntimeError(
+            f"Batch {batch_id} terminou com status '{batch.status}'"
+            + (f": {'; '.join(errors)}" if errors else "")
+        )
+    
+    texts: Dict[str, Dict[str, str]] = {}
+    if batch.output_file_id:
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            memo_id, _, section_title = item["custom_id"].rpartition("::")
+            response = item.get("response") or {}
+            if response.get("status_code") == 200:
+                content = response["body"]["choices"][0]["message"]["content"] or ""
+                text = fix_number_formatting(content.strip())
+            else:
+                text = f"(Erro ao gerar seção: {item.get('error') or response.get('body')})"
+            texts.setdefault(memo_id, {})[section_title] = text
+    
+    # Requisições que falharam antes de gerar resposta ficam só no arquivo de erros
+    if batch.error_file_id:
+        for line in client.files.content(batch.error_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            memo_id, _, section_title = item["custom_id"].rpartition("::")
+            texts.setdefault(memo_id, {}).setdefault(
+                section_title, f"(Erro ao gerar seção: {item.get('error')})"
+            )
+    
+    return {
+        memo_id: {
+            section_title: [p.strip() for p in sections.get(section_title, "").split("\n\n") if p.strip()]
+            for section_title in FIXED_STRUCTURE
+        }
+        for memo_id, sections in texts.items()
+    }
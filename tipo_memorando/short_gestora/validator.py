@@ -7,9 +7,59 @@ Seguindo padrão estabelecido em shortmemo/searchfund/validator.py
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, Any
 
 
+# Padrões de fix_number_formatting (compilados uma única vez no import).
+# Moedas e métricas de retorno ficam em alternações únicas: os ramos nunca
+# casam no mesmo trecho e a saída de um não gera match para outro, então uma
+# passada equivale às substituições em sequência. Cada passada só roda se o
+# texto tiver o caractere literal que o padrão exige ("$", "." ou "%").
+_RE_MILHOES = re.compile(r'(R|US)\$\s*(\d+(?:[.,]\d+)?)\s*milh[õo]es?', re.IGNORECASE)
+_RE_MULTIPLE_DOT = re.compile(r'(\d+)\.(\d+)x')
+# Só casa com espaço antes do % ("38%" já está correto e não é reescrito)
+_RE_PCT_SPACE = re.compile(r'(\d)\s+%')
+_RE_RETURN_METRICS = re.compile(
+    r'(\d+)\.(\d+)(?:'
+    r'(?P<moic>\s*MOIC)'
+    r'|(?P<irr>%\s*(?:IRR|TIR))'
+    r'|(?P<multiple>x?(?P<space>\s*)(?P<metric>DPI|TVPI|RVPI))'
+    r')',
+    re.IGNORECASE
+)
+
+
+def _milhoes_repl(m: re.Match) -> str:
+    """R$/US$ XXX milhões → R$/US$ XXXm (prefixo normalizado para maiúsculas)."""
+    prefix = "US$" if m.group(1).upper() == "US" else "R$"
+    return f"{prefix} {m.group(2)}m"
+
+
+def _return_metrics_repl(m: re.Match) -> str:
+    """2.5 MOIC → 2,5x MOIC; 38.5% TIR → 38,5% IRR; 1.5x DPI → 1,5x DPI."""
+    number = f"{m.group(1)},{m.group(2)}"
+    if m.group("moic") is not None:
+        return f"{number}x MOIC"
+    if m.group("irr") is not None:
+        return f"{number}% IRR"
+    # Métrica como escrita quando separada do número por espaço; colada, vira DPI
+    return f"{number}x {m.group('metric') if m.group('space') else 'DPI'}"
+
+
+@lru_cache(maxsize=256)
+def _aum_pattern(aum_str: str) -> re.Pattern:
+    """Padrão de menção ao AUM (ex: "2.1", "2,1", "2100" ou "bilh"), compilado uma vez por valor."""
+    alt = int(float(aum_str)) if '.' not in aum_str else aum_str.replace('.', ',')
+    return re.compile(rf"{aum_str}|{alt}|bilh", re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _irr_pattern(irr_str: str) -> re.Pattern:
+    """Padrão de menção ao IRR (ponto ou vírgula decimal), compilado uma vez por valor."""
+    return re.compile(rf"{irr_str.replace('.', '[.,]')}%", re.IGNORECASE)
+
+
 def validate_memo_consistency(
     memo_text: str,
     facts: Dict[str, Any],
@@ -44,39 +94,42 @@ def validate_memo_consistency(
         aum = facts.get("identification", {}).get("aum_mm")
         if aum:
             # Aceita "R$ 2.1 bilhões" ou "R$ 2100m" ou "2,1 bilhões"
-            aum_str = str(aum)
-            if not re.search(rf"{aum_str}|{int(float(aum_str)) if '.' not in aum_str else aum_str.replace('.', ',')}|bilh", memo_text, re.IGNORECASE):
+            if not _aum_pattern(str(aum)).search(memo_text):
                 warnings.append(f"AUM de {aum} pode não estar mencionado corretamente")
         
         # Deve mencionar IRR médio
         irr = facts.get("performance", {}).get("irr_avg_pct")
         if irr:
-            irr_pattern = rf"{str(irr).replace('.', '[.,]')}%"
-            if not re.search(irr_pattern, memo_text, re.IGNORECASE):
+            if not _irr_pattern(str(irr)).search(memo_text):
                 warnings.append(f"IRR médio de {irr}% pode não estar mencionado")
     
     elif section == "track_record":
+        # Texto em minúsculas uma única vez para todas as palavras-chave
+        text_lower = memo_text.lower()
+        
         # Deve mencionar DPI
-        if "dpi" not in memo_text.lower():
+        if "dpi" not in text_lower:
             warnings.append("DPI (Distributions to Paid-In) não mencionado")
         
         # Deve mencionar TVPI ou valor total
-        if "tvpi" not in memo_text.lower() and "valor total" not in memo_text.lower():
+        if "tvpi" not in text_lower and "valor total" not in text_lower:
             warnings.append("TVPI ou valor total não mencionado")
         
         # Deve ter análise de concentração
-        if "top" not in memo_text.lower() and "concentra" not in memo_text.lower():
+        if "top" not in text_lower and "concentra" not in text_lower:
             warnings.append("Falta análise de concentração de retornos")
     
     elif section == "strategy":
+        text_lower = memo_text.lower()
+        
         # Deve mencionar setores de foco
         sectors = facts.get("strategy", {}).get("focus_sectors")
-        if sectors and "setor" not in memo_text.lower() and "foco" not in memo_text.lower():
+        if sectors and "setor" not in text_lower and "foco" not in text_lower:
             warnings.append("Setores de foco não claramente mencionados")
         
         # Deve mencionar ticket size
         ticket = facts.get("strategy", {}).get("ticket_size_mm")
-        if ticket and "ticket" not in memo_text.lower():
+        if ticket and "ticket" not in text_lower:
             warnings.append("Tamanho de ticket não mencionado")
     
     return {
@@ -103,26 +156,22 @@ def fix_number_formatting(text: str) -> str:
     Returns:
         Texto com formatação corrigida
     """
-    # R$ XXX milhões → R$ XXXm
-    text = re.sub(r'R\$\s*(\d+(?:[.,]\d+)?)\s*milh[õo]es?', r'R$ \1m', text, flags=re.IGNORECASE)
-    
-    # US$ XXX milhões → US$ XXXm
-    text = re.sub(r'US\$\s*(\d+(?:[.,]\d+)?)\s*milh[õo]es?', r'US$ \1m', text, flags=re.IGNORECASE)
+    # R$/US$ XXX milhões → R$/US$ XXXm
+    if "$" in text:
+        text = _RE_MILHOES.sub(_milhoes_repl, text)
     
     # Múltiplos com ponto → vírgula (3.5x → 3,5x)
-    text = re.sub(r'(\d+)\.(\d+)x', r'\1,\2x', text)
-    
-    # Espaço antes de % → sem espaço (38 % → 38%)
-    text = re.sub(r'(\d+)\s*%', r'\1%', text)
+    has_dot = "." in text
+    if has_dot:
+        text = _RE_MULTIPLE_DOT.sub(r'\1,\2x', text)
     
-    # MOIC: 2.5 → 2,5
-    text = re.sub(r'(\d+)\.(\d+)\s*MOIC', r'\1,\2x MOIC', text, flags=re.IGNORECASE)
+    # Espaço antes de % → sem espaço (38 % → 38%); precisa vir antes do IRR
+    if "%" in text:
+        text = _RE_PCT_SPACE.sub(r'\1%', text)
     
-    # IRR: 38.5% → 38,5%
-    text = re.sub(r'(\d+)\.(\d+)%\s*(?:IRR|TIR)', r'\1,\2% IRR', text, flags=re.IGNORECASE)
-    
-    # DPI/TVPI: 1.5x → 1,5x
-    text = re.sub(r'(\d+)\.(\d+)x?\s*(?:DPI|TVPI|RVPI)', lambda m: f"{m.group(1)},{m.group(2)}x {m.group(0).split()[-1] if len(m.group(0).split()) > 1 else 'DPI'}", text, flags=re.IGNORECASE)
+    # MOIC (2.5 → 2,5x), IRR/TIR (38.5% → 38,5% IRR) e DPI/TVPI/RVPI (1.5 → 1,5x)
+    if has_dot:
+        text = _RE_RETURN_METRICS.sub(_return_metrics_repl, text)
     
     return text
 
@@ -150,8 +199,8 @@ def check_section_length(
         }
     """
     # Conta parágrafos (separados por linha dupla)
-    paragraphs = [p.strip() for p in memo_text.split("\n\n") if p.strip()]
-    count = len(paragraphs)
+    # Só a contagem é usada: sem lista nem cópias via strip() (isspace() não aloca)
+    count = sum(1 for p in memo_text.split("\n\n") if p and not p.isspace())
     
     is_valid = min_paragraphs <= count <= max_paragraphs
     warning = ""
@@ -187,17 +236,21 @@ def validate_gestora_intro(memo_text: str, facts: Dict[str, Any]) -> Dict[str, A
     """
     errors = []
     
+    # Início do texto em minúsculas uma única vez para todas as palavras-chave
+    text_lower = memo_text[:400].lower()
+    opening, first_lines = text_lower[:200], text_lower[:300]
+    
     # Padrão obrigatório para Gestora
-    if "estamos avaliando" not in memo_text[:200].lower():
+    if "estamos avaliando" not in opening:
         errors.append("Primeira frase deve começar com 'Estamos avaliando a {gestora_name}'")
     
-    if "fundada em" not in memo_text[:300].lower():
+    if "fundada em" not in first_lines:
         errors.append("Falta menção ao ano de fundação")
     
-    if "foco em" not in memo_text[:300].lower() and "com foco" not in memo_text[:300].lower():
+    if "foco em" not in first_lines and "com foco" not in first_lines:
         errors.append("Falta menção à estratégia/foco da gestora")
     
-    if "aum" not in memo_text[:400].lower() and "bilh" not in memo_text[:400].lower():
+    if "aum" not in text_lower and "bilh" not in text_lower:
         errors.append("Falta menção ao AUM")
     
     return {
@@ -22,6 +22,7 @@ USO:
 
 from .orchestrator import (
     generate_full_memo,
+    generate_full_memo_batched,
     FIXED_STRUCTURE,
 )
 
@@ -116,6 +117,7 @@ def generate_section(
 __all__ = [
     # Generators principais
     "generate_full_memo",
+    "generate_full_memo_batched",
     "FIXED_STRUCTURE",
     
     # Validação
@@ -4,10 +4,9 @@ Agente de Fundo Atual - Short Memo Primário (Gestora)
 Responsável por gerar a seção "Fundo que Estamos Investindo".
 """
 
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, List, Optional
 from langchain_core.messages import SystemMessage, HumanMessage
-import os
+from model_config import get_openai_llm
 from ..facts_builder import build_facts_section
 from ..facts_utils import get_currency_safe, get_name_safe, get_numeric_safe
 from ..utils import get_currency_symbol, get_currency_label
@@ -28,6 +27,12 @@ class FundoAtualAgent:
         """Injeta LLM compartilhado (usado pelo LangGraph orchestrator)"""
         self.llm = llm
     
+    def _get_llm(self):
+        """LLM injetado se disponível, senão o cliente compartilhado (compatibilidade)"""
+        if not self.llm:
+            self.llm = get_openai_llm(self.model, self.temperature)
+        return self.llm
+    
     def generate(
         self,
         facts: Dict[str, Any],
@@ -43,15 +48,27 @@ class FundoAtualAgent:
         Returns:
             Texto da seção (2-3 parágrafos)
         """
-        # Usar LLM injetado se disponível, senão criar novo (compatibilidade)
-        if not self.llm:
-            apikey = os.getenv("OPENAI_API_KEY")
-            if not apikey:
-                raise ValueError("OPENAI_API_KEY não encontrada no ambiente")
-            self.llm = ChatOpenAI(model=self.model, api_key=apikey, temperature=self.temperature)
+        llm = self._get_llm()
+        messages = self.build_messages(facts, rag_context)
         
-        llm = self.llm
-
+        response = llm.invoke(messages)
+        return fix_number_formatting(response.content.strip())
+    
+    def build_messages(
+        self,
+        facts: Dict[str, Any],
+        rag_context: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Monta as mensagens (system + user) da seção sem chamar o LLM.
+        
+        Args:
+            facts: Dict com facts estruturados
+            rag_context: Contexto opcional
+        
+        Returns:
+            Lista [SystemMessage, HumanMessage]
+        """
         # ===== QUERY DOS FACTS (COBERTURA COMPLETA) =====
         # Obtém moeda do fundo (sempre usa fallback "BRL" se desabilitado)
         currency = get_currency_safe(facts, section="fundo", field="fundo_moeda")
@@ -180,10 +197,7 @@ Comece AGORA com o primeiro parágrafo (tamanho alvo e estratégia de alocação
         # Enriquecer prompts com exemplos dos templates
         system_prompt = enrich_prompt("fundo_atual", system_prompt)
 
-        messages = [
+        return [
             SystemMessage(content=system_prompt),
             HumanMessage(content=user_prompt)
         ]
-
-        response = llm.invoke(messages)
-        return fix_number_formatting(response.content.strip())
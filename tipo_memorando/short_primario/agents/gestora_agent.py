@@ -4,10 +4,9 @@ Agente de Gestora - Short Memo Primário (Gestora)
 Responsável por gerar a seção "Gestora, time e forma de atuação".
 """
 
-from typing import Dict, Any, Optional
-from langchain_openai import ChatOpenAI
+from typing import Dict, Any, List, Optional
 from langchain_core.messages import SystemMessage, HumanMessage
-import os
+from model_config import get_openai_llm
 from ..facts_builder import build_facts_section
 from ..facts_utils import get_name_safe
 from ..validator import fix_number_formatting
@@ -27,6 +26,12 @@ class GestoraAgent:
         """Injeta LLM compartilhado (usado pelo LangGraph orchestrator)"""
         self.llm = llm
     
+    def _get_llm(self):
+        """LLM injetado se disponível, senão o cliente compartilhado (compatibilidade)"""
+        if not self.llm:
+            self.llm = get_openai_llm(self.model, self.temperature)
+        return self.llm
+    
     def generate(
         self,
         facts: Dict[str, Any],
@@ -42,15 +47,27 @@ class GestoraAgent:
         Returns:
             Texto da seção (3-4 parágrafos)
         """
-        # Usar LLM injetado se disponível, senão criar novo (compatibilidade)
-        if not self.llm:
-            apikey = os.getenv("OPENAI_API_KEY")
-            if not apikey:
-                raise ValueError("OPENAI_API_KEY não encontrada no ambiente")
-            self.llm = ChatOpenAI(model=self.model, api_key=apikey, temperature=self.temperature)
+        llm = self._get_llm()
+        messages = self.build_messages(facts, rag_context)
         
-        llm = self.llm
-
+        response = llm.invoke(messages)
+        return fix_number_formatting(response.content.strip())
+    
+    def build_messages(
+        self,
+        facts: Dict[str, Any],
+        rag_context: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Monta as mensagens (system + user) da seção sem chamar o LLM.
+        
+        Args:
+            facts: Dict com facts estruturados
+            rag_context: Contexto opcional
+        
+        Returns:
+            Lista [SystemMessage, HumanMessage]
+        """
         # ===== QUERY DOS FACTS (COBERTURA COMPLETA) =====
         gestora_section = build_facts_section(
             facts, "gestora",
@@ -170,10 +187,7 @@ Comece AGORA com o primeiro parágrafo (posicionamento de mercado):"""
         # Enriquecer prompts com exemplos dos templates
         system_prompt = enrich_prompt("gestora", system_prompt)
 
-        messages = [
+        return [
             SystemMessage(content=system_prompt),
             HumanMessage(content=user_prompt)
         ]
-
-        response = llm.invoke(messages)
-        return fix_number_formatting(response.content.strip())
@@ -8,6 +8,7 @@ ARQUITETURA:
 - Query de facts nos prompts para contextualização
 - RAG inteligente por seção usando ChromaDB (busca semântica)
 - LangGraph para orquestração com retry automático e validação
+- Alternativa em uma única chamada ao LLM para as 4 seções (generate_full_memo_batched)
 
 SEÇÕES FIXAS:
 1. Resumo da oportunidade → IntroAgent
@@ -18,13 +19,24 @@ SEÇÕES FIXAS:
 VERSÃO 3.0 - LangGraph para orquestração complexa
 """
 
+import re
 from typing import Dict, Any, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from core.document_processor import DocumentProcessor
 
+from langchain_core.messages import SystemMessage, HumanMessage
+
+from core.llm_cache import invoke_cached
+from core.logger import get_logger
+from model_config import get_llm_for_agents
+
 from .agents import IntroAgent, GestoraAgent, PortfolioAgent, FundoAtualAgent
+from .._base.rag_prefetch import fetch_section_rag_contexts
 from .langgraph_orchestrator import PrimaryLangGraphOrchestrator
+from .validator import fix_number_formatting
+
+logger = get_logger(__name__)
 
 
 # Estrutura FIXA (não pode ser alterada)
@@ -97,3 +109,122 @@ def generate_full_memo(
         processor=processor,
         rag_context=rag_context
     )
+
+
+# ============================================================================
+# GERAÇÃO EM UMA ÚNICA CHAMADA AO LLM
+# ============================================================================
+
+# Marcador de cada seção no prompt e na resposta em lote
+_BATCH_SECTION_KEYS = {
+    "Resumo da oportunidade": "intro",
+    "Gestora, time e forma de atuação": "gestora",
+    "Portfolio Atual": "portfolio",
+    "Fundo que Estamos Investindo": "fundo_atual",
+}
+_BATCH_MARKER = "=== SECTION: {} ==="
+_RE_BATCH_MARKER = re.compile(r"^[ \t]*=== SECTION: (\w+) ===[ \t]*$", re.MULTILINE)
+
+# Mesmo mínimo da validação do LangGraph orchestrator
+_BATCH_MIN_SECTION_CHARS = 100
+
+_BATCH_SYSTEM_PROMPT = f"""Você é um analista sênior de Private Equity com 15 anos de experiência escrevendo as seções de um Short Memo de investimento primário em fundo para o comitê de investimento da Spectra Capital.
+
+Você receberá {len(_BATCH_SECTION_KEYS)} tarefas, uma por seção. Cada tarefa traz as próprias INSTRUÇÕES e os próprios DADOS: escreva cada seção seguindo apenas as instruções e os dados da sua tarefa.
+
+FORMATO DA RESPOSTA:
+- Todas as seções, na ordem recebida
+- Cada seção precedida, em linha própria, do seu marcador exatamente como recebido (ex: "{_BATCH_MARKER.format("intro")}")
+- Nenhum texto fora das seções"""
+
+
+def _split_batched_response(content: str) -> Dict[str, str]:
+    """
+    Separa a resposta em lote pelos marcadores de seção.
+    
+    Returns:
+        Dict {chave da seção: texto}; seções sem marcador ficam de fora
+    """
+    parts = _RE_BATCH_MARKER.split(content)
+    # parts = [texto antes do 1º marcador, chave1, texto1, chave2, texto2, ...]
+    return {key: text.strip() for key, text in zip(parts[1::2], parts[2::2])}
+
+
+def generate_full_memo_batched(
+    facts: Dict[str, Any],
+    rag_context: Optional[str] = None,
+    memo_id: Optional[str] = None,
+    processor: Optional["DocumentProcessor"] = None,
+    model: str = "gpt-4o",
+    temperature: float = 0.25
+) -> Dict[str, list]:
+    """
+    Gera as 4 seções do Short Memo Primário em uma única chamada ao LLM.
+    
+    Alternativa a generate_full_memo: um só round-trip e um só prefill, em vez
+    de uma chamada por seção. As mensagens de cada agente (build_messages)
+    viram uma tarefa delimitada por marcador; a resposta é separada pelos
+    marcadores. Seções ausentes ou curtas demais na resposta são geradas
+    individualmente pelo agente (mesma chamada de generate_full_memo).
+    
+    Args:
+        facts: Facts extraídos (todas as seções)
+        rag_context: Contexto do documento para todas as seções (usado se não
+            houver memo_id/processor)
+        memo_id: ID do memo no ChromaDB para busca RAG por seção
+        processor: Instância de DocumentProcessor para busca no ChromaDB
+        model: Modelo do LLM
+        temperature: Criatividade
+    
+    Returns:
+        Dict com estrutura: {section_title: [paragraph1, paragraph2, ...]}
+    """
+    llm = get_llm_for_agents(model, temperature)
+    
+    rag_contexts = {}
+    if memo_id and processor:
+        rag_contexts = fetch_section_rag_contexts(
+            processor, memo_id, list(FIXED_STRUCTURE), SECTION_QUERIES
+        )
+    
+    section_rag = {
+        title: rag_contexts.get(title) if rag_contexts else rag_context
+        for title in FIXED_STRUCTURE
+    }
+    
+    tasks = []
+    for section_title, agent in FIXED_STRUCTURE.items():
+        system_message, user_message = agent.build_messages(facts, section_rag[section_title])
+        tasks.append(
+            f"{_BATCH_MARKER.format(_BATCH_SECTION_KEYS[section_title])}\n"
+            f"[INSTRUÇÕES]\n{system_message.content}\n\n"
+            f"[DADOS]\n{user_message.content}"
+        )
+    messages = [
+        SystemMessage(content=_BATCH_SYSTEM_PROMPT),
+        HumanMessage(content="\n\n".join(tasks))
+    ]
+    
+    try:
+        sections = _split_batched_response(invoke_cached(llm, messages))
+    except Exception as e:
+        logger.error("Erro na geração em lote: %s", e)
+        sections = {}
+    
+    result = {}
+    for section_title, agent in FIXED_STRUCTURE.items():
+        text = sections.get(_BATCH_SECTION_KEYS[section_title], "")
+        if len(text) < _BATCH_MIN_SECTION_CHARS:
+            # Fallback: seção gerada isoladamente pelo agente
+            logger.warning("Seção '%s' ausente ou incompleta na resposta em lote; gerando individualmente", section_title)
+            try:
+                agent.set_llm(llm)
+                text = agent.generate(facts=facts, rag_context=section_rag[section_title])
+            except Exception as e:
+                logger.error("Erro ao gerar '%s': %s", section_title, e)
+                text = f"(Erro ao gerar seção: {e})"
+        else:
+            text = fix_number_formatting(text)
+        result[section_title] = [p.strip() for p in text.split("\n\n") if p.strip()]
+    
+    return result
@@ -10,6 +10,17 @@ import re
 from typing import Dict, Any
 
 
+# Padrões de fix_number_formatting (compilados uma única vez no import)
+_RE_BRL_MILHOES = re.compile(r'R\$\s*(\d+(?:[.,]\d+)?)\s*milh[õo]es?', re.IGNORECASE)
+_RE_USD_MILHOES = re.compile(r'US\$\s*(\d+(?:[.,]\d+)?)\s*milh[õo]es?', re.IGNORECASE)
+_RE_MXN_MILHOES = re.compile(r'MX\$\s*(\d+(?:[.,]\d+)?)\s*milh[õo]es?', re.IGNORECASE)
+_RE_MULTIPLE_DOT = re.compile(r'(\d+)\.(\d+)x')
+_RE_PCT_SPACE = re.compile(r'(\d+)\s*%')
+_RE_MOIC_DOT = re.compile(r'(\d+)\.(\d+)\s*MOIC', re.IGNORECASE)
+_RE_IRR_DOT = re.compile(r'(\d+)\.(\d+)%\s*(?:IRR|TIR)', re.IGNORECASE)
+_RE_TIR_DOT = re.compile(r'(\d+)\.(\d+)%\s*TIR', re.IGNORECASE)
+
+
 def validate_memo_consistency(
     memo_text: str,
     facts: Dict[str, Any],
@@ -107,28 +118,28 @@ def fix_number_formatting(text: str) -> str:
         Texto com formatação corrigida
     """
     # R$ XXX milhões → R$ XXXm
-    text = re.sub(r'R\$\s*(\d+(?:[.,]\d+)?)\s*milh[õo]es?', r'R$ \1m', text, flags=re.IGNORECASE)
+    text = _RE_BRL_MILHOES.sub(r'R$ \1m', text)
     
     # US$ XXX milhões → US$ XXXm
-    text = re.sub(r'US\$\s*(\d+(?:[.,]\d+)?)\s*milh[õo]es?', r'US$ \1m', text, flags=re.IGNORECASE)
+    text = _RE_USD_MILHOES.sub(r'US$ \1m', text)
     
     # MX$ XXX milhões → MX$ XXXm
-    text = re.sub(r'MX\$\s*(\d+(?:[.,]\d+)?)\s*milh[õo]es?', r'MX$ \1m', text, flags=re.IGNORECASE)
+    text = _RE_MXN_MILHOES.sub(r'MX$ \1m', text)
     
     # Múltiplos com ponto → vírgula (3.5x → 3,5x)
-    text = re.sub(r'(\d+)\.(\d+)x', r'\1,\2x', text)
+    text = _RE_MULTIPLE_DOT.sub(r'\1,\2x', text)
     
     # Espaço antes de % → sem espaço (38 % → 38%)
-    text = re.sub(r'(\d+)\s*%', r'\1%', text)
+    text = _RE_PCT_SPACE.sub(r'\1%', text)
     
     # MOIC: 2.5 → 2,5x MOIC
-    text = re.sub(r'(\d+)\.(\d+)\s*MOIC', r'\1,\2x MOIC', text, flags=re.IGNORECASE)
+    text = _RE_MOIC_DOT.sub(r'\1,\2x MOIC', text)
     
     # IRR: 38.5% → 38,5% IRR
-    text = re.sub(r'(\d+)\.(\d+)%\s*(?:IRR|TIR)', r'\1,\2% IRR', text, flags=re.IGNORECASE)
+    text = _RE_IRR_DOT.sub(r'\1,\2% IRR', text)
     
     # TIR: 38.5% → 38,5% TIR
-    text = re.sub(r'(\d+)\.(\d+)%\s*TIR', r'\1,\2% TIR', text, flags=re.IGNORECASE)
+    text = _RE_TIR_DOT.sub(r'\1,\2% TIR', text)
     
     return text
 
@@ -155,8 +166,8 @@ def check_section_length(
             "warning": str (se inválido)
         }
     """
-    paragraphs = [p.strip() for p in memo_text.split("\n\n") if p.strip()]
-    count = len(paragraphs)
+    # Só a contagem é usada: sem lista nem cópias via strip() (isspace() não aloca)
+    count = sum(1 for p in memo_text.split("\n\n") if p and not p.isspace())
     
     is_valid = min_paragraphs <= count <= max_paragraphs
     warning = ""
@@ -192,14 +203,17 @@ def validate_primario_intro(memo_text: str, facts: Dict[str, Any]) -> Dict[str,
     """
     errors = []
     
+    # Início do texto em minúsculas uma única vez para todas as palavras-chave
+    text_lower = memo_text[:400].lower()
+    
     # Padrão obrigatório para Primário
-    if "estamos avaliando" not in memo_text[:200].lower():
+    if "estamos avaliando" not in text_lower[:200]:
         errors.append("Primeira frase deve começar com 'Estamos avaliando a {company_name}'")
     
-    if "arr" not in memo_text[:400].lower() and "receita" not in memo_text[:400].lower():
+    if "arr" not in text_lower and "receita" not in text_lower:
         errors.append("Falta menção a ARR ou receita")
     
-    if "crescimento" not in memo_text[:400].lower() and "yoy" not in memo_text[:400].lower():
+    if "crescimento" not in text_lower and "yoy" not in text_lower:
         errors.append("Falta menção ao crescimento/YoY")
     
     return {
@@ -104,8 +104,8 @@ def check_section_length(
     max_paragraphs: int = 5
 ) -> Dict[str, Any]:
     """Valida se a seção tem número adequado de parágrafos."""
-    paragraphs = [p.strip() for p in memo_text.split("\n\n") if p.strip()]
-    count = len(paragraphs)
+    # Só a contagem é usada: sem lista nem cópias via strip() (isspace() não aloca)
+    count = sum(1 for p in memo_text.split("\n\n") if p and not p.isspace())
     is_valid = min_paragraphs <= count <= max_paragraphs
     warning = ""
     if count < min_paragraphs: